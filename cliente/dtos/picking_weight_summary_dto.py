@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PickingWeightSummaryDTO:
+    picking_id: int
+    package_count: int
+    gross_weight: float
+    tare_weight: float
+    net_weight: float
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from cliente.dtos.stock_quant_package_dto import StockQuantPackageDTO
+
+
+@dataclass(frozen=True)
+class StockQuantPackageBatchResultDTO:
+    index: int
+    item: StockQuantPackageDTO | None = None
+    error: str | None = None
@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from cliente.dtos.stock_package_type_dto import StockPackageTypeDTO
+from cliente.dtos.stock_picking_dto import StockPickingDTO
 
 
 @dataclass(frozen=True)
@@ -8,3 +10,5 @@ class StockQuantPackageDTO:
     package_type_id: int
     shipping_weight: float
     picking_id: int
+    package_type: StockPackageTypeDTO | None = None
+    picking: StockPickingDTO | None = None
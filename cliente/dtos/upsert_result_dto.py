@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class UpsertResultDTO(Generic[T]):
+    index: int
+    item: T | None = None
+    action: str | None = None
+    error: str | None = None
+
+    @property
+    def inserted(self) -> bool:
+        return self.action == "inserted"
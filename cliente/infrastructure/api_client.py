@@ -3,13 +3,43 @@ Path: cliente/infrastructure/api_client.py
 """
 
 import os
+import random
+import time
 import httpx
+from cliente.infrastructure.http_options import (
+    RETRY_ERRORS,
+    RETRY_STATUSES,
+    HttpOptions,
+    RoundTripStats,
+    backoff_delay,
+    http_options_from_env,
+    idempotency_headers,
+    should_retry,
+)
+from cliente.infrastructure.response_cache import ResponseCache
 from cliente.dtos.res_partner_dto import ResPartnerDTO
 from cliente.dtos.stock_picking_dto import StockPickingDTO
+from cliente.dtos.picking_weight_summary_dto import PickingWeightSummaryDTO
 from cliente.dtos.stock_package_type_dto import StockPackageTypeDTO
 from cliente.dtos.stock_quant_package_dto import StockQuantPackageDTO
+from cliente.dtos.stock_quant_package_batch_result_dto import StockQuantPackageBatchResultDTO
+from cliente.dtos.upsert_result_dto import UpsertResultDTO
+from cliente.dtos.page_dto import PageDTO
 
 HARD_CODED_NGROK_URL = "subdominio.ngrok-free.app" # Sólo para build local sin .env
+LOOKUP_MAX_IDS = 1000  # mismo tope que MAX_LOOKUP_IDS del servidor
+
+
+def _to_stock_quant_package(data: dict) -> StockQuantPackageDTO:
+    package_type = data.get("package_type")
+    picking = data.get("picking")
+    return StockQuantPackageDTO(
+        **{
+            **data,
+            "package_type": StockPackageTypeDTO(**package_type) if package_type else None,
+            "picking": StockPickingDTO(**picking) if picking else None,
+        }
+    )
 
 
 class ApiError(Exception):
@@ -19,8 +49,12 @@ class ApiError(Exception):
         self.detail = detail
 
 
-class ApiClient:
-    def __init__(self, base_url: str | None = None, timeout: float = 10.0) -> None:
+class _ApiResponses:
+    # Armado de URL base y parseo de respuestas: comun a ApiClient y AsyncApiClient.
+
+    def _configure(
+        self, base_url: str | None, timeout: float, options: HttpOptions | None, rng: random.Random | None
+    ) -> None:
         ngrok = os.getenv("NGROK_URL") or HARD_CODED_NGROK_URL
         port = os.getenv("API_PORT", "8000")
         if ngrok:
@@ -28,110 +62,74 @@ class ApiClient:
         else:
             default_base = f"http://localhost:{port}"
         self.base_url = base_url or default_base
-        self._client = httpx.Client(base_url=self.base_url, timeout=timeout)
-
-    def close(self) -> None:
-        self._client.close()
-
-    def create_res_partner(self, payload: dict) -> ResPartnerDTO:
-        r = self._request("post", "/api/v1/res-partners", json=payload)
-        return self._handle_res_partner(r)
-
-    def update_res_partner(self, partner_id: int, payload: dict) -> ResPartnerDTO:
-        r = self._request("put", f"/api/v1/res-partners/{partner_id}", json=payload)
-        return self._handle_res_partner(r)
-
-    def delete_res_partner(self, partner_id: int) -> None:
-        r = self._request("delete", f"/api/v1/res-partners/{partner_id}")
-        if r.status_code != 204:
-            self._raise(r)
-
-    def get_res_partner(self, partner_id: int) -> ResPartnerDTO:
-        r = self._request("get", f"/api/v1/res-partners/{partner_id}")
-        return self._handle_res_partner(r)
-
-    def list_res_partners(self, limit: int = 10, offset: int = 0) -> list[ResPartnerDTO]:
-        r = self._request("get", "/api/v1/res-partners", params={"limit": limit, "offset": offset})
+        self.options = options or http_options_from_env(timeout)
+        self.rtt = RoundTripStats()
+        self._rng = rng or random.Random()
+
+    @staticmethod
+    def _page_params(limit: int, offset: int, cursor: str | None, extra_params: dict | None) -> dict:
+        params = {"limit": limit, "offset": offset}
+        if cursor:
+            params["cursor"] = cursor
+        if extra_params:
+            params.update(extra_params)
+        return params
+
+    def _handle_page(self, r: httpx.Response, parse) -> PageDTO:
         if r.status_code != 200:
             self._raise(r)
-        return [ResPartnerDTO(**item) for item in r.json()["items"]]
-
-    def create_stock_picking(self, payload: dict) -> StockPickingDTO:
-        r = self._request("post", "/api/v1/stock-pickings", json=payload)
-        return self._handle_stock_picking(r)
-
-    def update_stock_picking(self, picking_id: int, payload: dict) -> StockPickingDTO:
-        r = self._request("put", f"/api/v1/stock-pickings/{picking_id}", json=payload)
-        return self._handle_stock_picking(r)
-
-    def delete_stock_picking(self, picking_id: int) -> None:
-        r = self._request("delete", f"/api/v1/stock-pickings/{picking_id}")
-        if r.status_code != 204:
-            self._raise(r)
-
-    def get_stock_picking(self, picking_id: int) -> StockPickingDTO:
-        r = self._request("get", f"/api/v1/stock-pickings/{picking_id}")
-        return self._handle_stock_picking(r)
-
-    def list_stock_pickings(self, limit: int = 10, offset: int = 0) -> list[StockPickingDTO]:
-        r = self._request("get", "/api/v1/stock-pickings", params={"limit": limit, "offset": offset})
+        data = r.json()
+        return PageDTO(
+            items=[parse(item) for item in data["items"]],
+            next_cursor=data.get("next_cursor"),
+            prev_cursor=data.get("prev_cursor"),
+        )
+
+    def _handle_lookup(self, r: httpx.Response, parse) -> list:
         if r.status_code != 200:
             self._raise(r)
-        return [StockPickingDTO(**item) for item in r.json()["items"]]
+        return [parse(result["item"]) if result["found"] else None for result in r.json()["items"]]
 
-    def create_stock_package_type(self, payload: dict) -> StockPackageTypeDTO:
-        r = self._request("post", "/api/v1/stock-package-types", json=payload)
-        return self._handle_stock_package_type(r)
-
-    def update_stock_package_type(self, package_type_id: int, payload: dict) -> StockPackageTypeDTO:
-        r = self._request("put", f"/api/v1/stock-package-types/{package_type_id}", json=payload)
-        return self._handle_stock_package_type(r)
-
-    def delete_stock_package_type(self, package_type_id: int) -> None:
-        r = self._request("delete", f"/api/v1/stock-package-types/{package_type_id}")
+    def _handle_deleted(self, r: httpx.Response) -> None:
         if r.status_code != 204:
             self._raise(r)
 
-    def get_stock_package_type(self, package_type_id: int) -> StockPackageTypeDTO:
-        r = self._request("get", f"/api/v1/stock-package-types/{package_type_id}")
-        return self._handle_stock_package_type(r)
-
-    def list_stock_package_types(self, limit: int = 10, offset: int = 0) -> list[StockPackageTypeDTO]:
-        r = self._request("get", "/api/v1/stock-package-types", params={"limit": limit, "offset": offset})
+    def _handle_summary(self, r: httpx.Response) -> PickingWeightSummaryDTO:
         if r.status_code != 200:
             self._raise(r)
-        return [StockPackageTypeDTO(**item) for item in r.json()["items"]]
-
-    def create_stock_quant_package(self, payload: dict) -> StockQuantPackageDTO:
-        r = self._request("post", "/api/v1/stock-quant-packages", json=payload)
-        return self._handle_stock_quant_package(r)
+        return PickingWeightSummaryDTO(**r.json())
 
-    def update_stock_quant_package(self, package_id: int, payload: dict) -> StockQuantPackageDTO:
-        r = self._request("put", f"/api/v1/stock-quant-packages/{package_id}", json=payload)
-        return self._handle_stock_quant_package(r)
-
-    def delete_stock_quant_package(self, package_id: int) -> None:
-        r = self._request("delete", f"/api/v1/stock-quant-packages/{package_id}")
-        if r.status_code != 204:
+    def _handle_upsert(self, r: httpx.Response, parse) -> list[UpsertResultDTO]:
+        if r.status_code != 200:
             self._raise(r)
-
-    def get_stock_quant_package(self, package_id: int) -> StockQuantPackageDTO:
-        r = self._request("get", f"/api/v1/stock-quant-packages/{package_id}")
-        return self._handle_stock_quant_package(r)
-
-    def list_stock_quant_packages(self, limit: int = 10, offset: int = 0) -> list[StockQuantPackageDTO]:
-        r = self._request("get", "/api/v1/stock-quant-packages", params={"limit": limit, "offset": offset})
+        return [
+            UpsertResultDTO(
+                index=result["index"],
+                item=parse(result["item"]) if result["item"] else None,
+                action=result["action"],
+                error=result["error"],
+            )
+            for result in r.json()["items"]
+        ]
+
+    def _handle_batch(self, r: httpx.Response) -> list[StockQuantPackageBatchResultDTO]:
         if r.status_code != 200:
             self._raise(r)
-        return [StockQuantPackageDTO(**item) for item in r.json()["items"]]
-
-    def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
-        try:
-            return self._client.request(method, url, **kwargs)
-        except httpx.ConnectError as exc:
-            raise ApiError(0, f"No se pudo conectar a la API ({self.base_url})") from exc
-        except httpx.RequestError as exc:
-            raise ApiError(0, "Error de red al conectar con la API") from exc
+        return [
+            StockQuantPackageBatchResultDTO(
+                index=result["index"],
+                item=_to_stock_quant_package(result["item"]) if result["item"] else None,
+                error=result["error"],
+            )
+            for result in r.json()["items"]
+        ]
+
+    def _network_error(self, exc: httpx.RequestError) -> ApiError:
+        if isinstance(exc, httpx.ConnectError):
+            return ApiError(0, f"No se pudo conectar a la API ({self.base_url})")
+        if isinstance(exc, httpx.TimeoutException):
+            return ApiError(0, "La API no respondio a tiempo")
+        return ApiError(0, "Error de red al conectar con la API")
 
     def _handle_res_partner(self, r: httpx.Response) -> ResPartnerDTO:
         if r.status_code not in (200, 201):
@@ -151,7 +149,7 @@ class ApiClient:
     def _handle_stock_quant_package(self, r: httpx.Response) -> StockQuantPackageDTO:
         if r.status_code not in (200, 201):
             self._raise(r)
-        return StockQuantPackageDTO(**r.json())
+        return _to_stock_quant_package(r.json())
 
     def _raise(self, r: httpx.Response) -> None:
         content_type = r.headers.get("content-type", "")
@@ -168,3 +166,338 @@ class ApiClient:
         except (ValueError, AttributeError):
             detail = r.text
         raise ApiError(r.status_code, detail)
+
+
+class ApiClient(_ApiResponses):
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float = 10.0,
+        options: HttpOptions | None = None,
+        transport: httpx.BaseTransport | None = None,
+        sleep=time.sleep,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._configure(base_url, timeout, options, rng)
+        self._sleep = sleep
+        self.cache = (
+            ResponseCache(self.options.cache_size, self.options.cache_ttl) if self.options.cache_size > 0 else None
+        )
+        self._client = httpx.Client(base_url=self.base_url, transport=transport, **self.options.client_kwargs())
+
+    def close(self) -> None:
+        self._client.close()
+
+    def cache_stats(self) -> dict | None:
+        return self.cache.stats() if self.cache is not None else None
+
+    def create_res_partner(self, payload: dict, timeout: float | None = None) -> ResPartnerDTO:
+        r = self._request("post", "/api/v1/res-partners", json=payload, timeout=timeout)
+        self._invalidate("res-partners")
+        return self._handle_res_partner(r)
+
+    def update_res_partner(self, partner_id: int, payload: dict, timeout: float | None = None) -> ResPartnerDTO:
+        r = self._request("put", f"/api/v1/res-partners/{partner_id}", json=payload, timeout=timeout)
+        self._invalidate("res-partners", partner_id)
+        return self._handle_res_partner(r)
+
+    def delete_res_partner(self, partner_id: int, timeout: float | None = None) -> None:
+        r = self._request("delete", f"/api/v1/res-partners/{partner_id}", timeout=timeout)
+        self._invalidate("res-partners", partner_id)
+        self._handle_deleted(r)
+
+    def get_res_partner(self, partner_id: int, timeout: float | None = None) -> ResPartnerDTO:
+        return self._get_entity("res-partners", partner_id, self._handle_res_partner, timeout)
+
+    def list_res_partners(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ResPartnerDTO]:
+        return self.list_res_partners_page(
+            limit=limit, offset=offset, cursor=cursor, timeout=timeout
+        ).items
+
+    def list_res_partners_page(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> PageDTO[ResPartnerDTO]:
+        return self._list_page(
+            "/api/v1/res-partners", lambda item: ResPartnerDTO(**item), limit, offset, cursor, timeout=timeout
+        )
+
+    def lookup_res_partners(
+        self, partner_ids: list[int], timeout: float | None = None
+    ) -> list[ResPartnerDTO | None]:
+        return self._lookup(
+            "/api/v1/res-partners:lookup", lambda item: ResPartnerDTO(**item), partner_ids, timeout
+        )
+
+    def create_stock_picking(self, payload: dict, timeout: float | None = None) -> StockPickingDTO:
+        r = self._request("post", "/api/v1/stock-pickings", json=payload, timeout=timeout)
+        self._invalidate("stock-pickings")
+        return self._handle_stock_picking(r)
+
+    def update_stock_picking(self, picking_id: int, payload: dict, timeout: float | None = None) -> StockPickingDTO:
+        r = self._request("put", f"/api/v1/stock-pickings/{picking_id}", json=payload, timeout=timeout)
+        self._invalidate("stock-pickings", picking_id)
+        return self._handle_stock_picking(r)
+
+    def delete_stock_picking(self, picking_id: int, timeout: float | None = None) -> None:
+        r = self._request("delete", f"/api/v1/stock-pickings/{picking_id}", timeout=timeout)
+        self._invalidate("stock-pickings", picking_id)
+        self._handle_deleted(r)
+
+    def get_stock_picking(self, picking_id: int, timeout: float | None = None) -> StockPickingDTO:
+        return self._get_entity("stock-pickings", picking_id, self._handle_stock_picking, timeout)
+
+    def get_stock_picking_summary(
+        self, picking_id: int, timeout: float | None = None
+    ) -> PickingWeightSummaryDTO:
+        r = self._request("get", f"/api/v1/stock-pickings/{picking_id}/summary", timeout=timeout)
+        return self._handle_summary(r)
+
+    def list_stock_pickings(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> list[StockPickingDTO]:
+        return self.list_stock_pickings_page(
+            limit=limit, offset=offset, cursor=cursor, timeout=timeout
+        ).items
+
+    def list_stock_pickings_page(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> PageDTO[StockPickingDTO]:
+        return self._list_page(
+            "/api/v1/stock-pickings", lambda item: StockPickingDTO(**item), limit, offset, cursor, timeout=timeout
+        )
+
+    def lookup_stock_pickings(
+        self, picking_ids: list[int], timeout: float | None = None
+    ) -> list[StockPickingDTO | None]:
+        return self._lookup(
+            "/api/v1/stock-pickings:lookup", lambda item: StockPickingDTO(**item), picking_ids, timeout
+        )
+
+    def upsert_stock_pickings(
+        self, payloads: list[dict], timeout: float | None = None
+    ) -> list[UpsertResultDTO[StockPickingDTO]]:
+        r = self._request(
+            "post", "/api/v1/stock-pickings:upsert", json=payloads, timeout=timeout, idempotent=True
+        )
+        self._invalidate("stock-pickings")
+        return self._handle_upsert(r, lambda item: StockPickingDTO(**item))
+
+    def create_stock_package_type(self, payload: dict, timeout: float | None = None) -> StockPackageTypeDTO:
+        r = self._request("post", "/api/v1/stock-package-types", json=payload, timeout=timeout)
+        self._invalidate("stock-package-types")
+        return self._handle_stock_package_type(r)
+
+    def update_stock_package_type(
+        self, package_type_id: int, payload: dict, timeout: float | None = None
+    ) -> StockPackageTypeDTO:
+        r = self._request(
+            "put", f"/api/v1/stock-package-types/{package_type_id}", json=payload, timeout=timeout
+        )
+        self._invalidate("stock-package-types", package_type_id)
+        return self._handle_stock_package_type(r)
+
+    def delete_stock_package_type(self, package_type_id: int, timeout: float | None = None) -> None:
+        r = self._request("delete", f"/api/v1/stock-package-types/{package_type_id}", timeout=timeout)
+        self._invalidate("stock-package-types", package_type_id)
+        self._handle_deleted(r)
+
+    def get_stock_package_type(self, package_type_id: int, timeout: float | None = None) -> StockPackageTypeDTO:
+        return self._get_entity("stock-package-types", package_type_id, self._handle_stock_package_type, timeout)
+
+    def list_stock_package_types(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> list[StockPackageTypeDTO]:
+        return self.list_stock_package_types_page(
+            limit=limit, offset=offset, cursor=cursor, timeout=timeout
+        ).items
+
+    def list_stock_package_types_page(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> PageDTO[StockPackageTypeDTO]:
+        return self._list_page(
+            "/api/v1/stock-package-types",
+            lambda item: StockPackageTypeDTO(**item),
+            limit,
+            offset,
+            cursor,
+            timeout=timeout,
+        )
+
+    def lookup_stock_package_types(
+        self, package_type_ids: list[int], timeout: float | None = None
+    ) -> list[StockPackageTypeDTO | None]:
+        return self._lookup(
+            "/api/v1/stock-package-types:lookup", lambda item: StockPackageTypeDTO(**item), package_type_ids, timeout
+        )
+
+    def create_stock_quant_package(self, payload: dict, timeout: float | None = None) -> StockQuantPackageDTO:
+        r = self._request("post", "/api/v1/stock-quant-packages", json=payload, timeout=timeout)
+        self._invalidate("stock-quant-packages")
+        return self._handle_stock_quant_package(r)
+
+    def create_stock_quant_packages(
+        self, payloads: list[dict], timeout: float | None = None
+    ) -> list[StockQuantPackageBatchResultDTO]:
+        r = self._request("post", "/api/v1/stock-quant-packages:batch", json=payloads, timeout=timeout)
+        self._invalidate("stock-quant-packages")
+        return self._handle_batch(r)
+
+    def upsert_stock_quant_packages(
+        self, payloads: list[dict], timeout: float | None = None
+    ) -> list[UpsertResultDTO[StockQuantPackageDTO]]:
+        r = self._request(
+            "post", "/api/v1/stock-quant-packages:upsert", json=payloads, timeout=timeout, idempotent=True
+        )
+        self._invalidate("stock-quant-packages")
+        return self._handle_upsert(r, _to_stock_quant_package)
+
+    def update_stock_quant_package(
+        self, package_id: int, payload: dict, timeout: float | None = None
+    ) -> StockQuantPackageDTO:
+        r = self._request("put", f"/api/v1/stock-quant-packages/{package_id}", json=payload, timeout=timeout)
+        self._invalidate("stock-quant-packages", package_id)
+        return self._handle_stock_quant_package(r)
+
+    def delete_stock_quant_package(self, package_id: int, timeout: float | None = None) -> None:
+        r = self._request("delete", f"/api/v1/stock-quant-packages/{package_id}", timeout=timeout)
+        self._invalidate("stock-quant-packages", package_id)
+        self._handle_deleted(r)
+
+    def get_stock_quant_package(self, package_id: int, timeout: float | None = None) -> StockQuantPackageDTO:
+        return self._get_entity("stock-quant-packages", package_id, self._handle_stock_quant_package, timeout)
+
+    def list_stock_quant_packages(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        expand: tuple[str, ...] = (),
+        timeout: float | None = None,
+    ) -> list[StockQuantPackageDTO]:
+        return self.list_stock_quant_packages_page(
+            limit=limit, offset=offset, cursor=cursor, expand=expand, timeout=timeout
+        ).items
+
+    def list_stock_quant_packages_page(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        expand: tuple[str, ...] = (),
+        timeout: float | None = None,
+    ) -> PageDTO[StockQuantPackageDTO]:
+        return self._list_page(
+            "/api/v1/stock-quant-packages",
+            _to_stock_quant_package,
+            limit,
+            offset,
+            cursor,
+            extra_params={"expand": ",".join(expand)} if expand else None,
+            timeout=timeout,
+        )
+
+    def lookup_stock_quant_packages(
+        self, package_ids: list[int], timeout: float | None = None
+    ) -> list[StockQuantPackageDTO | None]:
+        return self._lookup(
+            "/api/v1/stock-quant-packages:lookup", _to_stock_quant_package, package_ids, timeout
+        )
+
+    def _lookup(self, url: str, parse, ids: list[int], timeout: float | None) -> list:
+        results: list = []
+        for start in range(0, len(ids), LOOKUP_MAX_IDS):
+            chunk = ids[start : start + LOOKUP_MAX_IDS]
+            r = self._request("post", url, json={"ids": chunk}, timeout=timeout, idempotent=True)
+            results.extend(self._handle_lookup(r, parse))
+        return results
+
+    def _list_page(
+        self,
+        url: str,
+        parse,
+        limit: int,
+        offset: int,
+        cursor: str | None,
+        extra_params: dict | None = None,
+        timeout: float | None = None,
+    ) -> PageDTO:
+        params = self._page_params(limit, offset, cursor, extra_params)
+        key = (url.rsplit("/", 1)[1], "list", *sorted(params.items()))
+        return self._get(key, url, lambda r: self._handle_page(r, parse), timeout, params=params)
+
+    def _get_entity(self, resource: str, entity_id: int, handle, timeout: float | None):
+        return self._get((resource, "get", entity_id), f"/api/v1/{resource}/{entity_id}", handle, timeout)
+
+    def _get(self, key: tuple, url: str, handle, timeout: float | None, params: dict | None = None):
+        if self.cache is None:
+            return handle(self._request("get", url, params=params, timeout=timeout))
+        entry = self.cache.lookup(key)
+        if entry is not None and entry.fresh:
+            return entry.value
+        headers = {"If-None-Match": entry.etag} if entry is not None and entry.etag else None
+        r = self._request("get", url, params=params, headers=headers, timeout=timeout)
+        if r.status_code == 304 and entry is not None:
+            self.cache.revalidated(key, entry)
+            return entry.value
+        try:
+            value = handle(r)
+        except ApiError:
+            self.cache.invalidate(key)
+            raise
+        self.cache.store(key, value, r.headers.get("etag"))
+        return value
+
+    def _invalidate(self, resource: str, entity_id: int | None = None) -> None:
+        # Los listados de paquetes embeben tipo y picking, y borrar un padre puede
+        # arrastrar hijos: ante cualquier escritura se descartan todos los listados.
+        if self.cache is not None:
+            self.cache.invalidate_where(lambda key: key[1] == "list" or key == (resource, "get", entity_id))
+
+    def _request(
+        self, method: str, url: str, timeout: float | None = None, idempotent: bool | None = None, **kwargs
+    ) -> httpx.Response:
+        if idempotent is None:
+            idempotent = idempotency_headers(method, self.options, kwargs)
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                r = self._client.request(method, url, timeout=self.options.httpx_timeout(timeout), **kwargs)
+            except RETRY_ERRORS as exc:
+                if not should_retry(method, attempt, self.options, idempotent):
+                    raise self._network_error(exc) from exc
+            except httpx.RequestError as exc:
+                raise self._network_error(exc) from exc
+            else:
+                self.rtt.record(time.perf_counter() - started)
+                retry = should_retry(method, attempt, self.options, idempotent)
+                if r.status_code not in RETRY_STATUSES or not retry:
+                    return r
+            self._sleep(backoff_delay(attempt, self.options, self._rng))
+            attempt += 1
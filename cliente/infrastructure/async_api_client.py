@@ -0,0 +1,382 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+import httpx
+from cliente.infrastructure.api_client import LOOKUP_MAX_IDS, ApiError, _ApiResponses, _to_stock_quant_package
+from cliente.infrastructure.http_options import (
+    RETRY_ERRORS,
+    RETRY_STATUSES,
+    HttpOptions,
+    backoff_delay,
+    idempotency_headers,
+    should_retry,
+)
+from cliente.dtos.res_partner_dto import ResPartnerDTO
+from cliente.dtos.stock_picking_dto import StockPickingDTO
+from cliente.dtos.picking_weight_summary_dto import PickingWeightSummaryDTO
+from cliente.dtos.stock_package_type_dto import StockPackageTypeDTO
+from cliente.dtos.stock_quant_package_dto import StockQuantPackageDTO
+from cliente.dtos.stock_quant_package_batch_result_dto import StockQuantPackageBatchResultDTO
+from cliente.dtos.upsert_result_dto import UpsertResultDTO
+from cliente.dtos.page_dto import PageDTO
+
+T = TypeVar("T")
+A = TypeVar("A")
+
+
+class AsyncApiClient(_ApiResponses):
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float = 10.0,
+        options: HttpOptions | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        sleep=asyncio.sleep,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._configure(base_url, timeout, options, rng)
+        self._sleep = sleep
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url, transport=transport, **self.options.client_kwargs()
+        )
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def create_res_partner(self, payload: dict, timeout: float | None = None) -> ResPartnerDTO:
+        r = await self._request("post", "/api/v1/res-partners", json=payload, timeout=timeout)
+        return self._handle_res_partner(r)
+
+    async def update_res_partner(self, partner_id: int, payload: dict, timeout: float | None = None) -> ResPartnerDTO:
+        r = await self._request("put", f"/api/v1/res-partners/{partner_id}", json=payload, timeout=timeout)
+        return self._handle_res_partner(r)
+
+    async def delete_res_partner(self, partner_id: int, timeout: float | None = None) -> None:
+        r = await self._request("delete", f"/api/v1/res-partners/{partner_id}", timeout=timeout)
+        self._handle_deleted(r)
+
+    async def get_res_partner(self, partner_id: int, timeout: float | None = None) -> ResPartnerDTO:
+        r = await self._request("get", f"/api/v1/res-partners/{partner_id}", timeout=timeout)
+        return self._handle_res_partner(r)
+
+    async def list_res_partners(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> list[ResPartnerDTO]:
+        page = await self.list_res_partners_page(limit=limit, offset=offset, cursor=cursor, timeout=timeout)
+        return page.items
+
+    async def list_res_partners_page(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> PageDTO[ResPartnerDTO]:
+        return await self._list_page(
+            "/api/v1/res-partners", lambda item: ResPartnerDTO(**item), limit, offset, cursor, timeout=timeout
+        )
+
+    async def lookup_res_partners(
+        self, partner_ids: list[int], timeout: float | None = None
+    ) -> list[ResPartnerDTO | None]:
+        return await self._lookup(
+            "/api/v1/res-partners:lookup", lambda item: ResPartnerDTO(**item), partner_ids, timeout
+        )
+
+    async def create_stock_picking(self, payload: dict, timeout: float | None = None) -> StockPickingDTO:
+        r = await self._request("post", "/api/v1/stock-pickings", json=payload, timeout=timeout)
+        return self._handle_stock_picking(r)
+
+    async def update_stock_picking(
+        self, picking_id: int, payload: dict, timeout: float | None = None
+    ) -> StockPickingDTO:
+        r = await self._request("put", f"/api/v1/stock-pickings/{picking_id}", json=payload, timeout=timeout)
+        return self._handle_stock_picking(r)
+
+    async def delete_stock_picking(self, picking_id: int, timeout: float | None = None) -> None:
+        r = await self._request("delete", f"/api/v1/stock-pickings/{picking_id}", timeout=timeout)
+        self._handle_deleted(r)
+
+    async def get_stock_picking(self, picking_id: int, timeout: float | None = None) -> StockPickingDTO:
+        r = await self._request("get", f"/api/v1/stock-pickings/{picking_id}", timeout=timeout)
+        return self._handle_stock_picking(r)
+
+    async def get_stock_picking_summary(
+        self, picking_id: int, timeout: float | None = None
+    ) -> PickingWeightSummaryDTO:
+        r = await self._request("get", f"/api/v1/stock-pickings/{picking_id}/summary", timeout=timeout)
+        return self._handle_summary(r)
+
+    async def list_stock_pickings(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> list[StockPickingDTO]:
+        page = await self.list_stock_pickings_page(limit=limit, offset=offset, cursor=cursor, timeout=timeout)
+        return page.items
+
+    async def list_stock_pickings_page(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> PageDTO[StockPickingDTO]:
+        return await self._list_page(
+            "/api/v1/stock-pickings", lambda item: StockPickingDTO(**item), limit, offset, cursor, timeout=timeout
+        )
+
+    async def lookup_stock_pickings(
+        self, picking_ids: list[int], timeout: float | None = None
+    ) -> list[StockPickingDTO | None]:
+        return await self._lookup(
+            "/api/v1/stock-pickings:lookup", lambda item: StockPickingDTO(**item), picking_ids, timeout
+        )
+
+    async def upsert_stock_pickings(
+        self, payloads: list[dict], timeout: float | None = None
+    ) -> list[UpsertResultDTO[StockPickingDTO]]:
+        r = await self._request(
+            "post", "/api/v1/stock-pickings:upsert", json=payloads, timeout=timeout, idempotent=True
+        )
+        return self._handle_upsert(r, lambda item: StockPickingDTO(**item))
+
+    async def create_stock_package_type(self, payload: dict, timeout: float | None = None) -> StockPackageTypeDTO:
+        r = await self._request("post", "/api/v1/stock-package-types", json=payload, timeout=timeout)
+        return self._handle_stock_package_type(r)
+
+    async def update_stock_package_type(
+        self, package_type_id: int, payload: dict, timeout: float | None = None
+    ) -> StockPackageTypeDTO:
+        r = await self._request(
+            "put", f"/api/v1/stock-package-types/{package_type_id}", json=payload, timeout=timeout
+        )
+        return self._handle_stock_package_type(r)
+
+    async def delete_stock_package_type(self, package_type_id: int, timeout: float | None = None) -> None:
+        r = await self._request("delete", f"/api/v1/stock-package-types/{package_type_id}", timeout=timeout)
+        self._handle_deleted(r)
+
+    async def get_stock_package_type(
+        self, package_type_id: int, timeout: float | None = None
+    ) -> StockPackageTypeDTO:
+        r = await self._request("get", f"/api/v1/stock-package-types/{package_type_id}", timeout=timeout)
+        return self._handle_stock_package_type(r)
+
+    async def list_stock_package_types(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> list[StockPackageTypeDTO]:
+        page = await self.list_stock_package_types_page(limit=limit, offset=offset, cursor=cursor, timeout=timeout)
+        return page.items
+
+    async def list_stock_package_types_page(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        timeout: float | None = None,
+    ) -> PageDTO[StockPackageTypeDTO]:
+        return await self._list_page(
+            "/api/v1/stock-package-types",
+            lambda item: StockPackageTypeDTO(**item),
+            limit,
+            offset,
+            cursor,
+            timeout=timeout,
+        )
+
+    async def lookup_stock_package_types(
+        self, package_type_ids: list[int], timeout: float | None = None
+    ) -> list[StockPackageTypeDTO | None]:
+        return await self._lookup(
+            "/api/v1/stock-package-types:lookup", lambda item: StockPackageTypeDTO(**item), package_type_ids, timeout
+        )
+
+    async def create_stock_quant_package(self, payload: dict, timeout: float | None = None) -> StockQuantPackageDTO:
+        r = await self._request("post", "/api/v1/stock-quant-packages", json=payload, timeout=timeout)
+        return self._handle_stock_quant_package(r)
+
+    async def create_stock_quant_packages(
+        self, payloads: list[dict], timeout: float | None = None
+    ) -> list[StockQuantPackageBatchResultDTO]:
+        r = await self._request("post", "/api/v1/stock-quant-packages:batch", json=payloads, timeout=timeout)
+        return self._handle_batch(r)
+
+    async def upsert_stock_quant_packages(
+        self, payloads: list[dict], timeout: float | None = None
+    ) -> list[UpsertResultDTO[StockQuantPackageDTO]]:
+        r = await self._request(
+            "post", "/api/v1/stock-quant-packages:upsert", json=payloads, timeout=timeout, idempotent=True
+        )
+        return self._handle_upsert(r, _to_stock_quant_package)
+
+    async def update_stock_quant_package(
+        self, package_id: int, payload: dict, timeout: float | None = None
+    ) -> StockQuantPackageDTO:
+        r = await self._request("put", f"/api/v1/stock-quant-packages/{package_id}", json=payload, timeout=timeout)
+        return self._handle_stock_quant_package(r)
+
+    async def delete_stock_quant_package(self, package_id: int, timeout: float | None = None) -> None:
+        r = await self._request("delete", f"/api/v1/stock-quant-packages/{package_id}", timeout=timeout)
+        self._handle_deleted(r)
+
+    async def get_stock_quant_package(self, package_id: int, timeout: float | None = None) -> StockQuantPackageDTO:
+        r = await self._request("get", f"/api/v1/stock-quant-packages/{package_id}", timeout=timeout)
+        return self._handle_stock_quant_package(r)
+
+    async def list_stock_quant_packages(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        expand: tuple[str, ...] = (),
+        timeout: float | None = None,
+    ) -> list[StockQuantPackageDTO]:
+        page = await self.list_stock_quant_packages_page(
+            limit=limit, offset=offset, cursor=cursor, expand=expand, timeout=timeout
+        )
+        return page.items
+
+    async def list_stock_quant_packages_page(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: str | None = None,
+        expand: tuple[str, ...] = (),
+        timeout: float | None = None,
+    ) -> PageDTO[StockQuantPackageDTO]:
+        return await self._list_page(
+            "/api/v1/stock-quant-packages",
+            _to_stock_quant_package,
+            limit,
+            offset,
+            cursor,
+            extra_params={"expand": ",".join(expand)} if expand else None,
+            timeout=timeout,
+        )
+
+    async def lookup_stock_quant_packages(
+        self, package_ids: list[int], timeout: float | None = None
+    ) -> list[StockQuantPackageDTO | None]:
+        return await self._lookup(
+            "/api/v1/stock-quant-packages:lookup", _to_stock_quant_package, package_ids, timeout
+        )
+
+    async def get_many_res_partners(
+        self, partner_ids: Iterable[int], concurrency: int | None = None
+    ) -> list[ResPartnerDTO | ApiError]:
+        return await self._fan_out(self.get_res_partner, partner_ids, concurrency)
+
+    async def create_many_res_partners(
+        self, payloads: Iterable[dict], concurrency: int | None = None
+    ) -> list[ResPartnerDTO | ApiError]:
+        return await self._fan_out(self.create_res_partner, payloads, concurrency)
+
+    async def get_many_stock_pickings(
+        self, picking_ids: Iterable[int], concurrency: int | None = None
+    ) -> list[StockPickingDTO | ApiError]:
+        return await self._fan_out(self.get_stock_picking, picking_ids, concurrency)
+
+    async def create_many_stock_pickings(
+        self, payloads: Iterable[dict], concurrency: int | None = None
+    ) -> list[StockPickingDTO | ApiError]:
+        return await self._fan_out(self.create_stock_picking, payloads, concurrency)
+
+    async def get_many_stock_package_types(
+        self, package_type_ids: Iterable[int], concurrency: int | None = None
+    ) -> list[StockPackageTypeDTO | ApiError]:
+        return await self._fan_out(self.get_stock_package_type, package_type_ids, concurrency)
+
+    async def create_many_stock_package_types(
+        self, payloads: Iterable[dict], concurrency: int | None = None
+    ) -> list[StockPackageTypeDTO | ApiError]:
+        return await self._fan_out(self.create_stock_package_type, payloads, concurrency)
+
+    async def get_many_stock_quant_packages(
+        self, package_ids: Iterable[int], concurrency: int | None = None
+    ) -> list[StockQuantPackageDTO | ApiError]:
+        return await self._fan_out(self.get_stock_quant_package, package_ids, concurrency)
+
+    async def create_many_stock_quant_packages(
+        self, payloads: Iterable[dict], concurrency: int | None = None
+    ) -> list[StockQuantPackageDTO | ApiError]:
+        return await self._fan_out(self.create_stock_quant_package, payloads, concurrency)
+
+    async def _fan_out(
+        self, call: Callable[[A], Awaitable[T]], args: Iterable[A], concurrency: int | None
+    ) -> list[T | ApiError]:
+        # Sin pasar el pool de conexiones: mas concurrencia solo encola en httpx.
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.options.max_connections))
+
+        async def one(arg: A) -> T | ApiError:
+            async with semaphore:
+                try:
+                    return await call(arg)
+                except ApiError as exc:
+                    return exc
+
+        return list(await asyncio.gather(*(one(arg) for arg in args)))
+
+    async def _lookup(self, url: str, parse, ids: list[int], timeout: float | None) -> list:
+        results: list = []
+        for start in range(0, len(ids), LOOKUP_MAX_IDS):
+            chunk = ids[start : start + LOOKUP_MAX_IDS]
+            r = await self._request("post", url, json={"ids": chunk}, timeout=timeout, idempotent=True)
+            results.extend(self._handle_lookup(r, parse))
+        return results
+
+    async def _list_page(
+        self,
+        url: str,
+        parse,
+        limit: int,
+        offset: int,
+        cursor: str | None,
+        extra_params: dict | None = None,
+        timeout: float | None = None,
+    ) -> PageDTO:
+        params = self._page_params(limit, offset, cursor, extra_params)
+        r = await self._request("get", url, params=params, timeout=timeout)
+        return self._handle_page(r, parse)
+
+    async def _request(
+        self, method: str, url: str, timeout: float | None = None, idempotent: bool | None = None, **kwargs
+    ) -> httpx.Response:
+        if idempotent is None:
+            idempotent = idempotency_headers(method, self.options, kwargs)
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                r = await self._client.request(method, url, timeout=self.options.httpx_timeout(timeout), **kwargs)
+            except RETRY_ERRORS as exc:
+                if not should_retry(method, attempt, self.options, idempotent):
+                    raise self._network_error(exc) from exc
+            except httpx.RequestError as exc:
+                raise self._network_error(exc) from exc
+            else:
+                self.rtt.record(time.perf_counter() - started)
+                retry = should_retry(method, attempt, self.options, idempotent)
+                if r.status_code not in RETRY_STATUSES or not retry:
+                    return r
+            await self._sleep(backoff_delay(attempt, self.options, self._rng))
+            attempt += 1
@@ -0,0 +1,125 @@
+import os
+import random
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # dependencia opcional (pip install httpx[http2])
+    h2 = None
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+RETRY_STATUSES = frozenset({502, 503, 504})
+# Errores donde la API pudo no haber recibido (o respondido) el request: solo se
+# reintentan en metodos idempotentes, repetir un POST podria duplicar el alta.
+RETRY_ERRORS = (httpx.ConnectError, httpx.TimeoutException, httpx.RemoteProtocolError, httpx.ReadError)
+
+
+@dataclass(frozen=True)
+class HttpOptions:
+    timeout: float = 10.0
+    connect_timeout: float = 5.0
+    http2: bool = True
+    max_connections: int = 10
+    max_keepalive: int = 5
+    keepalive_expiry: float = 30.0
+    retries: int = 2
+    backoff: float = 0.25
+    backoff_max: float = 4.0
+    cache_size: int = 256
+    cache_ttl: float = 5.0
+    # Solo activar contra un servidor con IDEMPOTENCY_STORE: uno anterior ignora la
+    # clave y reintentar un POST podria duplicar el alta.
+    idempotency_keys: bool = False
+
+    @property
+    def http2_enabled(self) -> bool:
+        return self.http2 and h2 is not None
+
+    def httpx_timeout(self, timeout: float | None = None) -> httpx.Timeout:
+        return httpx.Timeout(timeout if timeout is not None else self.timeout, connect=self.connect_timeout)
+
+    def httpx_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def client_kwargs(self) -> dict:
+        return {
+            "timeout": self.httpx_timeout(),
+            "limits": self.httpx_limits(),
+            "http2": self.http2_enabled,
+        }
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() not in ("", "0", "false", "off", "no")
+
+
+def http_options_from_env(timeout: float = 10.0) -> HttpOptions:
+    return HttpOptions(
+        timeout=float(os.getenv("CLIENT_TIMEOUT", str(timeout))),
+        connect_timeout=float(os.getenv("CLIENT_CONNECT_TIMEOUT", "5")),
+        http2=_env_flag("CLIENT_HTTP2", "1"),
+        max_connections=int(os.getenv("CLIENT_MAX_CONNECTIONS", "10")),
+        max_keepalive=int(os.getenv("CLIENT_MAX_KEEPALIVE", "5")),
+        keepalive_expiry=float(os.getenv("CLIENT_KEEPALIVE_EXPIRY", "30")),
+        retries=int(os.getenv("CLIENT_RETRIES", "2")),
+        backoff=float(os.getenv("CLIENT_RETRY_BACKOFF", "0.25")),
+        cache_size=int(os.getenv("CLIENT_CACHE_SIZE", "256")),
+        cache_ttl=float(os.getenv("CLIENT_CACHE_TTL", "5")),
+        idempotency_keys=_env_flag("CLIENT_IDEMPOTENCY_KEYS", "0"),
+    )
+
+
+def should_retry(method: str, attempt: int, options: HttpOptions, idempotent: bool | None = None) -> bool:
+    # idempotent permite marcar un POST que se puede repetir sin efectos extra (p.ej. :upsert).
+    if idempotent is None:
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+    return attempt < options.retries and idempotent
+
+
+def idempotency_headers(method: str, options: HttpOptions, kwargs: dict) -> bool | None:
+    # Una clave por llamada: todos los reintentos la repiten y el servidor devuelve la
+    # respuesta guardada en vez de repetir el alta. Devuelve True si el POST quedo
+    # reintentable.
+    if method.upper() != "POST" or not options.idempotency_keys:
+        return None
+    kwargs["headers"] = {**(kwargs.get("headers") or {}), "Idempotency-Key": uuid.uuid4().hex}
+    return True
+
+
+def backoff_delay(attempt: int, options: HttpOptions, rng: random.Random | None = None) -> float:
+    # Full jitter: los reintentos de varios operadores no llegan sincronizados al tunel.
+    ceiling = min(options.backoff_max, options.backoff * (2**attempt))
+    return (rng or random).uniform(0, ceiling)
+
+
+class RoundTripStats:
+    def __init__(self, window: int = 50) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.last: float | None = None
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+            self.last = seconds
+
+    def summary(self) -> dict | None:
+        with self._lock:
+            if not self._samples:
+                return None
+            values = sorted(self._samples)
+            return {
+                "last_ms": round(self.last * 1000, 1),
+                "p50_ms": round(values[len(values) // 2] * 1000, 1),
+                "max_ms": round(values[-1] * 1000, 1),
+                "samples": len(values),
+            }
@@ -0,0 +1,92 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+import threading
+import time
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    value: Any
+    etag: str | None
+    fresh: bool
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size debe ser mayor a 0")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._items: OrderedDict[Hashable, tuple[float, str | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def lookup(self, key: Hashable) -> CacheEntry | None:
+        # Una entrada vencida se devuelve igual (fresh=False): si tiene ETag se
+        # revalida con If-None-Match y un 304 evita volver a bajar el cuerpo.
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, etag, value = item
+            self._items.move_to_end(key)
+            fresh = expires_at > self._clock()
+            if fresh:
+                self.hits += 1
+            return CacheEntry(value, etag, fresh)
+
+    def store(self, key: Hashable, value: Any, etag: str | None) -> None:
+        with self._lock:
+            self.misses += 1
+            self._put(key, value, etag)
+
+    def revalidated(self, key: Hashable, entry: CacheEntry) -> None:
+        with self._lock:
+            self.revalidations += 1
+            self._put(key, entry.value, entry.etag)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        with self._lock:
+            for key in [key for key in self._items if predicate(key)]:
+                del self._items[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "size": len(self._items),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+            }
+
+    def _put(self, key: Hashable, value: Any, etag: str | None) -> None:
+        self._items[key] = (self._clock() + self.ttl, etag, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            self.evictions += 1
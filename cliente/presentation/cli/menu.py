@@ -1,5 +1,6 @@
 from rich.console import Console
 from cliente.infrastructure.api_client import ApiClient, ApiError
+from cliente.presentation.cli.pager import PrefetchPager
 from cliente.presentation.cli.prompts import (
     clear_screen,
     prompt_text,
@@ -10,10 +11,12 @@ from cliente.presentation.cli.prompts import (
 from cliente.presentation.cli.screens import (
     header,
     footer,
+    latency,
     partners_table,
     show_partner,
     pickings_table,
     show_picking,
+    show_picking_summary,
     package_types_table,
     show_package_type,
     packages_table,
@@ -21,6 +24,7 @@ from cliente.presentation.cli.screens import (
 )
 
 console = Console()
+PAGE_SIZE = 10
 
 
 def main_menu(api: ApiClient) -> None:
@@ -33,6 +37,7 @@ def main_menu(api: ApiClient) -> None:
             console.print("[green] 3)[/green] Package Types (stock.package.type)")
             console.print("[green] 4)[/green] Packages (stock.quant.package)")
             console.print("[green] 0)[/green] Salir")
+            latency(api.rtt.summary(), api.cache_stats())
             footer("ESC=Cancelar  0=Salir")
             option = console.input("==> ").strip()
             if "\x1b" in option:
@@ -182,38 +187,12 @@ def get_partner_flow(api: ApiClient) -> None:
 
 
 def list_partners_flow(api: ApiClient) -> None:
-    clear_screen()
-    header("LISTAR RES.PARTNER")
-    limit = 10
-    offset = 0
-    while True:
-        try:
-            results = api.list_res_partners(limit=limit, offset=offset)
-        except ApiError as exc:
-            console.print(f"[red]{exc.detail}[/red]")
-            footer("ENTER=Continuar")
-            console.input("==> ")
-            return
-        clear_screen()
-        header(f"LISTAR RES.PARTNER  OFFSET {offset}")
-        if results:
-            partners_table(results)
-        else:
-            console.print("[yellow]Sin resultados[/yellow]")
-        console.print("[green]N)[/green] siguiente   [green]P)[/green] anterior   [green]0)[/green] volver")
-        footer("ESC=Cancelar")
-        try:
-            choice = console.input("==> ").strip().lower()
-            if "\x1b" in choice:
-                break
-        except KeyboardInterrupt:
-            break
-        if choice == "n":
-            offset += limit
-        elif choice == "p":
-            offset = max(0, offset - limit)
-        elif choice == "0":
-            break
+    _paged_list_flow(
+        api,
+        "LISTAR RES.PARTNER",
+        lambda cursor: api.list_res_partners_page(limit=PAGE_SIZE, cursor=cursor),
+        partners_table,
+    )
 
 
 def pickings_menu(api: ApiClient) -> None:
@@ -323,6 +302,7 @@ def get_picking_flow(api: ApiClient) -> None:
         picking_id = prompt_int("01 ID", required=True)
         dto = api.get_stock_picking(picking_id)
         show_picking(dto)
+        show_picking_summary(api.get_stock_picking_summary(picking_id))
     except ApiError as exc:
         console.print(f"[red]{exc.detail}[/red]")
     except EscapeError:
@@ -332,38 +312,12 @@ def get_picking_flow(api: ApiClient) -> None:
 
 
 def list_pickings_flow(api: ApiClient) -> None:
-    clear_screen()
-    header("LISTAR STOCK.PICKING")
-    limit = 10
-    offset = 0
-    while True:
-        try:
-            results = api.list_stock_pickings(limit=limit, offset=offset)
-        except ApiError as exc:
-            console.print(f"[red]{exc.detail}[/red]")
-            footer("ENTER=Continuar")
-            console.input("==> ")
-            return
-        clear_screen()
-        header(f"LISTAR STOCK.PICKING  OFFSET {offset}")
-        if results:
-            pickings_table(results)
-        else:
-            console.print("[yellow]Sin resultados[/yellow]")
-        console.print("[green]N)[/green] siguiente   [green]P)[/green] anterior   [green]0)[/green] volver")
-        footer("ESC=Cancelar")
-        try:
-            choice = console.input("==> ").strip().lower()
-            if "\x1b" in choice:
-                break
-        except KeyboardInterrupt:
-            break
-        if choice == "n":
-            offset += limit
-        elif choice == "p":
-            offset = max(0, offset - limit)
-        elif choice == "0":
-            break
+    _paged_list_flow(
+        api,
+        "LISTAR STOCK.PICKING",
+        lambda cursor: api.list_stock_pickings_page(limit=PAGE_SIZE, cursor=cursor),
+        pickings_table,
+    )
 
 
 def package_types_menu(api: ApiClient) -> None:
@@ -485,38 +439,12 @@ def get_package_type_flow(api: ApiClient) -> None:
 
 
 def list_package_types_flow(api: ApiClient) -> None:
-    clear_screen()
-    header("LISTAR STOCK.PACKAGE.TYPE")
-    limit = 10
-    offset = 0
-    while True:
-        try:
-            results = api.list_stock_package_types(limit=limit, offset=offset)
-        except ApiError as exc:
-            console.print(f"[red]{exc.detail}[/red]")
-            footer("ENTER=Continuar")
-            console.input("==> ")
-            return
-        clear_screen()
-        header(f"LISTAR STOCK.PACKAGE.TYPE  OFFSET {offset}")
-        if results:
-            package_types_table(results)
-        else:
-            console.print("[yellow]Sin resultados[/yellow]")
-        console.print("[green]N)[/green] siguiente   [green]P)[/green] anterior   [green]0)[/green] volver")
-        footer("ESC=Cancelar")
-        try:
-            choice = console.input("==> ").strip().lower()
-            if "\x1b" in choice:
-                break
-        except KeyboardInterrupt:
-            break
-        if choice == "n":
-            offset += limit
-        elif choice == "p":
-            offset = max(0, offset - limit)
-        elif choice == "0":
-            break
+    _paged_list_flow(
+        api,
+        "LISTAR STOCK.PACKAGE.TYPE",
+        lambda cursor: api.list_stock_package_types_page(limit=PAGE_SIZE, cursor=cursor),
+        package_types_table,
+    )
 
 
 def packages_menu(api: ApiClient) -> None:
@@ -651,35 +579,47 @@ def get_package_flow(api: ApiClient) -> None:
 
 
 def list_packages_flow(api: ApiClient) -> None:
+    _paged_list_flow(
+        api,
+        "LISTAR STOCK.QUANT.PACKAGE",
+        lambda cursor: api.list_stock_quant_packages_page(
+            limit=PAGE_SIZE, cursor=cursor, expand=("package_type", "picking")
+        ),
+        packages_table,
+    )
+
+
+def _paged_list_flow(api: ApiClient, title: str, fetch, table) -> None:
     clear_screen()
-    header("LISTAR STOCK.QUANT.PACKAGE")
-    limit = 10
-    offset = 0
-    while True:
-        try:
-            results = api.list_stock_quant_packages(limit=limit, offset=offset)
-        except ApiError as exc:
-            console.print(f"[red]{exc.detail}[/red]")
-            footer("ENTER=Continuar")
-            console.input("==> ")
-            return
-        clear_screen()
-        header(f"LISTAR STOCK.QUANT.PACKAGE  OFFSET {offset}")
-        if results:
-            packages_table(results)
-        else:
-            console.print("[yellow]Sin resultados[/yellow]")
-        console.print("[green]N)[/green] siguiente   [green]P)[/green] anterior   [green]0)[/green] volver")
-        footer("ESC=Cancelar")
-        try:
-            choice = console.input("==> ").strip().lower()
-            if "\x1b" in choice:
+    header(title)
+    with PrefetchPager(fetch) as pager:
+        while True:
+            try:
+                page = pager.current()
+            except ApiError as exc:
+                console.print(f"[red]{exc.detail}[/red]")
+                footer("ENTER=Continuar")
+                console.input("==> ")
+                return
+            clear_screen()
+            last = "" if page.next_cursor else "  (ULTIMA)"
+            header(f"{title}  PAGINA {pager.index + 1}{last}")
+            if page.items:
+                table(page.items)
+            else:
+                console.print("[yellow]Sin resultados[/yellow]")
+            console.print("[green]N)[/green] siguiente   [green]P)[/green] anterior   [green]0)[/green] volver")
+            latency(api.rtt.summary(), api.cache_stats())
+            footer("ESC=Cancelar")
+            try:
+                choice = console.input("==> ").strip().lower()
+                if "\x1b" in choice:
+                    break
+            except KeyboardInterrupt:
+                break
+            if choice == "n":
+                pager.next()
+            elif choice == "p":
+                pager.previous()
+            elif choice == "0":
                 break
-        except KeyboardInterrupt:
-            break
-        if choice == "n":
-            offset += limit
-        elif choice == "p":
-            offset = max(0, offset - limit)
-        elif choice == "0":
-            break
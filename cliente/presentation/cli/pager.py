@@ -0,0 +1,84 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Generic, TypeVar
+
+from cliente.dtos.page_dto import PageDTO
+
+T = TypeVar("T")
+
+
+class PrefetchPager(Generic[T]):
+    def __init__(
+        self,
+        fetch: Callable[[str | None], PageDTO[T]],
+        window: int = 3,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
+        if window < 2:
+            raise ValueError("window debe ser al menos 2 (pagina actual + siguiente)")
+        self.index = 0
+        self._fetch = fetch
+        self._window = window
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="pager")
+        # Cursor con el que se pide cada pagina: permite volver a una pagina que ya
+        # salio de la ventana sin recorrer la lista desde el principio.
+        self._cursors: list[str | None] = [None]
+        self._pages: OrderedDict[int, Future] = OrderedDict()
+
+    def current(self) -> PageDTO[T]:
+        future = self._future(self.index)
+        try:
+            page = future.result()
+        except Exception:
+            # Una falla (p.ej. ApiError) no queda cacheada: el proximo intento reintenta.
+            self._pages.pop(self.index, None)
+            raise
+        if page.next_cursor:
+            if len(self._cursors) == self.index + 1:
+                self._cursors.append(page.next_cursor)
+            self._future(self.index + 1)
+        return page
+
+    def has_next(self) -> bool:
+        return bool(self.current().next_cursor)
+
+    def next(self) -> bool:
+        if not self.has_next():
+            return False
+        self.index += 1
+        return True
+
+    def previous(self) -> bool:
+        if self.index == 0:
+            return False
+        self.index -= 1
+        return True
+
+    def close(self) -> None:
+        # Un request ya en vuelo no se puede interrumpir: se cancela lo encolado y
+        # el resultado de lo que este corriendo se descarta.
+        for future in self._pages.values():
+            future.cancel()
+        self._pages.clear()
+        if self._own_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "PrefetchPager[T]":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _future(self, index: int) -> Future:
+        future = self._pages.get(index)
+        if future is not None:
+            self._pages.move_to_end(index)
+            return future
+        future = self._executor.submit(self._fetch, self._cursors[index])
+        self._pages[index] = future
+        while len(self._pages) > self._window:
+            _, evicted = self._pages.popitem(last=False)
+            evicted.cancel()
+        return future
@@ -3,6 +3,7 @@ from rich.table import Table
 from rich.theme import Theme
 from cliente.dtos.res_partner_dto import ResPartnerDTO
 from cliente.dtos.stock_picking_dto import StockPickingDTO
+from cliente.dtos.picking_weight_summary_dto import PickingWeightSummaryDTO
 from cliente.dtos.stock_package_type_dto import StockPackageTypeDTO
 from cliente.dtos.stock_quant_package_dto import StockQuantPackageDTO
 
@@ -28,6 +29,18 @@ def footer(text: str = "ESC=Cancelar  ENTER=Continuar") -> None:
     console.rule(f"[dim]{text}[/dim]")
 
 
+def latency(summary: dict | None, cache: dict | None = None) -> None:
+    if summary is None:
+        return
+    text = (
+        f"API: ultimo {summary['last_ms']} ms  p50 {summary['p50_ms']} ms  "
+        f"max {summary['max_ms']} ms ({summary['samples']} llamadas)"
+    )
+    if cache is not None:
+        text += f"  cache {cache['hits']} hits / {cache['revalidations']} 304 / {cache['misses']} misses"
+    console.print(f"[dim]{text}[/dim]")
+
+
 def partners_table(partners: list[ResPartnerDTO]) -> None:
     table = Table(show_lines=False, header_style="label")
     table.add_column("ID", justify="right", style="field")
@@ -68,6 +81,15 @@ def show_picking(picking: StockPickingDTO) -> None:
     console.print(table)
 
 
+def show_picking_summary(summary: PickingWeightSummaryDTO) -> None:
+    table = Table(show_header=False, box=None)
+    table.add_row("04 PAQUETES", str(summary.package_count))
+    table.add_row("05 PESO BRUTO", str(summary.gross_weight))
+    table.add_row("06 TARA", str(summary.tare_weight))
+    table.add_row("07 PESO NETO", str(summary.net_weight))
+    console.print(table)
+
+
 def package_types_table(items: list[StockPackageTypeDTO]) -> None:
     table = Table(show_lines=False, header_style="label")
     table.add_column("ID", justify="right", style="field")
@@ -97,9 +119,9 @@ def packages_table(items: list[StockQuantPackageDTO]) -> None:
         table.add_row(
             str(item.id),
             item.name,
-            str(item.package_type_id),
+            item.package_type.name if item.package_type else str(item.package_type_id),
             str(item.shipping_weight),
-            str(item.picking_id),
+            item.picking.name if item.picking else str(item.picking_id),
         )
     console.print(table)
 
@@ -0,0 +1,170 @@
+import gzip
+import os
+import zlib
+
+try:
+    import brotli
+except ImportError:  # dependencia opcional (pip install brotli)
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+SUPPORTED_ENCODINGS = ("br", "gzip")
+
+
+def available_encodings(requested: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(e for e in requested if e in SUPPORTED_ENCODINGS and (e != "br" or brotli is not None))
+
+
+def compression_from_env() -> dict | None:
+    raw = os.getenv("API_COMPRESSION", "gzip,br").strip().lower()
+    if raw in ("", "0", "off", "none"):
+        return None
+    requested = tuple(e.strip() for e in raw.split(",") if e.strip())
+    unknown = [e for e in requested if e not in SUPPORTED_ENCODINGS]
+    if unknown:
+        raise ValueError(f"API_COMPRESSION invalido: {', '.join(unknown)}")
+    encodings = available_encodings(requested)
+    if not encodings:
+        return None
+    return {
+        "encodings": encodings,
+        "minimum_size": int(os.getenv("API_COMPRESSION_MIN_SIZE", "1024")),
+    }
+
+
+def negotiate(accept_encoding: str, encodings: tuple[str, ...]) -> str | None:
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    best = None
+    for encoding in encodings:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > 0 and (best is None or quality > best[1]):
+            best = (encoding, quality)
+    return best[0] if best else None
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        # Flush por chunk: el NDJSON del export sigue llegando de a bloques.
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.finish()
+        return self._zlib.compress(data) + self._zlib.flush()
+
+
+def compress(encoding: str, data: bytes, gzip_level: int = 6, brotli_quality: int = 4) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app,
+        encodings: tuple[str, ...] = ("gzip",),
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.encodings = available_encodings(encodings)
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for name, value in scope.get("headers", []):
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = negotiate(accept, self.encodings) if accept else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        compressor: _Compressor | None = None
+        passthrough = False
+
+        async def send_wrapper(message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                passthrough = not _compressible(message)
+                if passthrough:
+                    await send(message)
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                if not more_body:
+                    if len(body) < self.minimum_size:
+                        await send(start)
+                        await send(message)
+                        return
+                    payload = compress(encoding, body, self.gzip_level, self.brotli_quality)
+                    await send(_compressed_start(start, encoding, len(payload)))
+                    await send({"type": "http.response.body", "body": payload})
+                    return
+                compressor = _Compressor(encoding, self.gzip_level, self.brotli_quality)
+                await send(_compressed_start(start, encoding, None))
+            payload = compressor.chunk(body) if more_body else compressor.finish(body)
+            await send({"type": "http.response.body", "body": payload, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _compressible(start) -> bool:
+    if start["status"] < 200 or start["status"] in (204, 304):
+        return False
+    content_type = b""
+    for name, value in start.get("headers", []):
+        if name == b"content-encoding":
+            return False
+        if name == b"content-type":
+            content_type = value
+    return content_type.decode("latin-1").startswith(COMPRESSIBLE_TYPES)
+
+
+def _compressed_start(start, encoding: str, length: int | None) -> dict:
+    headers = [
+        (name, value)
+        for name, value in start.get("headers", [])
+        if name not in (b"content-length", b"vary")
+    ]
+    vary = [value for name, value in start.get("headers", []) if name == b"vary"]
+    vary.append(b"Accept-Encoding")
+    headers.append((b"vary", b", ".join(vary)))
+    headers.append((b"content-encoding", encoding.encode("latin-1")))
+    if length is not None:
+        headers.append((b"content-length", str(length).encode("latin-1")))
+    return {**start, "headers": headers}
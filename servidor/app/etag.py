@@ -0,0 +1,73 @@
+from collections.abc import Iterable
+from datetime import datetime
+import hashlib
+
+from fastapi import Response
+
+from application.exceptions import PreconditionFailedError
+
+VERSION_FORMAT = "%Y%m%d%H%M%S%f"
+
+
+def entity_etag(entity_id: int, updated_at: datetime | None) -> str | None:
+    if updated_at is None:
+        return None
+    return f'W/"{entity_id}-{updated_at.strftime(VERSION_FORMAT)}"'
+
+
+def list_etag(versions: Iterable[tuple[int, datetime | None]], page: tuple = ()) -> str:
+    digest = hashlib.blake2b(digest_size=12)
+    # El cuerpo tambien trae limit/offset/cursores: los mismos items con otra pagina
+    # no son la misma representacion.
+    digest.update(repr(page).encode("utf-8"))
+    for entity_id, updated_at in versions:
+        stamp = updated_at.strftime(VERSION_FORMAT) if updated_at else ""
+        digest.update(f"{entity_id}:{stamp};".encode("ascii"))
+    return f'W/"l-{digest.hexdigest()}"'
+
+
+def _opaque_tags(header: str) -> list[str]:
+    tags = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag:
+            tags.append(tag)
+    return tags
+
+
+def etag_matches(if_none_match: str | None, etag: str | None) -> bool:
+    if not if_none_match or etag is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag.removeprefix("W/") in _opaque_tags(if_none_match)
+
+
+def if_match_version(if_match: str | None, entity_id: int) -> datetime | None:
+    if if_match is None or if_match.strip() == "*":
+        return None
+    # Los ETags son debiles pero If-Match los compara por valor: la version
+    # viaja en el tag y la verificacion real es el UPDATE ... WHERE updated_at.
+    versions = []
+    for tag in _opaque_tags(if_match):
+        tag_id, _, stamp = tag.strip('"').partition("-")
+        if tag_id != str(entity_id):
+            continue
+        try:
+            versions.append(datetime.strptime(stamp, VERSION_FORMAT))
+        except ValueError:
+            continue
+    if len(versions) != 1:
+        raise PreconditionFailedError("If-Match no corresponde a una version del registro")
+    return versions[0]
+
+
+def apply_etag(response: Response, etag: str | None) -> None:
+    if etag is not None:
+        response.headers["ETag"] = etag
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
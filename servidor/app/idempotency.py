@@ -0,0 +1,141 @@
+import hashlib
+import json
+import anyio
+import anyio.to_thread
+from application.exceptions import DatabaseError
+from application.ports.idempotency_store import IIdempotencyStore, IdempotencyRecord
+
+HEADER = b"idempotency-key"
+MAX_KEY_LENGTH = 255
+# Respuestas mas grandes no se guardan (un reintento se vuelve a ejecutar). Acota la
+# memoria del store: un lote de 1000 paquetes responde unos 150 KB.
+MAX_STORED_BODY = 256 * 1024
+
+
+class IdempotencyMiddleware:
+    def __init__(
+        self,
+        app,
+        store: IIdempotencyStore,
+        methods: tuple[str, ...] = ("POST",),
+        max_body: int = MAX_STORED_BODY,
+    ) -> None:
+        self.app = app
+        self.store = store
+        self.methods = methods
+        self.max_body = max_body
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] not in self.methods:
+            await self.app(scope, receive, send)
+            return
+        raw_key = None
+        for name, value in scope.get("headers", []):
+            if name == HEADER:
+                raw_key = value.decode("latin-1").strip()
+                break
+        if raw_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not raw_key or len(raw_key) > MAX_KEY_LENGTH:
+            await _send_json(send, 400, f"Idempotency-Key invalida (1 a {MAX_KEY_LENGTH} caracteres)")
+            return
+
+        body, receive = await _buffer_body(receive)
+        # La clave vale por ruta: la misma clave en otro endpoint es otro pedido.
+        key = f"{scope['path']} {raw_key}"
+        fingerprint = hashlib.sha256(scope.get("query_string", b"") + b"\n" + body).hexdigest()
+        try:
+            record = await anyio.to_thread.run_sync(self.store.begin, key, fingerprint)
+        except DatabaseError:
+            await _send_json(send, 503, "Registro de idempotencia no disponible")
+            return
+        if record is not None:
+            if record.fingerprint != fingerprint:
+                await _send_json(send, 422, "Idempotency-Key ya usada con otro cuerpo")
+            elif not record.completed:
+                await _send_json(send, 409, "Hay un pedido en curso con la misma Idempotency-Key")
+            else:
+                await _replay(send, record)
+            return
+
+        start = None
+        chunks: list[bytes] = []
+        size = 0
+
+        async def send_wrapper(message) -> None:
+            nonlocal start, size
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body" and size <= self.max_body:
+                chunks.append(message.get("body", b""))
+                size += len(chunks[-1])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException:
+            # Shield: si el cliente corto la conexion la reserva igual se libera.
+            with anyio.CancelScope(shield=True):
+                await self._release(key)
+            raise
+        # Los 5xx no se guardan: el reintento tiene que volver a intentar la escritura.
+        if start is None or start["status"] >= 500 or size > self.max_body:
+            await self._release(key)
+            return
+        record = IdempotencyRecord(
+            fingerprint=fingerprint,
+            status=start["status"],
+            headers=tuple(
+                (name.decode("latin-1"), value.decode("latin-1")) for name, value in start.get("headers", [])
+            ),
+            body=b"".join(chunks),
+        )
+        try:
+            await anyio.to_thread.run_sync(self.store.complete, key, record)
+        except DatabaseError:
+            # La respuesta ya salio; sin registro un reintento se procesa de nuevo.
+            await self._release(key)
+
+    async def _release(self, key: str) -> None:
+        try:
+            await anyio.to_thread.run_sync(self.store.release, key)
+        except DatabaseError:
+            # En MySQL la reserva vence sola al terminar el lease.
+            pass
+
+
+async def _buffer_body(receive):
+    chunks: list[bytes] = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    body = b"".join(chunks)
+    consumed = False
+
+    async def replay_receive():
+        nonlocal consumed
+        if not consumed:
+            consumed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return body, replay_receive
+
+
+async def _replay(send, record: IdempotencyRecord) -> None:
+    headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in record.headers]
+    headers.append((b"idempotent-replayed", b"true"))
+    await send({"type": "http.response.start", "status": record.status, "headers": headers})
+    await send({"type": "http.response.body", "body": record.body})
+
+
+async def _send_json(send, status: int, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    headers = [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode("latin-1"))]
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
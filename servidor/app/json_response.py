@@ -0,0 +1,34 @@
+import json
+import os
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # dependencia opcional (pip install orjson)
+    orjson = None
+
+JSON_RESPONSES = ("default", "orjson")
+
+
+class OrjsonResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+def response_class_from_env() -> type[JSONResponse] | None:
+    name = os.getenv("API_JSON_RESPONSE", "default").strip().lower()
+    if name not in JSON_RESPONSES:
+        raise ValueError(f"API_JSON_RESPONSE invalido: {name}")
+    if name == "default":
+        # Sin clase propia FastAPI serializa el response_model directo a bytes con Pydantic.
+        return None
+    if orjson is None:
+        raise ValueError("API_JSON_RESPONSE=orjson requiere el paquete orjson")
+    return OrjsonResponse
+
+
+def dumps_line(value: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
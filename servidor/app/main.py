@@ -1,15 +1,39 @@
+import os
 import sys
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parents[1]
+# schema.sql + migrations/: lo usan el arranque y los benchmarks contra MySQL.
+SCRIPTS_DIR = BASE_DIR / "scripts"
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from dotenv import load_dotenv
+from application.ports.async_unit_of_work import IAsyncUnitOfWork
 from application.ports.unit_of_work import IUnitOfWork
-from infrastructure.db.mysql_connection import MySQLConnectionFactory
+from infrastructure.db.async_in_memory_unit_of_work import AsyncInMemoryUnitOfWork
+from infrastructure.db.async_mysql_connection import AsyncMySQLConnectionPool
+from infrastructure.db.async_unit_of_work import AsyncMySQLUnitOfWork
+from infrastructure.db.mysql_connection import MySQLConnectionFactory, MySQLConnectionPool
 from infrastructure.db.unit_of_work import MySQLUnitOfWork
+from infrastructure.db.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.db.file_store import FileStore
+from infrastructure.db.file_unit_of_work import FileUnitOfWork
+from infrastructure.cache.ttl_cache import TTLCache
+from infrastructure.idempotency.in_memory_idempotency_store import InMemoryIdempotencyStore
+from infrastructure.idempotency.mysql_idempotency_store import MySQLIdempotencyStore
+from application.ports.idempotency_store import IIdempotencyStore
+from servidor.app.idempotency import IdempotencyMiddleware
+from servidor.app.compression import CompressionMiddleware, compression_from_env
+from servidor.app.json_response import response_class_from_env
+from servidor.app.metrics import MetricsRegistry, TimingMiddleware
+from servidor.app.routers.async_res_partners import router as async_res_partners_router
+from servidor.app.routers.async_stock_pickings import router as async_stock_pickings_router
+from servidor.app.routers.async_stock_package_types import router as async_stock_package_types_router
+from servidor.app.routers.async_stock_quant_packages import router as async_stock_quant_packages_router
 from servidor.app.routers.res_partners import router as res_partners_router
 from servidor.app.routers.stock_pickings import router as stock_pickings_router
 from servidor.app.routers.stock_package_types import router as stock_package_types_router
@@ -17,29 +41,156 @@ from servidor.app.routers.stock_quant_packages import router as stock_quant_pack
 
 
 load_dotenv()
+storage_backend = os.getenv("STORAGE_BACKEND", "mysql").strip().lower()
+if storage_backend not in ("mysql", "memory", "file"):
+    raise ValueError(f"STORAGE_BACKEND invalido: {storage_backend}")
 conn_factory = MySQLConnectionFactory.from_env()
+# Cada request sync retiene una conexion durante toda la UoW: hilos de mas solo esperan
+# en el pool. Sin DB_POOL_MAX_SIZE explicito, el pool acompana a API_THREAD_LIMIT.
+conn_pool = MySQLConnectionPool.from_env(
+    conn_factory, default_max_size=int(os.getenv("API_THREAD_LIMIT") or 10)
+)
+file_store = FileStore.from_env() if storage_backend == "file" else None
+memory_uow = InMemoryUnitOfWork() if storage_backend == "memory" else None
+# API_ASYNC=1: alta y lectura por id corren como async def sobre aiomysql, sin ocupar
+# un hilo del threadpool mientras esperan a MySQL. El resto de los endpoints sigue sync.
+api_async = os.getenv("API_ASYNC", "0") == "1"
+if api_async and storage_backend == "file":
+    raise ValueError("API_ASYNC=1 no soporta STORAGE_BACKEND=file")
+async_pool = (
+    AsyncMySQLConnectionPool.from_env(conn_factory, default_max_size=conn_pool.config.max_size)
+    if api_async and storage_backend == "mysql"
+    else None
+)
+async_memory_uow = AsyncInMemoryUnitOfWork(memory_uow) if api_async and memory_uow is not None else None
+
+
+def _package_type_cache_from_env() -> TTLCache | None:
+    ttl = float(os.getenv("PACKAGE_TYPE_CACHE_TTL", "0"))
+    if ttl <= 0:
+        return None
+    return TTLCache(max_size=int(os.getenv("PACKAGE_TYPE_CACHE_SIZE", "256")), ttl=ttl)
+
+
+package_type_cache = _package_type_cache_from_env()
+
+
+def _idempotency_store_from_env() -> IIdempotencyStore | None:
+    backend = os.getenv("IDEMPOTENCY_STORE", "memory").strip().lower()
+    ttl = float(os.getenv("IDEMPOTENCY_TTL", "3600"))
+    if backend in ("", "0", "off", "none") or ttl <= 0:
+        return None
+    if backend == "memory":
+        max_keys = int(os.getenv("IDEMPOTENCY_MAX_KEYS", "1000"))
+        return InMemoryIdempotencyStore(TTLCache(max_size=max_keys, ttl=ttl))
+    if backend == "mysql":
+        if storage_backend != "mysql":
+            raise ValueError("IDEMPOTENCY_STORE=mysql requiere STORAGE_BACKEND=mysql")
+        return MySQLIdempotencyStore(conn_pool, ttl=ttl)
+    raise ValueError(f"IDEMPOTENCY_STORE invalido: {backend}")
+
+
+idempotency_store = _idempotency_store_from_env()
 
 
 def uow_factory() -> IUnitOfWork:
-    return MySQLUnitOfWork(conn_factory)
+    if file_store is not None:
+        return FileUnitOfWork(file_store)
+    if memory_uow is not None:
+        return memory_uow
+    return MySQLUnitOfWork(conn_pool, package_type_cache=package_type_cache)
+
+
+def async_uow_factory() -> IAsyncUnitOfWork:
+    if async_memory_uow is not None:
+        return async_memory_uow
+    return AsyncMySQLUnitOfWork(async_pool)
+
+
+def configure_thread_limit(limit: int | None = None) -> None:
+    if limit is None:
+        raw = os.getenv("API_THREAD_LIMIT")
+        if not raw:
+            return
+        limit = int(raw)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = limit
 
 
 def create_app() -> FastAPI:
     app = FastAPI(title="Odoo-like API", version="1.0.0")
+    metrics = MetricsRegistry()
+    app.state.metrics = metrics
+    if idempotency_store is not None:
+        # Primero (mas interno): guarda la respuesta sin comprimir y sin Server-Timing.
+        app.add_middleware(IdempotencyMiddleware, store=idempotency_store)
+    compression = compression_from_env()
+    if compression is not None:
+        app.add_middleware(CompressionMiddleware, **compression)
+    app.add_middleware(TimingMiddleware, registry=metrics)
+
+    @app.on_event("startup")
+    def _configure_thread_limit() -> None:
+        configure_thread_limit()
 
     @app.on_event("startup")
     def _ensure_schema() -> None:
-        schema_path = BASE_DIR / "scripts" / "schema.sql"
-        conn_factory.ensure_schema(schema_path)
+        if file_store is not None:
+            file_store.open()
+            return
+        if storage_backend != "mysql":
+            return
+        auto_migrate = os.getenv("DB_AUTO_MIGRATE", "1") != "0"
+        conn_factory.ensure_schema(SCRIPTS_DIR, auto_migrate=auto_migrate)
+        conn_pool.fill()
+
+    @app.on_event("startup")
+    async def _open_async_pool() -> None:
+        # Despues de _ensure_schema: los startup corren en orden de registro.
+        if async_pool is not None:
+            await async_pool.open()
+
+    @app.on_event("shutdown")
+    def _close_pool() -> None:
+        if file_store is not None:
+            file_store.close()
+        conn_pool.close()
+
+    @app.on_event("shutdown")
+    async def _close_async_pool() -> None:
+        if async_pool is not None:
+            await async_pool.close()
 
     @app.get("/health")
     def health():
-        return {"status": "ok"}
+        body = {"status": "ok"}
+        if package_type_cache is not None:
+            body["package_type_cache"] = package_type_cache.stats()
+        return body
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    def prometheus_metrics():
+        gauges = {"db_pool_size": conn_pool.size, "db_pool_idle": conn_pool.idle}
+        if async_pool is not None:
+            gauges["db_async_pool_size"] = async_pool.size
+            gauges["db_async_pool_idle"] = async_pool.idle
+        if package_type_cache is not None:
+            stats = package_type_cache.stats()
+            for key in ("hits", "misses", "evictions", "size"):
+                gauges[f"package_type_cache_{key}"] = stats[key]
+        return PlainTextResponse(metrics.render(gauges), media_type="text/plain; version=0.0.4")
 
-    app.include_router(res_partners_router)
-    app.include_router(stock_pickings_router)
-    app.include_router(stock_package_types_router)
-    app.include_router(stock_quant_packages_router)
+    json_response = response_class_from_env()
+    router_options = {"default_response_class": json_response} if json_response else {}
+    if api_async:
+        # Primero: ante la misma ruta gana el handler async.
+        app.include_router(async_res_partners_router, **router_options)
+        app.include_router(async_stock_pickings_router, **router_options)
+        app.include_router(async_stock_package_types_router, **router_options)
+        app.include_router(async_stock_quant_packages_router, **router_options)
+    app.include_router(res_partners_router, **router_options)
+    app.include_router(stock_pickings_router, **router_options)
+    app.include_router(stock_package_types_router, **router_options)
+    app.include_router(stock_quant_packages_router, **router_options)
     return app
 
 
@@ -0,0 +1,117 @@
+import threading
+import time
+from bisect import bisect_left
+
+from infrastructure.db.instrumentation import QueryStats, current_query_stats
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        self.buckets = buckets
+        self._latency: dict[tuple[str, str, str], Histogram] = {}
+        self._db: dict[tuple[str, str], QueryStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, status: int, duration: float, stats: QueryStats) -> None:
+        with self._lock:
+            key = (method, route, str(status))
+            histogram = self._latency.get(key)
+            if histogram is None:
+                histogram = self._latency[key] = Histogram(self.buckets)
+            histogram.observe(duration)
+            db = self._db.setdefault((method, route), QueryStats())
+            db.queries += stats.queries
+            db.rows += stats.rows
+            db.db_time += stats.db_time
+
+    def render(self, gauges: dict[str, float] | None = None) -> str:
+        lines = [
+            "# HELP http_request_duration_seconds Latencia de requests HTTP por ruta.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (method, route, status), histogram in sorted(self._latency.items()):
+                labels = f'method="{method}",route="{_escape(route)}",status="{status}"'
+                cumulative = 0
+                for bound, count in zip(self.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {histogram.total:.6f}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {histogram.count}")
+            db_items = sorted(self._db.items())
+        for name, attr, help_text in (
+            ("db_queries_total", "queries", "Consultas SQL ejecutadas por ruta."),
+            ("db_rows_total", "rows", "Filas leidas o afectadas por ruta."),
+            ("db_duration_seconds_total", "db_time", "Tiempo en la base de datos por ruta."),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for (method, route), stats in db_items:
+                value = getattr(stats, attr)
+                value = f"{value:.6f}" if isinstance(value, float) else value
+                lines.append(f'{name}{{method="{method}",route="{_escape(route)}"}} {value}')
+        for name, value in (gauges or {}).items():
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def server_timing(app_time: float, stats: QueryStats) -> str:
+    return (
+        f"app;dur={app_time * 1000:.2f}, "
+        f'db;dur={stats.db_time * 1000:.2f};desc="{stats.queries} queries {stats.rows} rows"'
+    )
+
+
+class TimingMiddleware:
+    def __init__(self, app, registry: MetricsRegistry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+                value = server_timing(time.perf_counter() - started, stats)
+                headers.append((b"server-timing", value.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_query_stats.reset(token)
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            self.registry.observe(scope["method"], path, status, time.perf_counter() - started, stats)
@@ -0,0 +1,41 @@
+import base64
+import binascii
+
+_AFTER = "a"
+_BEFORE = "b"
+
+
+def encode_cursor(direction: str, item_id: int) -> str:
+    raw = f"{direction}:{item_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> tuple[int | None, int | None]:
+    if not cursor:
+        return None, None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, _, value = base64.urlsafe_b64decode(padded).decode("ascii").partition(":")
+        item_id = int(value)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("Cursor invalido") from exc
+    if direction == _AFTER:
+        return item_id, None
+    if direction == _BEFORE:
+        return None, item_id
+    raise ValueError("Cursor invalido")
+
+
+def page_cursors(
+    ids: list[int], limit: int, offset: int, after_id: int | None, before_id: int | None
+) -> tuple[str | None, str | None]:
+    if not ids:
+        return None, None
+    if before_id is not None:
+        next_cursor = encode_cursor(_AFTER, ids[-1])
+        prev_cursor = encode_cursor(_BEFORE, ids[0]) if len(ids) == limit else None
+        return next_cursor, prev_cursor
+    next_cursor = encode_cursor(_AFTER, ids[-1]) if len(ids) == limit else None
+    has_prev = after_id is not None or offset > 0
+    prev_cursor = encode_cursor(_BEFORE, ids[0]) if has_prev else None
+    return next_cursor, prev_cursor
@@ -0,0 +1,61 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from application.ports.async_unit_of_work import IAsyncUnitOfWork
+from application.use_cases.async_create_stock_package_type import AsyncCreateStockPackageType
+from application.use_cases.async_get_stock_package_type_by_id import AsyncGetStockPackageTypeById
+from application.exceptions import NotFoundError, DatabaseError
+from domain.exceptions import ValidationError
+from servidor.app.etag import apply_etag, entity_etag, etag_matches, not_modified
+from servidor.app.schemas.stock_package_type import StockPackageTypeCreate, StockPackageTypeResponse
+
+# Version async de los endpoints de alta y lectura por id (API_ASYNC=1). Se incluye
+# antes que el router sync, que sigue atendiendo el resto de las rutas. La dependencia
+# tambien es async: una def sync la correria FastAPI en el threadpool.
+router = APIRouter(prefix="/api/v1/stock-package-types", tags=["stock_package_type"])
+
+
+async def get_async_uow() -> IAsyncUnitOfWork:
+    from servidor.app.main import async_uow_factory
+
+    return async_uow_factory()
+
+
+def _map_dto(dto) -> StockPackageTypeResponse:
+    return StockPackageTypeResponse(**dto.__dict__)
+
+
+@router.post("", response_model=StockPackageTypeResponse, status_code=status.HTTP_201_CREATED)
+async def create_package_type(
+    payload: StockPackageTypeCreate, response: Response, uow: IAsyncUnitOfWork = Depends(get_async_uow)
+):
+    try:
+        async with uow:
+            use_case = AsyncCreateStockPackageType(uow.package_types)
+            dto = await use_case.execute(**payload.model_dump())
+        apply_etag(response, entity_etag(dto.id, dto.updated_at))
+        return _map_dto(dto)
+    except ValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@router.get("/{package_type_id}", response_model=StockPackageTypeResponse)
+async def get_package_type(
+    package_type_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    uow: IAsyncUnitOfWork = Depends(get_async_uow),
+):
+    try:
+        async with uow:
+            use_case = AsyncGetStockPackageTypeById(uow.package_types)
+            dto = await use_case.execute(package_type_id)
+        etag = entity_etag(dto.id, dto.updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        apply_etag(response, etag)
+        return _map_dto(dto)
+    except NotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
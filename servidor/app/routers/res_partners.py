@@ -1,17 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from application.ports.unit_of_work import IUnitOfWork
 from application.use_cases.create_res_partner import CreateResPartner
 from application.use_cases.update_res_partner import UpdateResPartner
 from application.use_cases.delete_res_partner import DeleteResPartner
 from application.use_cases.get_res_partner_by_id import GetResPartnerById
+from application.use_cases.get_res_partners_by_ids import GetResPartnersByIds
 from application.use_cases.list_res_partners import ListResPartners
-from application.exceptions import NotFoundError, DatabaseError
+from application.exceptions import NotFoundError, DatabaseError, PreconditionFailedError
 from domain.exceptions import ValidationError
+from servidor.app.etag import apply_etag, entity_etag, etag_matches, if_match_version, list_etag, not_modified
+from servidor.app.pagination import decode_cursor, page_cursors
+from servidor.app.schemas.lookup import MAX_LOOKUP_IDS, LookupRequest
 from servidor.app.schemas.res_partner import (
     ResPartnerCreate,
     ResPartnerUpdate,
     ResPartnerResponse,
     ResPartnerListResponse,
+    ResPartnerLookupResult,
+    ResPartnerLookupResponse,
 )
 
 router = APIRouter(prefix="/api/v1/res-partners", tags=["res_partner"])
@@ -28,11 +34,12 @@ def _map_dto(dto) -> ResPartnerResponse:
 
 
 @router.post("", response_model=ResPartnerResponse, status_code=status.HTTP_201_CREATED)
-def create_partner(payload: ResPartnerCreate, uow: IUnitOfWork = Depends(get_uow)):
+def create_partner(payload: ResPartnerCreate, response: Response, uow: IUnitOfWork = Depends(get_uow)):
     try:
         with uow:
             use_case = CreateResPartner(uow.partners)
             dto = use_case.execute(**payload.model_dump())
+        apply_etag(response, entity_etag(dto.id, dto.updated_at))
         return _map_dto(dto)
     except ValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -40,42 +47,84 @@ def create_partner(payload: ResPartnerCreate, uow: IUnitOfWork = Depends(get_uow
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.post(":lookup", response_model=ResPartnerLookupResponse)
+def lookup_partners(payload: LookupRequest, uow: IUnitOfWork = Depends(get_uow)):
+    if len(payload.ids) > MAX_LOOKUP_IDS:
+        raise HTTPException(status_code=400, detail=f"Maximo {MAX_LOOKUP_IDS} ids por consulta")
+    try:
+        with uow:
+            use_case = GetResPartnersByIds(uow.partners)
+            results = use_case.execute(payload.ids)
+        return ResPartnerLookupResponse(
+            items=[
+                ResPartnerLookupResult(
+                    id=r.id, found=r.item is not None, item=_map_dto(r.item) if r.item else None
+                )
+                for r in results
+            ]
+        )
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
 @router.put("/{partner_id}", response_model=ResPartnerResponse)
 def update_partner(
-    partner_id: int, payload: ResPartnerUpdate, uow: IUnitOfWork = Depends(get_uow)
+    partner_id: int,
+    payload: ResPartnerUpdate,
+    response: Response,
+    if_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
 ):
     data = payload.model_dump(exclude_unset=True)
     try:
+        expected_updated_at = if_match_version(if_match, partner_id)
         with uow:
             use_case = UpdateResPartner(uow.partners)
-            dto = use_case.execute(partner_id=partner_id, **data)
+            dto = use_case.execute(partner_id=partner_id, expected_updated_at=expected_updated_at, **data)
+        apply_etag(response, entity_etag(dto.id, dto.updated_at))
         return _map_dto(dto)
     except ValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except PreconditionFailedError as exc:
+        raise HTTPException(status_code=412, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @router.delete("/{partner_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_partner(partner_id: int, uow: IUnitOfWork = Depends(get_uow)):
+def delete_partner(
+    partner_id: int, if_match: str | None = Header(default=None), uow: IUnitOfWork = Depends(get_uow)
+):
     try:
+        expected_updated_at = if_match_version(if_match, partner_id)
         with uow:
             use_case = DeleteResPartner(uow.partners)
-            use_case.execute(partner_id)
+            use_case.execute(partner_id, expected_updated_at)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except PreconditionFailedError as exc:
+        raise HTTPException(status_code=412, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @router.get("/{partner_id}", response_model=ResPartnerResponse)
-def get_partner(partner_id: int, uow: IUnitOfWork = Depends(get_uow)):
+def get_partner(
+    partner_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
+):
     try:
         with uow:
             use_case = GetResPartnerById(uow.partners)
             dto = use_case.execute(partner_id)
+        etag = entity_etag(dto.id, dto.updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        apply_etag(response, etag)
         return _map_dto(dto)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -84,13 +133,46 @@ def get_partner(partner_id: int, uow: IUnitOfWork = Depends(get_uow)):
 
 
 @router.get("", response_model=ResPartnerListResponse)
-def list_partners(limit: int = 10, offset: int = 0, uow: IUnitOfWork = Depends(get_uow)):
+def list_partners(
+    response: Response,
+    limit: int = 10,
+    offset: int = 0,
+    cursor: str | None = None,
+    name_prefix: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
+):
+    try:
+        after_id, before_id = decode_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     try:
         with uow:
             use_case = ListResPartners(uow.partners)
-            items = use_case.execute(limit=limit, offset=offset)
+            items = use_case.execute(
+                limit=limit,
+                offset=offset,
+                after_id=after_id,
+                before_id=before_id,
+                name_prefix=name_prefix,
+            )
+        next_cursor, prev_cursor = page_cursors(
+            [i.id for i in items], limit, offset, after_id, before_id
+        )
+        etag = list_etag(
+            ((i.id, i.updated_at) for i in items), (limit, offset, next_cursor, prev_cursor)
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        apply_etag(response, etag)
         return ResPartnerListResponse(
-            items=[_map_dto(i) for i in items], limit=limit, offset=offset
+            items=[_map_dto(i) for i in items],
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
+    except ValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -1,17 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from application.ports.unit_of_work import IUnitOfWork
 from application.use_cases.create_stock_package_type import CreateStockPackageType
 from application.use_cases.update_stock_package_type import UpdateStockPackageType
 from application.use_cases.delete_stock_package_type import DeleteStockPackageType
 from application.use_cases.get_stock_package_type_by_id import GetStockPackageTypeById
+from application.use_cases.get_stock_package_types_by_ids import GetStockPackageTypesByIds
 from application.use_cases.list_stock_package_types import ListStockPackageTypes
-from application.exceptions import NotFoundError, DatabaseError
+from application.exceptions import NotFoundError, DatabaseError, PreconditionFailedError
 from domain.exceptions import ValidationError
+from servidor.app.etag import apply_etag, entity_etag, etag_matches, if_match_version, list_etag, not_modified
+from servidor.app.pagination import decode_cursor, page_cursors
+from servidor.app.schemas.lookup import MAX_LOOKUP_IDS, LookupRequest
 from servidor.app.schemas.stock_package_type import (
     StockPackageTypeCreate,
     StockPackageTypeUpdate,
     StockPackageTypeResponse,
     StockPackageTypeListResponse,
+    StockPackageTypeLookupResult,
+    StockPackageTypeLookupResponse,
 )
 
 router = APIRouter(prefix="/api/v1/stock-package-types", tags=["stock_package_type"])
@@ -28,11 +34,12 @@ def _map_dto(dto) -> StockPackageTypeResponse:
 
 
 @router.post("", response_model=StockPackageTypeResponse, status_code=status.HTTP_201_CREATED)
-def create_package_type(payload: StockPackageTypeCreate, uow: IUnitOfWork = Depends(get_uow)):
+def create_package_type(payload: StockPackageTypeCreate, response: Response, uow: IUnitOfWork = Depends(get_uow)):
     try:
         with uow:
             use_case = CreateStockPackageType(uow.package_types)
             dto = use_case.execute(**payload.model_dump())
+        apply_etag(response, entity_etag(dto.id, dto.updated_at))
         return _map_dto(dto)
     except ValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -40,42 +47,84 @@ def create_package_type(payload: StockPackageTypeCreate, uow: IUnitOfWork = Depe
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.post(":lookup", response_model=StockPackageTypeLookupResponse)
+def lookup_package_types(payload: LookupRequest, uow: IUnitOfWork = Depends(get_uow)):
+    if len(payload.ids) > MAX_LOOKUP_IDS:
+        raise HTTPException(status_code=400, detail=f"Maximo {MAX_LOOKUP_IDS} ids por consulta")
+    try:
+        with uow:
+            use_case = GetStockPackageTypesByIds(uow.package_types)
+            results = use_case.execute(payload.ids)
+        return StockPackageTypeLookupResponse(
+            items=[
+                StockPackageTypeLookupResult(
+                    id=r.id, found=r.item is not None, item=_map_dto(r.item) if r.item else None
+                )
+                for r in results
+            ]
+        )
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
 @router.put("/{package_type_id}", response_model=StockPackageTypeResponse)
 def update_package_type(
-    package_type_id: int, payload: StockPackageTypeUpdate, uow: IUnitOfWork = Depends(get_uow)
+    package_type_id: int,
+    payload: StockPackageTypeUpdate,
+    response: Response,
+    if_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
 ):
     data = payload.model_dump(exclude_unset=True)
     try:
+        expected_updated_at = if_match_version(if_match, package_type_id)
         with uow:
             use_case = UpdateStockPackageType(uow.package_types)
-            dto = use_case.execute(package_type_id=package_type_id, **data)
+            dto = use_case.execute(package_type_id=package_type_id, expected_updated_at=expected_updated_at, **data)
+        apply_etag(response, entity_etag(dto.id, dto.updated_at))
         return _map_dto(dto)
     except ValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except PreconditionFailedError as exc:
+        raise HTTPException(status_code=412, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @router.delete("/{package_type_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_package_type(package_type_id: int, uow: IUnitOfWork = Depends(get_uow)):
+def delete_package_type(
+    package_type_id: int, if_match: str | None = Header(default=None), uow: IUnitOfWork = Depends(get_uow)
+):
     try:
+        expected_updated_at = if_match_version(if_match, package_type_id)
         with uow:
             use_case = DeleteStockPackageType(uow.package_types)
-            use_case.execute(package_type_id)
+            use_case.execute(package_type_id, expected_updated_at)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except PreconditionFailedError as exc:
+        raise HTTPException(status_code=412, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @router.get("/{package_type_id}", response_model=StockPackageTypeResponse)
-def get_package_type(package_type_id: int, uow: IUnitOfWork = Depends(get_uow)):
+def get_package_type(
+    package_type_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
+):
     try:
         with uow:
             use_case = GetStockPackageTypeById(uow.package_types)
             dto = use_case.execute(package_type_id)
+        etag = entity_etag(dto.id, dto.updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        apply_etag(response, etag)
         return _map_dto(dto)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -84,13 +133,46 @@ def get_package_type(package_type_id: int, uow: IUnitOfWork = Depends(get_uow)):
 
 
 @router.get("", response_model=StockPackageTypeListResponse)
-def list_package_types(limit: int = 10, offset: int = 0, uow: IUnitOfWork = Depends(get_uow)):
+def list_package_types(
+    response: Response,
+    limit: int = 10,
+    offset: int = 0,
+    cursor: str | None = None,
+    name_prefix: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
+):
+    try:
+        after_id, before_id = decode_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     try:
         with uow:
             use_case = ListStockPackageTypes(uow.package_types)
-            items = use_case.execute(limit=limit, offset=offset)
+            items = use_case.execute(
+                limit=limit,
+                offset=offset,
+                after_id=after_id,
+                before_id=before_id,
+                name_prefix=name_prefix,
+            )
+        next_cursor, prev_cursor = page_cursors(
+            [i.id for i in items], limit, offset, after_id, before_id
+        )
+        etag = list_etag(
+            ((i.id, i.updated_at) for i in items), (limit, offset, next_cursor, prev_cursor)
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        apply_etag(response, etag)
         return StockPackageTypeListResponse(
-            items=[_map_dto(i) for i in items], limit=limit, offset=offset
+            items=[_map_dto(i) for i in items],
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
+    except ValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
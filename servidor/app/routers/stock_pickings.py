@@ -1,21 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from application.ports.unit_of_work import IUnitOfWork
 from application.use_cases.create_stock_picking import CreateStockPicking
 from application.use_cases.update_stock_picking import UpdateStockPicking
 from application.use_cases.delete_stock_picking import DeleteStockPicking
 from application.use_cases.get_stock_picking_by_id import GetStockPickingById
+from application.use_cases.get_stock_pickings_by_ids import GetStockPickingsByIds
 from application.use_cases.list_stock_pickings import ListStockPickings
-from application.exceptions import NotFoundError, DatabaseError
+from application.use_cases.get_stock_picking_summary import GetStockPickingSummary
+from application.use_cases.upsert_stock_pickings import UpsertStockPickings
+from application.dtos.upsert_result_dto import INSERTED, UPDATED
+from application.exceptions import NotFoundError, DatabaseError, PreconditionFailedError
 from domain.exceptions import ValidationError
+from servidor.app.etag import apply_etag, entity_etag, etag_matches, if_match_version, list_etag, not_modified
+from servidor.app.pagination import decode_cursor, page_cursors
+from servidor.app.schemas.lookup import MAX_LOOKUP_IDS, LookupRequest
 from servidor.app.schemas.stock_picking import (
     StockPickingCreate,
     StockPickingUpdate,
     StockPickingResponse,
     StockPickingListResponse,
+    StockPickingLookupResult,
+    StockPickingLookupResponse,
+    StockPickingSummaryResponse,
+    StockPickingUpsertItem,
+    StockPickingUpsertResult,
+    StockPickingUpsertResponse,
 )
 
 router = APIRouter(prefix="/api/v1/stock-pickings", tags=["stock_picking"])
 
+MAX_BATCH_SIZE = 1000
+
 
 def get_uow() -> IUnitOfWork:
     from servidor.app.main import uow_factory
@@ -28,11 +43,12 @@ def _map_dto(dto) -> StockPickingResponse:
 
 
 @router.post("", response_model=StockPickingResponse, status_code=status.HTTP_201_CREATED)
-def create_picking(payload: StockPickingCreate, uow: IUnitOfWork = Depends(get_uow)):
+def create_picking(payload: StockPickingCreate, response: Response, uow: IUnitOfWork = Depends(get_uow)):
     try:
         with uow:
             use_case = CreateStockPicking(uow.pickings)
             dto = use_case.execute(**payload.model_dump())
+        apply_etag(response, entity_etag(dto.id, dto.updated_at))
         return _map_dto(dto)
     except ValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -40,42 +56,109 @@ def create_picking(payload: StockPickingCreate, uow: IUnitOfWork = Depends(get_u
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.post(":upsert", response_model=StockPickingUpsertResponse)
+def upsert_pickings(payload: list[StockPickingUpsertItem], uow: IUnitOfWork = Depends(get_uow)):
+    if len(payload) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"Maximo {MAX_BATCH_SIZE} pickings por lote")
+    try:
+        with uow:
+            use_case = UpsertStockPickings(uow.pickings, uow.partners)
+            results = use_case.execute([item.model_dump() for item in payload])
+        return StockPickingUpsertResponse(
+            items=[
+                StockPickingUpsertResult(
+                    index=r.index,
+                    action=r.action,
+                    item=_map_dto(r.item) if r.item else None,
+                    error=r.error,
+                )
+                for r in results
+            ],
+            inserted=sum(r.action == INSERTED for r in results),
+            updated=sum(r.action == UPDATED for r in results),
+        )
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@router.post(":lookup", response_model=StockPickingLookupResponse)
+def lookup_pickings(payload: LookupRequest, uow: IUnitOfWork = Depends(get_uow)):
+    if len(payload.ids) > MAX_LOOKUP_IDS:
+        raise HTTPException(status_code=400, detail=f"Maximo {MAX_LOOKUP_IDS} ids por consulta")
+    try:
+        with uow:
+            use_case = GetStockPickingsByIds(uow.pickings)
+            results = use_case.execute(payload.ids)
+        return StockPickingLookupResponse(
+            items=[
+                StockPickingLookupResult(
+                    id=r.id, found=r.item is not None, item=_map_dto(r.item) if r.item else None
+                )
+                for r in results
+            ]
+        )
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
 @router.put("/{picking_id}", response_model=StockPickingResponse)
 def update_picking(
-    picking_id: int, payload: StockPickingUpdate, uow: IUnitOfWork = Depends(get_uow)
+    picking_id: int,
+    payload: StockPickingUpdate,
+    response: Response,
+    if_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
 ):
     data = payload.model_dump(exclude_unset=True)
     try:
+        expected_updated_at = if_match_version(if_match, picking_id)
         with uow:
             use_case = UpdateStockPicking(uow.pickings)
-            dto = use_case.execute(picking_id=picking_id, **data)
+            dto = use_case.execute(picking_id=picking_id, expected_updated_at=expected_updated_at, **data)
+        apply_etag(response, entity_etag(dto.id, dto.updated_at))
         return _map_dto(dto)
     except ValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except PreconditionFailedError as exc:
+        raise HTTPException(status_code=412, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @router.delete("/{picking_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_picking(picking_id: int, uow: IUnitOfWork = Depends(get_uow)):
+def delete_picking(
+    picking_id: int, if_match: str | None = Header(default=None), uow: IUnitOfWork = Depends(get_uow)
+):
     try:
+        expected_updated_at = if_match_version(if_match, picking_id)
         with uow:
             use_case = DeleteStockPicking(uow.pickings)
-            use_case.execute(picking_id)
+            use_case.execute(picking_id, expected_updated_at)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except PreconditionFailedError as exc:
+        raise HTTPException(status_code=412, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @router.get("/{picking_id}", response_model=StockPickingResponse)
-def get_picking(picking_id: int, uow: IUnitOfWork = Depends(get_uow)):
+def get_picking(
+    picking_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
+):
     try:
         with uow:
             use_case = GetStockPickingById(uow.pickings)
             dto = use_case.execute(picking_id)
+        etag = entity_etag(dto.id, dto.updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        apply_etag(response, etag)
         return _map_dto(dto)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -83,14 +166,62 @@ def get_picking(picking_id: int, uow: IUnitOfWork = Depends(get_uow)):
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.get("/{picking_id}/summary", response_model=StockPickingSummaryResponse)
+def get_picking_summary(picking_id: int, uow: IUnitOfWork = Depends(get_uow)):
+    try:
+        with uow:
+            use_case = GetStockPickingSummary(uow.pickings, uow.packages)
+            dto = use_case.execute(picking_id)
+        return StockPickingSummaryResponse(**dto.__dict__)
+    except NotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
 @router.get("", response_model=StockPickingListResponse)
-def list_pickings(limit: int = 10, offset: int = 0, uow: IUnitOfWork = Depends(get_uow)):
+def list_pickings(
+    response: Response,
+    limit: int = 10,
+    offset: int = 0,
+    cursor: str | None = None,
+    partner_id: int | None = None,
+    name_prefix: str | None = None,
+    if_none_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
+):
+    try:
+        after_id, before_id = decode_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     try:
         with uow:
             use_case = ListStockPickings(uow.pickings)
-            items = use_case.execute(limit=limit, offset=offset)
+            items = use_case.execute(
+                limit=limit,
+                offset=offset,
+                after_id=after_id,
+                before_id=before_id,
+                partner_id=partner_id,
+                name_prefix=name_prefix,
+            )
+        next_cursor, prev_cursor = page_cursors(
+            [i.id for i in items], limit, offset, after_id, before_id
+        )
+        etag = list_etag(
+            ((i.id, i.updated_at) for i in items), (limit, offset, next_cursor, prev_cursor)
+        )
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        apply_etag(response, etag)
         return StockPickingListResponse(
-            items=[_map_dto(i) for i in items], limit=limit, offset=offset
+            items=[_map_dto(i) for i in items],
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
+    except ValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -1,21 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from itertools import chain
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from application.ports.unit_of_work import IUnitOfWork
 from application.use_cases.create_stock_quant_package import CreateStockQuantPackage
+from application.use_cases.create_stock_quant_packages_batch import CreateStockQuantPackagesBatch
 from application.use_cases.update_stock_quant_package import UpdateStockQuantPackage
 from application.use_cases.delete_stock_quant_package import DeleteStockQuantPackage
 from application.use_cases.get_stock_quant_package_by_id import GetStockQuantPackageById
+from application.use_cases.get_stock_quant_packages_by_ids import GetStockQuantPackagesByIds
 from application.use_cases.list_stock_quant_packages import ListStockQuantPackages
-from application.exceptions import NotFoundError, DatabaseError
+from application.use_cases.list_stock_quant_package_details import ListStockQuantPackageDetails
+from application.use_cases.export_stock_quant_packages import ExportStockQuantPackages
+from application.use_cases.upsert_stock_quant_packages import UpsertStockQuantPackages
+from application.dtos.upsert_result_dto import INSERTED, UPDATED
+from application.exceptions import NotFoundError, DatabaseError, PreconditionFailedError
 from domain.exceptions import ValidationError
+from servidor.app.etag import apply_etag, entity_etag, etag_matches, if_match_version, list_etag, not_modified
+from servidor.app.json_response import dumps_line
+from servidor.app.pagination import decode_cursor, page_cursors
+from servidor.app.schemas.lookup import MAX_LOOKUP_IDS, LookupRequest
+from servidor.app.schemas.stock_package_type import StockPackageTypeResponse
+from servidor.app.schemas.stock_picking import StockPickingResponse
 from servidor.app.schemas.stock_quant_package import (
     StockQuantPackageCreate,
     StockQuantPackageUpdate,
     StockQuantPackageResponse,
+    StockQuantPackageExpandedResponse,
     StockQuantPackageListResponse,
+    StockQuantPackageLookupResult,
+    StockQuantPackageLookupResponse,
+    StockQuantPackageBatchItem,
+    StockQuantPackageBatchResult,
+    StockQuantPackageBatchResponse,
+    StockQuantPackageUpsertResult,
+    StockQuantPackageUpsertResponse,
 )
 
 router = APIRouter(prefix="/api/v1/stock-quant-packages", tags=["stock_quant_package"])
 
+MAX_BATCH_SIZE = 1000
+EXPORT_FIELDS = ("id", "name", "package_type_id", "shipping_weight", "picking_id")
+EXPORT_CHUNK_SIZE = 500
+EXPANSIONS = {"package_type", "picking"}
+
 
 def get_uow() -> IUnitOfWork:
     from servidor.app.main import uow_factory
@@ -27,12 +55,38 @@ def _map_dto(dto) -> StockQuantPackageResponse:
     return StockQuantPackageResponse(**dto.__dict__)
 
 
+def _map_detail_dto(detail) -> StockQuantPackageExpandedResponse:
+    return StockQuantPackageExpandedResponse(
+        **detail.package.__dict__,
+        package_type=StockPackageTypeResponse(**detail.package_type.__dict__) if detail.package_type else None,
+        picking=StockPickingResponse(**detail.picking.__dict__) if detail.picking else None,
+    )
+
+
+def _detail_versions(detail) -> list[tuple[int, datetime | None]]:
+    versions = [(detail.package.id, detail.package.updated_at)]
+    for related in (detail.package_type, detail.picking):
+        versions.append((related.id, related.updated_at) if related else (0, None))
+    return versions
+
+
+def _parse_expand(expand: str | None) -> set[str]:
+    if not expand:
+        return set()
+    values = {v.strip() for v in expand.split(",") if v.strip()}
+    unknown = values - EXPANSIONS
+    if unknown:
+        raise ValueError(f"Expansion invalida: {', '.join(sorted(unknown))}")
+    return values
+
+
 @router.post("", response_model=StockQuantPackageResponse, status_code=status.HTTP_201_CREATED)
-def create_package(payload: StockQuantPackageCreate, uow: IUnitOfWork = Depends(get_uow)):
+def create_package(payload: StockQuantPackageCreate, response: Response, uow: IUnitOfWork = Depends(get_uow)):
     try:
         with uow:
             use_case = CreateStockQuantPackage(uow.packages)
             dto = use_case.execute(**payload.model_dump())
+        apply_etag(response, entity_etag(dto.id, dto.updated_at))
         return _map_dto(dto)
     except ValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -40,42 +94,171 @@ def create_package(payload: StockQuantPackageCreate, uow: IUnitOfWork = Depends(
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.post(":batch", response_model=StockQuantPackageBatchResponse)
+def create_packages_batch(
+    payload: list[StockQuantPackageBatchItem], uow: IUnitOfWork = Depends(get_uow)
+):
+    if len(payload) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"Maximo {MAX_BATCH_SIZE} paquetes por lote")
+    try:
+        with uow:
+            use_case = CreateStockQuantPackagesBatch(uow.packages, uow.package_types, uow.pickings)
+            results = use_case.execute([item.model_dump() for item in payload])
+        return StockQuantPackageBatchResponse(
+            items=[
+                StockQuantPackageBatchResult(
+                    index=r.index,
+                    item=_map_dto(r.item) if r.item else None,
+                    error=r.error,
+                )
+                for r in results
+            ]
+        )
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@router.post(":upsert", response_model=StockQuantPackageUpsertResponse)
+def upsert_packages(
+    payload: list[StockQuantPackageBatchItem], uow: IUnitOfWork = Depends(get_uow)
+):
+    if len(payload) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"Maximo {MAX_BATCH_SIZE} paquetes por lote")
+    try:
+        with uow:
+            use_case = UpsertStockQuantPackages(uow.packages, uow.package_types, uow.pickings)
+            results = use_case.execute([item.model_dump() for item in payload])
+        return StockQuantPackageUpsertResponse(
+            items=[
+                StockQuantPackageUpsertResult(
+                    index=r.index,
+                    action=r.action,
+                    item=_map_dto(r.item) if r.item else None,
+                    error=r.error,
+                )
+                for r in results
+            ],
+            inserted=sum(r.action == INSERTED for r in results),
+            updated=sum(r.action == UPDATED for r in results),
+        )
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+@router.post(":lookup", response_model=StockQuantPackageLookupResponse)
+def lookup_packages(payload: LookupRequest, uow: IUnitOfWork = Depends(get_uow)):
+    if len(payload.ids) > MAX_LOOKUP_IDS:
+        raise HTTPException(status_code=400, detail=f"Maximo {MAX_LOOKUP_IDS} ids por consulta")
+    try:
+        with uow:
+            use_case = GetStockQuantPackagesByIds(uow.packages)
+            results = use_case.execute(payload.ids)
+        return StockQuantPackageLookupResponse(
+            items=[
+                StockQuantPackageLookupResult(
+                    id=r.id, found=r.item is not None, item=_map_dto(r.item) if r.item else None
+                )
+                for r in results
+            ]
+        )
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
 @router.put("/{package_id}", response_model=StockQuantPackageResponse)
 def update_package(
-    package_id: int, payload: StockQuantPackageUpdate, uow: IUnitOfWork = Depends(get_uow)
+    package_id: int,
+    payload: StockQuantPackageUpdate,
+    response: Response,
+    if_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
 ):
     data = payload.model_dump(exclude_unset=True)
     try:
+        expected_updated_at = if_match_version(if_match, package_id)
         with uow:
             use_case = UpdateStockQuantPackage(uow.packages)
-            dto = use_case.execute(package_id=package_id, **data)
+            dto = use_case.execute(package_id=package_id, expected_updated_at=expected_updated_at, **data)
+        apply_etag(response, entity_etag(dto.id, dto.updated_at))
         return _map_dto(dto)
     except ValidationError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except PreconditionFailedError as exc:
+        raise HTTPException(status_code=412, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
 @router.delete("/{package_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_package(package_id: int, uow: IUnitOfWork = Depends(get_uow)):
+def delete_package(
+    package_id: int, if_match: str | None = Header(default=None), uow: IUnitOfWork = Depends(get_uow)
+):
     try:
+        expected_updated_at = if_match_version(if_match, package_id)
         with uow:
             use_case = DeleteStockQuantPackage(uow.packages)
-            use_case.execute(package_id)
+            use_case.execute(package_id, expected_updated_at)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except PreconditionFailedError as exc:
+        raise HTTPException(status_code=412, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.get("/export")
+def export_packages(
+    picking_id: int | None = None,
+    package_type_id: int | None = None,
+    uow: IUnitOfWork = Depends(get_uow),
+):
+    def _rows():
+        with uow:
+            use_case = ExportStockQuantPackages(uow.packages)
+            rows = use_case.execute(picking_id=picking_id, package_type_id=package_type_id)
+            if not uow.exclusive:
+                yield from rows
+                return
+            # Con la base local bloqueada mientras la UoW esta abierta, transmitir por el
+            # tunel frenaria a todos los demas pedidos: se copia y se libera antes.
+            rows = list(rows)
+        yield from rows
+
+    def _chunks():
+        lines: list[str] = []
+        for dto in _rows():
+            lines.append(dumps_line({field: getattr(dto, field) for field in EXPORT_FIELDS}))
+            if len(lines) >= EXPORT_CHUNK_SIZE:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    chunks = _chunks()
+    try:
+        first = next(chunks, "")
+    except DatabaseError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return StreamingResponse(chain([first], chunks), media_type="application/x-ndjson")
+
+
 @router.get("/{package_id}", response_model=StockQuantPackageResponse)
-def get_package(package_id: int, uow: IUnitOfWork = Depends(get_uow)):
+def get_package(
+    package_id: int,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
+):
     try:
         with uow:
             use_case = GetStockQuantPackageById(uow.packages)
             dto = use_case.execute(package_id)
+        etag = entity_etag(dto.id, dto.updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        apply_etag(response, etag)
         return _map_dto(dto)
     except NotFoundError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
@@ -84,13 +267,72 @@ def get_package(package_id: int, uow: IUnitOfWork = Depends(get_uow)):
 
 
 @router.get("", response_model=StockQuantPackageListResponse)
-def list_packages(limit: int = 10, offset: int = 0, uow: IUnitOfWork = Depends(get_uow)):
+def list_packages(
+    response: Response,
+    limit: int = 10,
+    offset: int = 0,
+    cursor: str | None = None,
+    expand: str | None = None,
+    picking_id: int | None = None,
+    package_type_id: int | None = None,
+    min_weight: float | None = None,
+    max_weight: float | None = None,
+    if_none_match: str | None = Header(default=None),
+    uow: IUnitOfWork = Depends(get_uow),
+):
+    filters = {
+        "picking_id": picking_id,
+        "package_type_id": package_type_id,
+        "min_weight": min_weight,
+        "max_weight": max_weight,
+    }
+    try:
+        after_id, before_id = decode_cursor(cursor)
+        expansions = _parse_expand(expand)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     try:
         with uow:
-            use_case = ListStockQuantPackages(uow.packages)
-            items = use_case.execute(limit=limit, offset=offset)
+            if expansions:
+                use_case = ListStockQuantPackageDetails(uow.packages)
+                details = use_case.execute(
+                    limit=limit,
+                    offset=offset,
+                    after_id=after_id,
+                    before_id=before_id,
+                    with_package_type="package_type" in expansions,
+                    with_picking="picking" in expansions,
+                    **filters,
+                )
+                versions = [v for d in details for v in _detail_versions(d)]
+                items = [_map_detail_dto(d) for d in details]
+            else:
+                use_case = ListStockQuantPackages(uow.packages)
+                packages = use_case.execute(
+                    limit=limit,
+                    offset=offset,
+                    after_id=after_id,
+                    before_id=before_id,
+                    **filters,
+                )
+                versions = [(p.id, p.updated_at) for p in packages]
+                items = [_map_dto(p) for p in packages]
+        next_cursor, prev_cursor = page_cursors(
+            [i.id for i in items], limit, offset, after_id, before_id
+        )
+        # expand cambia la forma de cada item aunque las versiones coincidan.
+        etag = list_etag(versions, (limit, offset, next_cursor, prev_cursor, sorted(expansions)))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        apply_etag(response, etag)
         return StockQuantPackageListResponse(
-            items=[_map_dto(i) for i in items], limit=limit, offset=offset
+            items=items,
+            limit=limit,
+            offset=offset,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
         )
+    except ValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     except DatabaseError as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
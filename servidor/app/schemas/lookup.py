@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+MAX_LOOKUP_IDS = 1000
+
+
+class LookupRequest(BaseModel):
+    ids: list[int]
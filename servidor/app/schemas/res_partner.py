@@ -25,3 +25,15 @@ class ResPartnerListResponse(BaseModel):
     items: list[ResPartnerResponse]
     limit: int
     offset: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+class ResPartnerLookupResult(BaseModel):
+    id: int
+    found: bool
+    item: ResPartnerResponse | None = None
+
+
+class ResPartnerLookupResponse(BaseModel):
+    items: list[ResPartnerLookupResult]
@@ -23,3 +23,15 @@ class StockPackageTypeListResponse(BaseModel):
     items: list[StockPackageTypeResponse]
     limit: int
     offset: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+class StockPackageTypeLookupResult(BaseModel):
+    id: int
+    found: bool
+    item: StockPackageTypeResponse | None = None
+
+
+class StockPackageTypeLookupResponse(BaseModel):
+    items: list[StockPackageTypeLookupResult]
@@ -1,3 +1,4 @@
+from typing import Literal
 from pydantic import BaseModel, Field
 
 
@@ -19,7 +20,45 @@ class StockPickingResponse(StockPickingBase):
     id: int
 
 
+class StockPickingSummaryResponse(BaseModel):
+    picking_id: int
+    package_count: int
+    gross_weight: float
+    tare_weight: float
+    net_weight: float
+
+
 class StockPickingListResponse(BaseModel):
     items: list[StockPickingResponse]
     limit: int
     offset: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+class StockPickingLookupResult(BaseModel):
+    id: int
+    found: bool
+    item: StockPickingResponse | None = None
+
+
+class StockPickingLookupResponse(BaseModel):
+    items: list[StockPickingLookupResult]
+
+
+class StockPickingUpsertItem(BaseModel):
+    name: str
+    partner_id: int
+
+
+class StockPickingUpsertResult(BaseModel):
+    index: int
+    action: Literal["inserted", "updated"] | None = None
+    item: StockPickingResponse | None = None
+    error: str | None = None
+
+
+class StockPickingUpsertResponse(BaseModel):
+    items: list[StockPickingUpsertResult]
+    inserted: int
+    updated: int
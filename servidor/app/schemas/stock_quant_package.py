@@ -1,4 +1,7 @@
+from typing import Literal
 from pydantic import BaseModel, Field
+from servidor.app.schemas.stock_package_type import StockPackageTypeResponse
+from servidor.app.schemas.stock_picking import StockPickingResponse
 
 
 class StockQuantPackageBase(BaseModel):
@@ -23,7 +26,56 @@ class StockQuantPackageResponse(StockQuantPackageBase):
     id: int
 
 
+# Solo para listados con expand: los clientes ya distribuidos construyen su DTO con
+# **json y fallan ante claves desconocidas.
+class StockQuantPackageExpandedResponse(StockQuantPackageResponse):
+    package_type: StockPackageTypeResponse | None = None
+    picking: StockPickingResponse | None = None
+
+
+class StockQuantPackageBatchItem(BaseModel):
+    name: str
+    package_type_id: int
+    shipping_weight: float = 0.0
+    picking_id: int
+
+
+class StockQuantPackageBatchResult(BaseModel):
+    index: int
+    item: StockQuantPackageResponse | None = None
+    error: str | None = None
+
+
+class StockQuantPackageBatchResponse(BaseModel):
+    items: list[StockQuantPackageBatchResult]
+
+
 class StockQuantPackageListResponse(BaseModel):
-    items: list[StockQuantPackageResponse]
+    items: list[StockQuantPackageResponse | StockQuantPackageExpandedResponse]
     limit: int
     offset: int
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+class StockQuantPackageLookupResult(BaseModel):
+    id: int
+    found: bool
+    item: StockQuantPackageResponse | None = None
+
+
+class StockQuantPackageLookupResponse(BaseModel):
+    items: list[StockQuantPackageLookupResult]
+
+
+class StockQuantPackageUpsertResult(BaseModel):
+    index: int
+    action: Literal["inserted", "updated"] | None = None
+    item: StockQuantPackageResponse | None = None
+    error: str | None = None
+
+
+class StockQuantPackageUpsertResponse(BaseModel):
+    items: list[StockQuantPackageUpsertResult]
+    inserted: int
+    updated: int
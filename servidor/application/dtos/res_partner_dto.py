@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 
 @dataclass(frozen=True)
@@ -7,3 +8,4 @@ class ResPartnerDTO:
     name: str
     email: str | None
     phone: str | None
+    updated_at: datetime | None = None
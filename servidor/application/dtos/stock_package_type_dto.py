@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 
 @dataclass(frozen=True)
@@ -6,3 +7,4 @@ class StockPackageTypeDTO:
     id: int
     name: str
     weight: float
+    updated_at: datetime | None = None
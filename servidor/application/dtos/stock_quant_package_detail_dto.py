@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from application.dtos.stock_package_type_dto import StockPackageTypeDTO
+from application.dtos.stock_picking_dto import StockPickingDTO
+from application.dtos.stock_quant_package_dto import StockQuantPackageDTO
+
+
+@dataclass(frozen=True)
+class StockQuantPackageDetailDTO:
+    package: StockQuantPackageDTO
+    package_type: StockPackageTypeDTO | None = None
+    picking: StockPickingDTO | None = None
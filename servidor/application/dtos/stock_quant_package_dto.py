@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 
 @dataclass(frozen=True)
@@ -8,3 +9,4 @@ class StockQuantPackageDTO:
     package_type_id: int
     shipping_weight: float
     picking_id: int
+    updated_at: datetime | None = None
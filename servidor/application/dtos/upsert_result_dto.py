@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+INSERTED = "inserted"
+UPDATED = "updated"
+
+
+@dataclass(frozen=True)
+class UpsertResultDTO(Generic[T]):
+    index: int
+    item: T | None = None
+    action: str | None = None
+    error: str | None = None
@@ -7,3 +7,7 @@ class NotFoundError(ApplicationError):
 
 class DatabaseError(ApplicationError):
     pass
+
+
+class PreconditionFailedError(ApplicationError):
+    pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from domain.entities.res_partner import ResPartner
+from domain.entities.stock_package_type import StockPackageType
+from domain.entities.stock_picking import StockPicking
+from domain.entities.stock_quant_package import StockQuantPackage
+from domain.repositories.async_entity_repository import IAsyncEntityRepository
+
+
+class IAsyncUnitOfWork(ABC):
+    partners: IAsyncEntityRepository[ResPartner]
+    pickings: IAsyncEntityRepository[StockPicking]
+    package_types: IAsyncEntityRepository[StockPackageType]
+    packages: IAsyncEntityRepository[StockQuantPackage]
+
+    @abstractmethod
+    async def __aenter__(self) -> "IAsyncUnitOfWork": ...
+
+    @abstractmethod
+    async def __aexit__(self, exc_type, exc, tb) -> None: ...
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    fingerprint: str
+    status: int | None = None
+    headers: tuple[tuple[str, str], ...] = ()
+    body: bytes = b""
+
+    @property
+    def completed(self) -> bool:
+        # Sin status el pedido original todavia se esta procesando.
+        return self.status is not None
+
+
+class IIdempotencyStore(ABC):
+    # Reserva la clave y devuelve None, o devuelve el registro existente sin reservar.
+    @abstractmethod
+    def begin(self, key: str, fingerprint: str) -> IdempotencyRecord | None: ...
+
+    @abstractmethod
+    def complete(self, key: str, record: IdempotencyRecord) -> None: ...
+
+    @abstractmethod
+    def release(self, key: str) -> None: ...
@@ -10,6 +10,8 @@ class IUnitOfWork(ABC):
     pickings: IStockPickingRepository
     package_types: IStockPackageTypeRepository
     packages: IStockQuantPackageRepository
+    # True si mientras la UoW esta abierta ningun otro pedido accede a la base (file/memory).
+    exclusive: bool = False
 
     @abstractmethod
     def __enter__(self) -> "IUnitOfWork": ...
@@ -2,10 +2,14 @@ from domain.entities.res_partner import ResPartner
 from domain.entities.stock_picking import StockPicking
 from domain.entities.stock_package_type import StockPackageType
 from domain.entities.stock_quant_package import StockQuantPackage
+from domain.value_objects.picking_weight_summary import PickingWeightSummary
+from domain.value_objects.stock_quant_package_detail import StockQuantPackageDetail
 from application.dtos.res_partner_dto import ResPartnerDTO
 from application.dtos.stock_picking_dto import StockPickingDTO
 from application.dtos.stock_package_type_dto import StockPackageTypeDTO
 from application.dtos.stock_quant_package_dto import StockQuantPackageDTO
+from application.dtos.stock_quant_package_detail_dto import StockQuantPackageDetailDTO
+from application.dtos.picking_weight_summary_dto import PickingWeightSummaryDTO
 
 
 def to_partner_dto(partner: ResPartner) -> ResPartnerDTO:
@@ -14,6 +18,7 @@ def to_partner_dto(partner: ResPartner) -> ResPartnerDTO:
         name=partner.name,
         email=partner.email,
         phone=partner.phone,
+        updated_at=partner.updated_at,
     )
 
 
@@ -22,6 +27,7 @@ def to_picking_dto(picking: StockPicking) -> StockPickingDTO:
         id=picking.id,
         name=picking.name,
         partner_id=picking.partner_id,
+        updated_at=picking.updated_at,
     )
 
 
@@ -30,6 +36,7 @@ def to_package_type_dto(package_type: StockPackageType) -> StockPackageTypeDTO:
         id=package_type.id,
         name=package_type.name,
         weight=package_type.weight,
+        updated_at=package_type.updated_at,
     )
 
 
@@ -40,4 +47,23 @@ def to_quant_package_dto(package: StockQuantPackage) -> StockQuantPackageDTO:
         package_type_id=package.package_type_id,
         shipping_weight=package.shipping_weight,
         picking_id=package.picking_id,
+        updated_at=package.updated_at,
+    )
+
+
+def to_quant_package_detail_dto(detail: StockQuantPackageDetail) -> StockQuantPackageDetailDTO:
+    return StockQuantPackageDetailDTO(
+        package=to_quant_package_dto(detail.package),
+        package_type=to_package_type_dto(detail.package_type) if detail.package_type else None,
+        picking=to_picking_dto(detail.picking) if detail.picking else None,
+    )
+
+
+def to_picking_summary_dto(summary: PickingWeightSummary) -> PickingWeightSummaryDTO:
+    return PickingWeightSummaryDTO(
+        picking_id=summary.picking_id,
+        package_count=summary.package_count,
+        gross_weight=summary.gross_weight,
+        tare_weight=summary.tare_weight,
+        net_weight=summary.net_weight,
     )
@@ -0,0 +1,6 @@
+def existing_ids(repo, ids: list[int]) -> set[int] | None:
+    # Ids referenciados que existen, en una consulta IN. Sin repositorio devuelve None
+    # y la referencia no se verifica (lo hace la FK).
+    if repo is None:
+        return None
+    return {entity.id for entity in repo.get_many(ids)}
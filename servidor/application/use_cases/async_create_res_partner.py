@@ -0,0 +1,14 @@
+from domain.entities.res_partner import ResPartner
+from domain.repositories.async_entity_repository import IAsyncEntityRepository
+from application.dtos.res_partner_dto import ResPartnerDTO
+from application.use_cases._mappers import to_partner_dto
+
+
+class AsyncCreateResPartner:
+    def __init__(self, repo: IAsyncEntityRepository[ResPartner]) -> None:
+        self.repo = repo
+
+    async def execute(self, name: str, email: str | None = None, phone: str | None = None) -> ResPartnerDTO:
+        partner = ResPartner(name=name, email=email, phone=phone)
+        created = await self.repo.create(partner)
+        return to_partner_dto(created)
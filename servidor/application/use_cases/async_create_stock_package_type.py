@@ -0,0 +1,14 @@
+from domain.entities.stock_package_type import StockPackageType
+from domain.repositories.async_entity_repository import IAsyncEntityRepository
+from application.dtos.stock_package_type_dto import StockPackageTypeDTO
+from application.use_cases._mappers import to_package_type_dto
+
+
+class AsyncCreateStockPackageType:
+    def __init__(self, repo: IAsyncEntityRepository[StockPackageType]) -> None:
+        self.repo = repo
+
+    async def execute(self, name: str, weight: float = 0.0) -> StockPackageTypeDTO:
+        package_type = StockPackageType(name=name, weight=weight)
+        created = await self.repo.create(package_type)
+        return to_package_type_dto(created)
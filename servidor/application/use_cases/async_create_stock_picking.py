@@ -0,0 +1,14 @@
+from domain.entities.stock_picking import StockPicking
+from domain.repositories.async_entity_repository import IAsyncEntityRepository
+from application.dtos.stock_picking_dto import StockPickingDTO
+from application.use_cases._mappers import to_picking_dto
+
+
+class AsyncCreateStockPicking:
+    def __init__(self, repo: IAsyncEntityRepository[StockPicking]) -> None:
+        self.repo = repo
+
+    async def execute(self, name: str, partner_id: int) -> StockPickingDTO:
+        picking = StockPicking(name=name, partner_id=partner_id)
+        created = await self.repo.create(picking)
+        return to_picking_dto(created)
@@ -0,0 +1,25 @@
+from domain.entities.stock_quant_package import StockQuantPackage
+from domain.repositories.async_entity_repository import IAsyncEntityRepository
+from application.dtos.stock_quant_package_dto import StockQuantPackageDTO
+from application.use_cases._mappers import to_quant_package_dto
+
+
+class AsyncCreateStockQuantPackage:
+    def __init__(self, repo: IAsyncEntityRepository[StockQuantPackage]) -> None:
+        self.repo = repo
+
+    async def execute(
+        self,
+        name: str,
+        package_type_id: int,
+        shipping_weight: float = 0.0,
+        picking_id: int = 0,
+    ) -> StockQuantPackageDTO:
+        package = StockQuantPackage(
+            name=name,
+            package_type_id=package_type_id,
+            shipping_weight=shipping_weight,
+            picking_id=picking_id,
+        )
+        created = await self.repo.create(package)
+        return to_quant_package_dto(created)
@@ -0,0 +1,16 @@
+from domain.entities.res_partner import ResPartner
+from domain.repositories.async_entity_repository import IAsyncEntityRepository
+from application.dtos.res_partner_dto import ResPartnerDTO
+from application.use_cases._mappers import to_partner_dto
+from application.exceptions import NotFoundError
+
+
+class AsyncGetResPartnerById:
+    def __init__(self, repo: IAsyncEntityRepository[ResPartner]) -> None:
+        self.repo = repo
+
+    async def execute(self, partner_id: int) -> ResPartnerDTO:
+        partner = await self.repo.get_by_id(partner_id)
+        if not partner:
+            raise NotFoundError("Partner no encontrado")
+        return to_partner_dto(partner)
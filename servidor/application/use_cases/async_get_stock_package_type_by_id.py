@@ -0,0 +1,16 @@
+from domain.entities.stock_package_type import StockPackageType
+from domain.repositories.async_entity_repository import IAsyncEntityRepository
+from application.dtos.stock_package_type_dto import StockPackageTypeDTO
+from application.use_cases._mappers import to_package_type_dto
+from application.exceptions import NotFoundError
+
+
+class AsyncGetStockPackageTypeById:
+    def __init__(self, repo: IAsyncEntityRepository[StockPackageType]) -> None:
+        self.repo = repo
+
+    async def execute(self, package_type_id: int) -> StockPackageTypeDTO:
+        package_type = await self.repo.get_by_id(package_type_id)
+        if not package_type:
+            raise NotFoundError("Tipo de paquete no encontrado")
+        return to_package_type_dto(package_type)
@@ -0,0 +1,16 @@
+from domain.entities.stock_picking import StockPicking
+from domain.repositories.async_entity_repository import IAsyncEntityRepository
+from application.dtos.stock_picking_dto import StockPickingDTO
+from application.use_cases._mappers import to_picking_dto
+from application.exceptions import NotFoundError
+
+
+class AsyncGetStockPickingById:
+    def __init__(self, repo: IAsyncEntityRepository[StockPicking]) -> None:
+        self.repo = repo
+
+    async def execute(self, picking_id: int) -> StockPickingDTO:
+        picking = await self.repo.get_by_id(picking_id)
+        if not picking:
+            raise NotFoundError("Picking no encontrado")
+        return to_picking_dto(picking)
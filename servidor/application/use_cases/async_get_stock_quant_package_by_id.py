@@ -0,0 +1,16 @@
+from domain.entities.stock_quant_package import StockQuantPackage
+from domain.repositories.async_entity_repository import IAsyncEntityRepository
+from application.dtos.stock_quant_package_dto import StockQuantPackageDTO
+from application.use_cases._mappers import to_quant_package_dto
+from application.exceptions import NotFoundError
+
+
+class AsyncGetStockQuantPackageById:
+    def __init__(self, repo: IAsyncEntityRepository[StockQuantPackage]) -> None:
+        self.repo = repo
+
+    async def execute(self, package_id: int) -> StockQuantPackageDTO:
+        package = await self.repo.get_by_id(package_id)
+        if not package:
+            raise NotFoundError("Paquete no encontrado")
+        return to_quant_package_dto(package)
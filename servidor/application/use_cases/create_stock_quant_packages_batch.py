@@ -0,0 +1,68 @@
+from domain.entities.stock_quant_package import StockQuantPackage
+from domain.exceptions import ValidationError
+from domain.repositories.stock_package_type_repository import IStockPackageTypeRepository
+from domain.repositories.stock_picking_repository import IStockPickingRepository
+from domain.repositories.stock_quant_package_repository import IStockQuantPackageRepository
+from application.dtos.stock_quant_package_batch_result_dto import StockQuantPackageBatchResultDTO
+from application.use_cases._mappers import to_quant_package_dto
+from application.use_cases._references import existing_ids
+
+
+class CreateStockQuantPackagesBatch:
+    def __init__(
+        self,
+        repo: IStockQuantPackageRepository,
+        package_types: IStockPackageTypeRepository | None = None,
+        pickings: IStockPickingRepository | None = None,
+    ) -> None:
+        self.repo = repo
+        # Sin estos repositorios no se verifican las referencias (lo hace la FK).
+        self.package_types = package_types
+        self.pickings = pickings
+
+    def execute(self, items: list[dict]) -> list[StockQuantPackageBatchResultDTO]:
+        results: list[StockQuantPackageBatchResultDTO | None] = [None] * len(items)
+        parsed: list[tuple[int, StockQuantPackage]] = []
+        for index, item in enumerate(items):
+            try:
+                package = StockQuantPackage(
+                    name=item.get("name", ""),
+                    package_type_id=item.get("package_type_id", 0),
+                    shipping_weight=item.get("shipping_weight", 0.0),
+                    picking_id=item.get("picking_id", 0),
+                )
+            except ValidationError as exc:
+                results[index] = StockQuantPackageBatchResultDTO(index=index, error=str(exc))
+                continue
+            parsed.append((index, package))
+
+        # Una consulta por cada restriccion: los conflictos se informan por item en vez
+        # de abortar todo el lote con un error de integridad. Los nombres se comparan
+        # con la clave del almacenamiento (collation de la base, ignora acentos).
+        packages = [package for _, package in parsed]
+        matches = self.repo.name_matches([p.name for p in packages])
+        type_ids = existing_ids(self.package_types, [p.package_type_id for p in packages])
+        picking_ids = existing_ids(self.pickings, [p.picking_id for p in packages])
+        valid: list[tuple[int, StockQuantPackage]] = []
+        seen: set[str] = set()
+        for (index, package), (key, existing_id) in zip(parsed, matches):
+            if key in seen:
+                error = "Referencia duplicada en el lote"
+            elif existing_id is not None:
+                error = "Referencia ya existente"
+            elif type_ids is not None and package.package_type_id not in type_ids:
+                error = "package_type_id inexistente"
+            elif picking_ids is not None and package.picking_id not in picking_ids:
+                error = "picking_id inexistente"
+            else:
+                seen.add(key)
+                valid.append((index, package))
+                continue
+            results[index] = StockQuantPackageBatchResultDTO(index=index, error=error)
+
+        created = self.repo.create_many([package for _, package in valid])
+        for (index, _), package in zip(valid, created):
+            results[index] = StockQuantPackageBatchResultDTO(
+                index=index, item=to_quant_package_dto(package)
+            )
+        return results
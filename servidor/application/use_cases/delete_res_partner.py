@@ -1,3 +1,4 @@
+from datetime import datetime
 from domain.repositories.res_partner_repository import IResPartnerRepository
 from application.exceptions import NotFoundError
 
@@ -6,8 +7,6 @@ class DeleteResPartner:
     def __init__(self, repo: IResPartnerRepository) -> None:
         self.repo = repo
 
-    def execute(self, partner_id: int) -> None:
-        existing = self.repo.get_by_id(partner_id)
-        if not existing:
+    def execute(self, partner_id: int, expected_updated_at: datetime | None = None) -> None:
+        if not self.repo.delete(partner_id, expected_updated_at):
             raise NotFoundError("Partner no encontrado")
-        self.repo.delete(partner_id)
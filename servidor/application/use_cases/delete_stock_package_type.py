@@ -1,3 +1,4 @@
+from datetime import datetime
 from domain.repositories.stock_package_type_repository import IStockPackageTypeRepository
 from application.exceptions import NotFoundError
 
@@ -6,8 +7,6 @@ class DeleteStockPackageType:
     def __init__(self, repo: IStockPackageTypeRepository) -> None:
         self.repo = repo
 
-    def execute(self, package_type_id: int) -> None:
-        existing = self.repo.get_by_id(package_type_id)
-        if not existing:
+    def execute(self, package_type_id: int, expected_updated_at: datetime | None = None) -> None:
+        if not self.repo.delete(package_type_id, expected_updated_at):
             raise NotFoundError("Tipo de paquete no encontrado")
-        self.repo.delete(package_type_id)
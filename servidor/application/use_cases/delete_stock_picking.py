@@ -1,3 +1,4 @@
+from datetime import datetime
 from domain.repositories.stock_picking_repository import IStockPickingRepository
 from application.exceptions import NotFoundError
 
@@ -6,8 +7,6 @@ class DeleteStockPicking:
     def __init__(self, repo: IStockPickingRepository) -> None:
         self.repo = repo
 
-    def execute(self, picking_id: int) -> None:
-        existing = self.repo.get_by_id(picking_id)
-        if not existing:
+    def execute(self, picking_id: int, expected_updated_at: datetime | None = None) -> None:
+        if not self.repo.delete(picking_id, expected_updated_at):
             raise NotFoundError("Picking no encontrado")
-        self.repo.delete(picking_id)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from domain.repositories.stock_quant_package_repository import IStockQuantPackageRepository
 from application.exceptions import NotFoundError
 
@@ -6,8 +7,6 @@ class DeleteStockQuantPackage:
     def __init__(self, repo: IStockQuantPackageRepository) -> None:
         self.repo = repo
 
-    def execute(self, package_id: int) -> None:
-        existing = self.repo.get_by_id(package_id)
-        if not existing:
+    def execute(self, package_id: int, expected_updated_at: datetime | None = None) -> None:
+        if not self.repo.delete(package_id, expected_updated_at):
             raise NotFoundError("Paquete no encontrado")
-        self.repo.delete(package_id)
@@ -0,0 +1,15 @@
+from collections.abc import Iterator
+from domain.repositories.stock_quant_package_repository import IStockQuantPackageRepository
+from application.dtos.stock_quant_package_dto import StockQuantPackageDTO
+from application.use_cases._mappers import to_quant_package_dto
+
+
+class ExportStockQuantPackages:
+    def __init__(self, repo: IStockQuantPackageRepository) -> None:
+        self.repo = repo
+
+    def execute(
+        self, picking_id: int | None = None, package_type_id: int | None = None
+    ) -> Iterator[StockQuantPackageDTO]:
+        for package in self.repo.stream(picking_id=picking_id, package_type_id=package_type_id):
+            yield to_quant_package_dto(package)
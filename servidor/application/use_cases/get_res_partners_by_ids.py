@@ -0,0 +1,16 @@
+from domain.repositories.res_partner_repository import IResPartnerRepository
+from application.dtos.lookup_result_dto import LookupResultDTO
+from application.dtos.res_partner_dto import ResPartnerDTO
+from application.use_cases._mappers import to_partner_dto
+
+
+class GetResPartnersByIds:
+    def __init__(self, repo: IResPartnerRepository) -> None:
+        self.repo = repo
+
+    def execute(self, partner_ids: list[int]) -> list[LookupResultDTO[ResPartnerDTO]]:
+        found = {p.id: to_partner_dto(p) for p in self.repo.get_many(partner_ids)}
+        return [
+            LookupResultDTO(id=partner_id, item=found.get(partner_id))
+            for partner_id in partner_ids
+        ]
@@ -0,0 +1,16 @@
+from domain.repositories.stock_package_type_repository import IStockPackageTypeRepository
+from application.dtos.lookup_result_dto import LookupResultDTO
+from application.dtos.stock_package_type_dto import StockPackageTypeDTO
+from application.use_cases._mappers import to_package_type_dto
+
+
+class GetStockPackageTypesByIds:
+    def __init__(self, repo: IStockPackageTypeRepository) -> None:
+        self.repo = repo
+
+    def execute(self, package_type_ids: list[int]) -> list[LookupResultDTO[StockPackageTypeDTO]]:
+        found = {p.id: to_package_type_dto(p) for p in self.repo.get_many(package_type_ids)}
+        return [
+            LookupResultDTO(id=package_type_id, item=found.get(package_type_id))
+            for package_type_id in package_type_ids
+        ]
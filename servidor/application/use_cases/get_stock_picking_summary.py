@@ -0,0 +1,22 @@
+from domain.repositories.stock_picking_repository import IStockPickingRepository
+from domain.repositories.stock_quant_package_repository import IStockQuantPackageRepository
+from domain.value_objects.picking_weight_summary import PickingWeightSummary
+from application.dtos.picking_weight_summary_dto import PickingWeightSummaryDTO
+from application.use_cases._mappers import to_picking_summary_dto
+from application.exceptions import NotFoundError
+
+
+class GetStockPickingSummary:
+    def __init__(
+        self, pickings: IStockPickingRepository, packages: IStockQuantPackageRepository
+    ) -> None:
+        self.pickings = pickings
+        self.packages = packages
+
+    def execute(self, picking_id: int) -> PickingWeightSummaryDTO:
+        summary = self.packages.summarize_by_picking(picking_id)
+        if summary is None:
+            if not self.pickings.get_by_id(picking_id):
+                raise NotFoundError("Picking no encontrado")
+            summary = PickingWeightSummary(picking_id=picking_id)
+        return to_picking_summary_dto(summary)
@@ -0,0 +1,16 @@
+from domain.repositories.stock_picking_repository import IStockPickingRepository
+from application.dtos.lookup_result_dto import LookupResultDTO
+from application.dtos.stock_picking_dto import StockPickingDTO
+from application.use_cases._mappers import to_picking_dto
+
+
+class GetStockPickingsByIds:
+    def __init__(self, repo: IStockPickingRepository) -> None:
+        self.repo = repo
+
+    def execute(self, picking_ids: list[int]) -> list[LookupResultDTO[StockPickingDTO]]:
+        found = {p.id: to_picking_dto(p) for p in self.repo.get_many(picking_ids)}
+        return [
+            LookupResultDTO(id=picking_id, item=found.get(picking_id))
+            for picking_id in picking_ids
+        ]
@@ -0,0 +1,16 @@
+from domain.repositories.stock_quant_package_repository import IStockQuantPackageRepository
+from application.dtos.lookup_result_dto import LookupResultDTO
+from application.dtos.stock_quant_package_dto import StockQuantPackageDTO
+from application.use_cases._mappers import to_quant_package_dto
+
+
+class GetStockQuantPackagesByIds:
+    def __init__(self, repo: IStockQuantPackageRepository) -> None:
+        self.repo = repo
+
+    def execute(self, package_ids: list[int]) -> list[LookupResultDTO[StockQuantPackageDTO]]:
+        found = {p.id: to_quant_package_dto(p) for p in self.repo.get_many(package_ids)}
+        return [
+            LookupResultDTO(id=package_id, item=found.get(package_id))
+            for package_id in package_ids
+        ]
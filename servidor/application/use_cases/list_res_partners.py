@@ -1,4 +1,5 @@
 from domain.repositories.res_partner_repository import IResPartnerRepository
+from domain.value_objects.res_partner_filter import ResPartnerFilter
 from application.dtos.res_partner_dto import ResPartnerDTO
 from application.use_cases._mappers import to_partner_dto
 
@@ -7,6 +8,16 @@ class ListResPartners:
     def __init__(self, repo: IResPartnerRepository) -> None:
         self.repo = repo
 
-    def execute(self, limit: int, offset: int) -> list[ResPartnerDTO]:
-        partners = self.repo.list(limit=limit, offset=offset)
+    def execute(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        name_prefix: str | None = None,
+    ) -> list[ResPartnerDTO]:
+        filters = ResPartnerFilter(name_prefix=name_prefix)
+        partners = self.repo.list(
+            limit=limit, offset=offset, after_id=after_id, before_id=before_id, filters=filters
+        )
         return [to_partner_dto(p) for p in partners]
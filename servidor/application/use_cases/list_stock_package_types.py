@@ -1,4 +1,5 @@
 from domain.repositories.stock_package_type_repository import IStockPackageTypeRepository
+from domain.value_objects.stock_package_type_filter import StockPackageTypeFilter
 from application.dtos.stock_package_type_dto import StockPackageTypeDTO
 from application.use_cases._mappers import to_package_type_dto
 
@@ -7,6 +8,16 @@ class ListStockPackageTypes:
     def __init__(self, repo: IStockPackageTypeRepository) -> None:
         self.repo = repo
 
-    def execute(self, limit: int, offset: int) -> list[StockPackageTypeDTO]:
-        package_types = self.repo.list(limit=limit, offset=offset)
+    def execute(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        name_prefix: str | None = None,
+    ) -> list[StockPackageTypeDTO]:
+        filters = StockPackageTypeFilter(name_prefix=name_prefix)
+        package_types = self.repo.list(
+            limit=limit, offset=offset, after_id=after_id, before_id=before_id, filters=filters
+        )
         return [to_package_type_dto(p) for p in package_types]
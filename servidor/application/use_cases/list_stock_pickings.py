@@ -1,4 +1,5 @@
 from domain.repositories.stock_picking_repository import IStockPickingRepository
+from domain.value_objects.stock_picking_filter import StockPickingFilter
 from application.dtos.stock_picking_dto import StockPickingDTO
 from application.use_cases._mappers import to_picking_dto
 
@@ -7,6 +8,17 @@ class ListStockPickings:
     def __init__(self, repo: IStockPickingRepository) -> None:
         self.repo = repo
 
-    def execute(self, limit: int, offset: int) -> list[StockPickingDTO]:
-        pickings = self.repo.list(limit=limit, offset=offset)
+    def execute(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        partner_id: int | None = None,
+        name_prefix: str | None = None,
+    ) -> list[StockPickingDTO]:
+        filters = StockPickingFilter(partner_id=partner_id, name_prefix=name_prefix)
+        pickings = self.repo.list(
+            limit=limit, offset=offset, after_id=after_id, before_id=before_id, filters=filters
+        )
         return [to_picking_dto(p) for p in pickings]
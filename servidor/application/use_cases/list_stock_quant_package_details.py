@@ -0,0 +1,39 @@
+from domain.repositories.stock_quant_package_repository import IStockQuantPackageRepository
+from domain.value_objects.stock_quant_package_filter import StockQuantPackageFilter
+from application.dtos.stock_quant_package_detail_dto import StockQuantPackageDetailDTO
+from application.use_cases._mappers import to_quant_package_detail_dto
+
+
+class ListStockQuantPackageDetails:
+    def __init__(self, repo: IStockQuantPackageRepository) -> None:
+        self.repo = repo
+
+    def execute(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        with_package_type: bool = False,
+        with_picking: bool = False,
+        picking_id: int | None = None,
+        package_type_id: int | None = None,
+        min_weight: float | None = None,
+        max_weight: float | None = None,
+    ) -> list[StockQuantPackageDetailDTO]:
+        filters = StockQuantPackageFilter(
+            picking_id=picking_id,
+            package_type_id=package_type_id,
+            min_weight=min_weight,
+            max_weight=max_weight,
+        )
+        details = self.repo.list_details(
+            limit=limit,
+            offset=offset,
+            after_id=after_id,
+            before_id=before_id,
+            with_package_type=with_package_type,
+            with_picking=with_picking,
+            filters=filters,
+        )
+        return [to_quant_package_detail_dto(d) for d in details]
@@ -1,4 +1,5 @@
 from domain.repositories.stock_quant_package_repository import IStockQuantPackageRepository
+from domain.value_objects.stock_quant_package_filter import StockQuantPackageFilter
 from application.dtos.stock_quant_package_dto import StockQuantPackageDTO
 from application.use_cases._mappers import to_quant_package_dto
 
@@ -7,6 +8,24 @@ class ListStockQuantPackages:
     def __init__(self, repo: IStockQuantPackageRepository) -> None:
         self.repo = repo
 
-    def execute(self, limit: int, offset: int) -> list[StockQuantPackageDTO]:
-        packages = self.repo.list(limit=limit, offset=offset)
+    def execute(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        picking_id: int | None = None,
+        package_type_id: int | None = None,
+        min_weight: float | None = None,
+        max_weight: float | None = None,
+    ) -> list[StockQuantPackageDTO]:
+        filters = StockQuantPackageFilter(
+            picking_id=picking_id,
+            package_type_id=package_type_id,
+            min_weight=min_weight,
+            max_weight=max_weight,
+        )
+        packages = self.repo.list(
+            limit=limit, offset=offset, after_id=after_id, before_id=before_id, filters=filters
+        )
         return [to_quant_package_dto(p) for p in packages]
@@ -1,3 +1,4 @@
+from datetime import datetime
 from domain.entities.res_partner import ResPartner
 from domain.repositories.res_partner_repository import IResPartnerRepository
 from application.dtos.res_partner_dto import ResPartnerDTO
@@ -10,16 +11,20 @@ class UpdateResPartner:
         self.repo = repo
 
     def execute(
-        self, partner_id: int, name: str | None = None, email: str | None = None, phone: str | None = None
+        self,
+        partner_id: int,
+        name: str | None = None,
+        email: str | None = None,
+        phone: str | None = None,
+        expected_updated_at: datetime | None = None,
     ) -> ResPartnerDTO:
-        existing = self.repo.get_by_id(partner_id)
-        if not existing:
+        sent = {
+            "name": name,
+            "email": email,
+            "phone": phone,
+        }
+        changes = ResPartner.validate_changes(**{k: v for k, v in sent.items() if v is not None})
+        updated = self.repo.update_fields(partner_id, changes, expected_updated_at)
+        if updated is None:
             raise NotFoundError("Partner no encontrado")
-        partner = ResPartner(
-            id=partner_id,
-            name=name if name is not None else existing.name,
-            email=email if email is not None else existing.email,
-            phone=phone if phone is not None else existing.phone,
-        )
-        updated = self.repo.update(partner)
         return to_partner_dto(updated)
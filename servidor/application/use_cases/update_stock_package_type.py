@@ -1,3 +1,4 @@
+from datetime import datetime
 from domain.entities.stock_package_type import StockPackageType
 from domain.repositories.stock_package_type_repository import IStockPackageTypeRepository
 from application.dtos.stock_package_type_dto import StockPackageTypeDTO
@@ -9,14 +10,19 @@ class UpdateStockPackageType:
     def __init__(self, repo: IStockPackageTypeRepository) -> None:
         self.repo = repo
 
-    def execute(self, package_type_id: int, name: str | None = None, weight: float | None = None) -> StockPackageTypeDTO:
-        existing = self.repo.get_by_id(package_type_id)
-        if not existing:
+    def execute(
+        self,
+        package_type_id: int,
+        name: str | None = None,
+        weight: float | None = None,
+        expected_updated_at: datetime | None = None,
+    ) -> StockPackageTypeDTO:
+        sent = {
+            "name": name,
+            "weight": weight,
+        }
+        changes = StockPackageType.validate_changes(**{k: v for k, v in sent.items() if v is not None})
+        updated = self.repo.update_fields(package_type_id, changes, expected_updated_at)
+        if updated is None:
             raise NotFoundError("Tipo de paquete no encontrado")
-        package_type = StockPackageType(
-            id=package_type_id,
-            name=name if name is not None else existing.name,
-            weight=weight if weight is not None else existing.weight,
-        )
-        updated = self.repo.update(package_type)
         return to_package_type_dto(updated)
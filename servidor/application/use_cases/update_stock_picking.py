@@ -1,3 +1,4 @@
+from datetime import datetime
 from domain.entities.stock_picking import StockPicking
 from domain.repositories.stock_picking_repository import IStockPickingRepository
 from application.dtos.stock_picking_dto import StockPickingDTO
@@ -9,14 +10,19 @@ class UpdateStockPicking:
     def __init__(self, repo: IStockPickingRepository) -> None:
         self.repo = repo
 
-    def execute(self, picking_id: int, name: str | None = None, partner_id: int | None = None) -> StockPickingDTO:
-        existing = self.repo.get_by_id(picking_id)
-        if not existing:
+    def execute(
+        self,
+        picking_id: int,
+        name: str | None = None,
+        partner_id: int | None = None,
+        expected_updated_at: datetime | None = None,
+    ) -> StockPickingDTO:
+        sent = {
+            "name": name,
+            "partner_id": partner_id,
+        }
+        changes = StockPicking.validate_changes(**{k: v for k, v in sent.items() if v is not None})
+        updated = self.repo.update_fields(picking_id, changes, expected_updated_at)
+        if updated is None:
             raise NotFoundError("Picking no encontrado")
-        picking = StockPicking(
-            id=picking_id,
-            name=name if name is not None else existing.name,
-            partner_id=partner_id if partner_id is not None else existing.partner_id,
-        )
-        updated = self.repo.update(picking)
         return to_picking_dto(updated)
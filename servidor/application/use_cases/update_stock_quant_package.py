@@ -1,3 +1,4 @@
+from datetime import datetime
 from domain.entities.stock_quant_package import StockQuantPackage
 from domain.repositories.stock_quant_package_repository import IStockQuantPackageRepository
 from application.dtos.stock_quant_package_dto import StockQuantPackageDTO
@@ -16,16 +17,16 @@ class UpdateStockQuantPackage:
         package_type_id: int | None = None,
         shipping_weight: float | None = None,
         picking_id: int | None = None,
+        expected_updated_at: datetime | None = None,
     ) -> StockQuantPackageDTO:
-        existing = self.repo.get_by_id(package_id)
-        if not existing:
+        sent = {
+            "name": name,
+            "package_type_id": package_type_id,
+            "shipping_weight": shipping_weight,
+            "picking_id": picking_id,
+        }
+        changes = StockQuantPackage.validate_changes(**{k: v for k, v in sent.items() if v is not None})
+        updated = self.repo.update_fields(package_id, changes, expected_updated_at)
+        if updated is None:
             raise NotFoundError("Paquete no encontrado")
-        package = StockQuantPackage(
-            id=package_id,
-            name=name if name is not None else existing.name,
-            package_type_id=package_type_id if package_type_id is not None else existing.package_type_id,
-            shipping_weight=shipping_weight if shipping_weight is not None else existing.shipping_weight,
-            picking_id=picking_id if picking_id is not None else existing.picking_id,
-        )
-        updated = self.repo.update(package)
         return to_quant_package_dto(updated)
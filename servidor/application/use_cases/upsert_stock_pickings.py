@@ -0,0 +1,52 @@
+from domain.entities.stock_picking import StockPicking
+from domain.exceptions import ValidationError
+from domain.repositories.res_partner_repository import IResPartnerRepository
+from domain.repositories.stock_picking_repository import IStockPickingRepository
+from application.dtos.stock_picking_dto import StockPickingDTO
+from application.dtos.upsert_result_dto import INSERTED, UPDATED, UpsertResultDTO
+from application.use_cases._mappers import to_picking_dto
+from application.use_cases._references import existing_ids
+
+
+class UpsertStockPickings:
+    def __init__(
+        self, repo: IStockPickingRepository, partners: IResPartnerRepository | None = None
+    ) -> None:
+        self.repo = repo
+        self.partners = partners
+
+    def execute(self, items: list[dict]) -> list[UpsertResultDTO[StockPickingDTO]]:
+        results: list[UpsertResultDTO[StockPickingDTO] | None] = [None] * len(items)
+        parsed: list[tuple[int, StockPicking]] = []
+        for index, item in enumerate(items):
+            try:
+                picking = StockPicking(name=item.get("name", ""), partner_id=item.get("partner_id", 0))
+            except ValidationError as exc:
+                results[index] = UpsertResultDTO(index=index, error=str(exc))
+                continue
+            parsed.append((index, picking))
+
+        # Igual que en UpsertStockQuantPackages: duplicados segun la collation de la
+        # base y partner_id verificado antes de escribir, con error por item.
+        pickings = [picking for _, picking in parsed]
+        matches = self.repo.name_matches([p.name for p in pickings])
+        partner_ids = existing_ids(self.partners, [p.partner_id for p in pickings])
+        valid: list[tuple[int, StockPicking, bool]] = []
+        seen: set[str] = set()
+        for (index, picking), (key, existing_id) in zip(parsed, matches):
+            if key in seen:
+                error = "Referencia duplicada en el lote"
+            elif partner_ids is not None and picking.partner_id not in partner_ids:
+                error = "partner_id inexistente"
+            else:
+                seen.add(key)
+                valid.append((index, picking, existing_id is None))
+                continue
+            results[index] = UpsertResultDTO(index=index, error=error)
+
+        stored = self.repo.upsert_many([picking for _, picking, _ in valid])
+        for (index, _, inserted), picking in zip(valid, stored):
+            results[index] = UpsertResultDTO(
+                index=index, item=to_picking_dto(picking), action=INSERTED if inserted else UPDATED
+            )
+        return results
@@ -0,0 +1,101 @@
+import argparse
+import asyncio
+
+from servidor.app import main as app_main
+from application.ports.async_unit_of_work import IAsyncUnitOfWork
+from infrastructure.db.async_mysql_connection import AsyncMySQLConnectionPool
+from infrastructure.db.async_unit_of_work import AsyncMySQLUnitOfWork
+from infrastructure.db.mysql_connection import MySQLPoolConfig
+from infrastructure.repositories.async_repository_adapter import AsyncRepositoryAdapter
+from servidor.benchmarks.thread_limit import BACKENDS, SlowUoW, measure_rps
+
+
+class SlowAsyncUoW(IAsyncUnitOfWork):
+    # Contraparte de SlowUoW: la latencia es un await y el pool un semaforo del mismo
+    # tamano. Ninguna request ocupa un hilo mientras espera.
+    def __init__(self, data: SlowUoW, pool_size: int, latency: float) -> None:
+        self.slots = asyncio.Semaphore(pool_size)
+        self.latency = latency
+        self.partners = AsyncRepositoryAdapter(data.partners)
+        self.pickings = AsyncRepositoryAdapter(data.pickings)
+        self.package_types = AsyncRepositoryAdapter(data.package_types)
+        self.packages = AsyncRepositoryAdapter(data.packages)
+
+    async def __aenter__(self) -> "SlowAsyncUoW":
+        await self.slots.acquire()
+        await asyncio.sleep(self.latency)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.slots.release()
+
+
+async def _run_sync(
+    backend: str, thread_limit: int, pool_size: int, latency: float, concurrency: int, total: int
+) -> float:
+    pool, app_main.uow_factory, partner_id = BACKENDS[backend](pool_size, latency)
+    app_main.api_async = False
+    app = app_main.create_app()
+    app_main.configure_thread_limit(thread_limit)
+    rps = await measure_rps(app, f"/api/v1/res-partners/{partner_id}", concurrency, total)
+    pool.close()
+    return rps
+
+
+async def _run_async(backend: str, pool_size: int, latency: float, concurrency: int, total: int) -> float:
+    # Los datos (y en mysql el partner) se preparan con el camino sync.
+    sync_pool, sync_factory, partner_id = BACKENDS[backend](pool_size, latency)
+    async_pool = None
+    if backend == "mysql":
+        async_pool = AsyncMySQLConnectionPool(
+            app_main.conn_factory.config, MySQLPoolConfig(max_size=pool_size, timeout=60)
+        )
+        app_main.async_uow_factory = lambda: AsyncMySQLUnitOfWork(async_pool)
+    else:
+        uow = SlowAsyncUoW(sync_factory(), pool_size, latency)
+        app_main.async_uow_factory = lambda: uow
+    app_main.api_async = True
+    app = app_main.create_app()
+    try:
+        rps = await measure_rps(app, f"/api/v1/res-partners/{partner_id}", concurrency, total)
+    finally:
+        if async_pool is not None:
+            await async_pool.close()
+        sync_pool.close()
+    return rps
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="RPS del camino async (API_ASYNC=1) contra el sync")
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default="simulated",
+        help="simulated: latencia fija; mysql: MySQLUnitOfWork vs AsyncMySQLUnitOfWork (aiomysql) sobre .env",
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=50.0, help="latencia simulada de DB por request (solo simulated)"
+    )
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--thread-limits", default="40", help="API_THREAD_LIMIT del camino sync")
+    parser.add_argument("--pool-size", type=int, default=40, help="DB_POOL_MAX_SIZE de ambos caminos")
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    print(
+        f"backend={args.backend} latencia={args.latency_ms}ms concurrencia={args.concurrency} "
+        f"requests={args.requests} DB_POOL_MAX_SIZE={args.pool_size}"
+    )
+    for limit in [int(v) for v in args.thread_limits.split(",")]:
+        rps = asyncio.run(
+            _run_sync(args.backend, limit, args.pool_size, latency, args.concurrency, args.requests)
+        )
+        print(f"sync   API_THREAD_LIMIT={limit:>4}  {rps:8.1f} req/s")
+    rps = asyncio.run(_run_async(args.backend, args.pool_size, latency, args.concurrency, args.requests))
+    print(f"{'async  API_ASYNC=1':<30}{rps:8.1f} req/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,318 @@
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import random
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from servidor.app import main as app_main
+from infrastructure.db.in_memory_unit_of_work import InMemoryUnitOfWork
+
+OPERATIONS = ("create", "get", "list", "update", "delete")
+DEFAULT_MIX = {"get": 50, "list": 20, "create": 15, "update": 10, "delete": 5}
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    values = sorted(latencies)
+    summary = {
+        "count": len(values),
+        "errors": errors,
+        "rps": round(len(values) / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct}_ms"] = round(percentile(values, pct) * 1000, 3)
+    return summary
+
+
+class Seed:
+    def __init__(self, partner_id: int, picking_id: int, package_type_id: int) -> None:
+        self.partner_id = partner_id
+        self.picking_id = picking_id
+        self.package_type_id = package_type_id
+
+
+class Resource:
+    def __init__(self, path: str, payload) -> None:
+        self.path = path
+        self.payload = payload
+        self.ids: list[int] = []
+
+
+def _resources(seed: Seed) -> dict[str, Resource]:
+    return {
+        "res-partners": Resource(
+            "/api/v1/res-partners",
+            lambda name, seed: {"name": name, "email": f"{name}@bench.local"},
+        ),
+        "stock-pickings": Resource(
+            "/api/v1/stock-pickings",
+            lambda name, seed: {"name": name, "partner_id": seed.partner_id},
+        ),
+        "stock-package-types": Resource(
+            "/api/v1/stock-package-types",
+            lambda name, seed: {"name": name, "weight": 1.5},
+        ),
+        "stock-quant-packages": Resource(
+            "/api/v1/stock-quant-packages",
+            lambda name, seed: {
+                "name": name,
+                "package_type_id": seed.package_type_id,
+                "picking_id": seed.picking_id,
+                "shipping_weight": 10.0,
+            },
+        ),
+    }
+
+
+class LoadTest:
+    def __init__(self, client: httpx.AsyncClient, mix: dict[str, int], seed_rows: int, rng_seed: int = 0) -> None:
+        self.client = client
+        self.mix = mix
+        self.seed_rows = seed_rows
+        self.rng = random.Random(rng_seed)
+        self.run_id = f"{int(time.time() * 1000):x}"
+        self.names = itertools.count()
+        self.seed: Seed | None = None
+        self.resources: dict[str, Resource] = {}
+
+    def _name(self, prefix: str) -> str:
+        return f"bench-{self.run_id}-{prefix}-{next(self.names)}"
+
+    async def _create(self, resource: Resource, prefix: str) -> tuple[httpx.Response, int | None]:
+        r = await self.client.post(resource.path, json=resource.payload(self._name(prefix), self.seed))
+        new_id = r.json()["id"] if r.status_code == 201 else None
+        return r, new_id
+
+    async def prepare(self) -> None:
+        partner = await self.client.post("/api/v1/res-partners", json={"name": self._name("seed")})
+        partner.raise_for_status()
+        package_type = await self.client.post(
+            "/api/v1/stock-package-types", json={"name": self._name("seed"), "weight": 1.0}
+        )
+        package_type.raise_for_status()
+        picking = await self.client.post(
+            "/api/v1/stock-pickings", json={"name": self._name("seed"), "partner_id": partner.json()["id"]}
+        )
+        picking.raise_for_status()
+        self.seed = Seed(partner.json()["id"], picking.json()["id"], package_type.json()["id"])
+        self.resources = _resources(self.seed)
+        for name, resource in self.resources.items():
+            for _ in range(self.seed_rows):
+                r, new_id = await self._create(resource, name)
+                r.raise_for_status()
+                resource.ids.append(new_id)
+
+    def _pick_operation(self) -> str:
+        ops = list(self.mix)
+        return self.rng.choices(ops, weights=[self.mix[op] for op in ops])[0]
+
+    async def _call(self, name: str, resource: Resource, op: str) -> bool:
+        if op == "create":
+            r, new_id = await self._create(resource, name)
+            if new_id is not None:
+                resource.ids.append(new_id)
+            return r.status_code == 201
+        if op == "list":
+            r = await self.client.get(resource.path, params={"limit": 20})
+            return r.status_code == 200
+        if not resource.ids:
+            r, new_id = await self._create(resource, name)
+            if new_id is not None:
+                resource.ids.append(new_id)
+            return r.status_code == 201
+        if op == "get":
+            r = await self.client.get(f"{resource.path}/{self.rng.choice(resource.ids)}")
+            return r.status_code == 200
+        if op == "update":
+            target = self.rng.choice(resource.ids)
+            r = await self.client.put(f"{resource.path}/{target}", json={"name": self._name(name)})
+            return r.status_code == 200
+        target = resource.ids.pop(self.rng.randrange(len(resource.ids)))
+        r = await self.client.delete(f"{resource.path}/{target}")
+        return r.status_code == 204
+
+    async def run(self, concurrency: int, total: int) -> dict:
+        latencies: dict[tuple[str, str], list[float]] = {
+            (name, op): [] for name in self.resources for op in OPERATIONS
+        }
+        errors: dict[tuple[str, str], int] = {key: 0 for key in latencies}
+        names = list(self.resources)
+        remaining = itertools.count()
+
+        async def worker() -> None:
+            while next(remaining) < total:
+                name = self.rng.choice(names)
+                op = self._pick_operation()
+                started = time.perf_counter()
+                try:
+                    ok = await self._call(name, self.resources[name], op)
+                except httpx.HTTPError:
+                    ok = False
+                latencies[(name, op)].append(time.perf_counter() - started)
+                if not ok:
+                    errors[(name, op)] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+        all_latencies = [value for values in latencies.values() for value in values]
+        endpoints = {}
+        for (name, op), values in latencies.items():
+            if values:
+                endpoints[f"{name}.{op}"] = summarize(values, errors[(name, op)], elapsed)
+        return {
+            "concurrency": concurrency,
+            "requests": total,
+            "elapsed_s": round(elapsed, 3),
+            "total": summarize(all_latencies, sum(errors.values()), elapsed),
+            "endpoints": endpoints,
+        }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def _client(backend: str, base_url: str | None) -> httpx.AsyncClient:
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url, timeout=30.0)
+    if backend == "memory":
+        uow = InMemoryUnitOfWork()
+        app_main.uow_factory = lambda: uow
+    app = app_main.create_app()
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=30.0)
+
+
+async def run_suite(
+    backend: str,
+    levels: list[int],
+    requests_per_level: int,
+    mix: dict[str, int] | None = None,
+    seed_rows: int = 50,
+    base_url: str | None = None,
+    rng_seed: int = 0,
+) -> dict:
+    if backend == "mysql" and not base_url:
+        app_main.conn_factory.ensure_schema(app_main.SCRIPTS_DIR)
+    async with _client(backend, base_url) as client:
+        test = LoadTest(client, mix or DEFAULT_MIX, seed_rows, rng_seed)
+        await test.prepare()
+        results = [await test.run(level, requests_per_level) for level in levels]
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "backend": backend if not base_url else base_url,
+            "python": platform.python_version(),
+            "mix": mix or DEFAULT_MIX,
+            "seed_rows": seed_rows,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> list[str]:
+    lines = [f"base={baseline['meta'].get('commit')} actual={current['meta'].get('commit')}"]
+    base_levels = {level["concurrency"]: level for level in baseline["results"]}
+    for level in current["results"]:
+        base = base_levels.get(level["concurrency"])
+        if base is None:
+            continue
+        lines.append(f"concurrencia={level['concurrency']}")
+        for key in ("rps", "p50_ms", "p95_ms", "p99_ms"):
+            before, after = base["total"][key], level["total"][key]
+            delta = (after - before) / before * 100 if before else 0.0
+            lines.append(f"  {key:<7} {before:>10.2f} -> {after:>10.2f}  ({delta:+.1f}%)")
+    return lines
+
+
+def _print_report(report: dict) -> None:
+    meta = report["meta"]
+    print(f"backend={meta['backend']} commit={meta['commit']}")
+    for level in report["results"]:
+        total = level["total"]
+        print(
+            f"\nconcurrencia={level['concurrency']} requests={level['requests']} "
+            f"rps={total['rps']} p50={total['p50_ms']}ms p95={total['p95_ms']}ms "
+            f"p99={total['p99_ms']}ms errores={total['errors']}"
+        )
+        for name, row in sorted(level["endpoints"].items()):
+            print(
+                f"  {name:<34} n={row['count']:>5} p50={row['p50_ms']:>8.2f} "
+                f"p95={row['p95_ms']:>8.2f} p99={row['p99_ms']:>8.2f} err={row['errors']}"
+            )
+
+
+def _parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        op, _, weight = part.partition("=")
+        if op not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"operacion desconocida: {op}")
+        mix[op] = int(weight)
+    return mix
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Carga y latencia de los routers /api/v1/*")
+    parser.add_argument("--backend", choices=("memory", "mysql"), default="memory")
+    parser.add_argument("--base-url", help="apunta a un servidor ya levantado en vez de la app en proceso")
+    parser.add_argument("--concurrency", default="1,10,50", help="niveles de concurrencia separados por coma")
+    parser.add_argument("--requests", type=int, default=2000, help="requests por nivel")
+    parser.add_argument("--seed-rows", type=int, default=50, help="filas iniciales por recurso")
+    parser.add_argument("--mix", type=_parse_mix, default=None, help="ej: get=50,list=20,create=15,update=10,delete=5")
+    parser.add_argument("--rng-seed", type=int, default=0)
+    parser.add_argument("--output", help="guarda el resultado como JSON")
+    parser.add_argument("--compare", help="JSON de una corrida anterior para comparar")
+    args = parser.parse_args()
+
+    report = asyncio.run(
+        run_suite(
+            args.backend,
+            [int(v) for v in args.concurrency.split(",")],
+            args.requests,
+            mix=args.mix,
+            seed_rows=args.seed_rows,
+            base_url=args.base_url,
+            rng_seed=args.rng_seed,
+        )
+    )
+    _print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print()
+        print("\n".join(compare(baseline, report)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
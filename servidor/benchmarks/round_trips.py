@@ -0,0 +1,89 @@
+import argparse
+import time
+
+from servidor.app import main as app_main
+from domain.entities.res_partner import ResPartner
+from domain.entities.stock_picking import StockPicking
+from infrastructure.db.instrumentation import QueryStats, current_query_stats
+from infrastructure.db.unit_of_work import MySQLUnitOfWork
+from servidor.benchmarks.load_test import percentile
+
+
+def _legacy_update(uow: MySQLUnitOfWork, picking_id: int, name: str) -> None:
+    existing = uow.pickings.get_by_id(picking_id)
+    uow.pickings.update(StockPicking(id=picking_id, name=name, partner_id=existing.partner_id))
+
+
+def _single_update(uow: MySQLUnitOfWork, picking_id: int, name: str) -> None:
+    uow.pickings.update_fields(picking_id, StockPicking.validate_changes(name=name))
+
+
+def _legacy_delete(uow: MySQLUnitOfWork, picking_id: int) -> None:
+    uow.pickings.get_by_id(picking_id)
+    uow.pickings.delete(picking_id)
+
+
+def _single_delete(uow: MySQLUnitOfWork, picking_id: int) -> None:
+    uow.pickings.delete(picking_id)
+
+
+def _measure(uow_factory, operation, ids: list[int]) -> dict:
+    latencies: list[float] = []
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        for picking_id in ids:
+            started = time.perf_counter()
+            with uow_factory() as uow:
+                operation(uow, picking_id)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        current_query_stats.reset(token)
+    values = sorted(latencies)
+    return {
+        "queries_per_op": round(stats.queries / len(ids), 2) if ids else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+    }
+
+
+def run(rows: int) -> dict[str, dict]:
+    app_main.conn_factory.ensure_schema(app_main.SCRIPTS_DIR)
+    app_main.conn_pool.fill()
+    uow_factory = lambda: MySQLUnitOfWork(app_main.conn_pool)  # noqa: E731
+    run_id = f"{int(time.time() * 1000):x}"
+    with uow_factory() as uow:
+        partner = uow.partners.create(ResPartner(name=f"rt-{run_id}"))
+        ids = [
+            uow.pickings.create(StockPicking(name=f"rt-{run_id}-{i}", partner_id=partner.id)).id
+            for i in range(rows * 2)
+        ]
+    legacy_ids, single_ids = ids[:rows], ids[rows:]
+    try:
+        return {
+            "update (get + UPDATE)": _measure(
+                uow_factory, lambda uow, i: _legacy_update(uow, i, f"rt-{run_id}-a{i}"), legacy_ids
+            ),
+            "update (UPDATE + SELECT)": _measure(
+                uow_factory, lambda uow, i: _single_update(uow, i, f"rt-{run_id}-b{i}"), single_ids
+            ),
+            "delete (get + DELETE)": _measure(uow_factory, _legacy_delete, legacy_ids),
+            "delete (DELETE + rowcount)": _measure(uow_factory, _single_delete, single_ids),
+        }
+    finally:
+        with uow_factory() as uow:
+            uow.partners.delete(partner.id)
+        app_main.conn_pool.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Round trips y latencia de update/delete contra MySQL")
+    parser.add_argument("--rows", type=int, default=500, help="pickings por variante")
+    args = parser.parse_args()
+    for name, row in run(args.rows).items():
+        print(f"{name:<28} queries/op={row['queries_per_op']:<5} p50={row['p50_ms']:>8.3f}ms p95={row['p95_ms']:>8.3f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+from contextlib import contextmanager
+import os
+import statistics
+import time
+
+import httpx
+
+from servidor.app import main as app_main
+from servidor.app.compression import brotli
+from servidor.app.json_response import orjson
+from domain.entities.res_partner import ResPartner
+from domain.entities.stock_package_type import StockPackageType
+from domain.entities.stock_picking import StockPicking
+from domain.entities.stock_quant_package import StockQuantPackage
+from infrastructure.db.in_memory_unit_of_work import InMemoryUnitOfWork
+
+PATHS = {
+    "list": "/api/v1/stock-quant-packages?limit={rows}",
+    "list+expand": "/api/v1/stock-quant-packages?limit={rows}&expand=package_type,picking",
+    "export": "/api/v1/stock-quant-packages/export",
+}
+
+
+@contextmanager
+def _env(**values: str):
+    previous = {key: os.environ.get(key) for key in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _seed(rows: int) -> InMemoryUnitOfWork:
+    uow = InMemoryUnitOfWork()
+    partner = uow.partners.create(ResPartner(name="Bench"))
+    package_type = uow.package_types.create(StockPackageType(name="Caja estandar", weight=0.35))
+    pickings = [uow.pickings.create(StockPicking(name=f"WH/OUT/{i:05d}", partner_id=partner.id)) for i in range(20)]
+    for i in range(rows):
+        uow.packages.create(
+            StockQuantPackage(
+                name=f"PACK{i:07d}",
+                package_type_id=package_type.id,
+                shipping_weight=round(1.5 + i % 97 * 0.25, 2),
+                picking_id=pickings[i % len(pickings)].id,
+            )
+        )
+    return uow
+
+
+def _variants() -> list[tuple[str, dict[str, str], str]]:
+    variants = [("json", {"API_JSON_RESPONSE": "default", "API_COMPRESSION": "off"}, "identity")]
+    if orjson is not None:
+        variants.append(("orjson", {"API_JSON_RESPONSE": "orjson", "API_COMPRESSION": "off"}, "identity"))
+    variants.append(("json+gzip", {"API_JSON_RESPONSE": "default", "API_COMPRESSION": "gzip"}, "gzip"))
+    if brotli is not None:
+        variants.append(("json+br", {"API_JSON_RESPONSE": "default", "API_COMPRESSION": "br"}, "br"))
+    return variants
+
+
+async def _measure_kind(apps: dict[str, tuple], path: str, iterations: int) -> dict[str, dict]:
+    clients = {
+        name: httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+        for name, (app, _) in apps.items()
+    }
+    results: dict[str, dict] = {}
+    cpu: dict[str, list[float]] = {name: [] for name in apps}
+    try:
+        for name, (_, encoding) in apps.items():
+            r = await clients[name].get(path, headers={"Accept-Encoding": encoding})
+            r.raise_for_status()
+            results[name] = {"body_bytes": len(r.content), "wire_bytes": r.num_bytes_downloaded}
+        # Variantes intercaladas: el ruido del scheduler se reparte entre todas.
+        for _ in range(iterations):
+            for name, (_, encoding) in apps.items():
+                started = time.process_time()
+                (await clients[name].get(path, headers={"Accept-Encoding": encoding})).raise_for_status()
+                cpu[name].append(time.process_time() - started)
+    finally:
+        for client in clients.values():
+            await client.aclose()
+    for name, values in cpu.items():
+        results[name]["cpu_ms"] = round(statistics.median(values) * 1000, 3)
+    return results
+
+
+def run(rows: int = 1000, iterations: int = 50) -> dict[str, dict[str, dict]]:
+    uow = _seed(rows)
+    app_main.uow_factory = lambda: uow
+    apps = {}
+    for name, env, encoding in _variants():
+        with _env(**env):
+            apps[name] = (app_main.create_app(), encoding)
+    return {
+        kind: asyncio.run(_measure_kind(apps, path.format(rows=rows), iterations))
+        for kind, path in PATHS.items()
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bytes y CPU por pagina segun serializador y compresion")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    for kind, variants in run(args.rows, args.iterations).items():
+        print(f"\n{kind} ({args.rows} filas)")
+        base = variants["json"]["wire_bytes"]
+        for name, row in variants.items():
+            print(
+                f"  {name:<10} wire={row['wire_bytes']:>9}B ({row['wire_bytes'] / base:6.1%}) "
+                f"cpu p50={row['cpu_ms']:>8.3f}ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from servidor.app import main as app_main
+from application.ports.unit_of_work import IUnitOfWork
+from domain.entities.res_partner import ResPartner
+from infrastructure.db.mysql_connection import MySQLConnectionPool, MySQLPoolConfig
+from infrastructure.db.unit_of_work import MySQLUnitOfWork
+from infrastructure.repositories.in_memory_res_partner_repository import InMemoryResPartnerRepository
+from infrastructure.repositories.in_memory_stock_picking_repository import InMemoryStockPickingRepository
+from infrastructure.repositories.in_memory_stock_package_type_repository import InMemoryStockPackageTypeRepository
+from infrastructure.repositories.in_memory_stock_quant_package_repository import InMemoryStockQuantPackageRepository
+
+
+class SimulatedConnection:
+    open = True
+
+    def ping(self, reconnect: bool = False) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class SimulatedFactory:
+    def connect(self) -> SimulatedConnection:
+        return SimulatedConnection()
+
+
+class SlowUoW(IUnitOfWork):
+    # Retiene una conexion del pool real durante la latencia simulada, igual que
+    # MySQLUnitOfWork: con mas hilos que conexiones, los de mas esperan en acquire().
+    def __init__(self, pool: MySQLConnectionPool, latency: float) -> None:
+        self.pool = pool
+        self.latency = latency
+        self.connection = None
+        self.partners = InMemoryResPartnerRepository()
+        self.pickings = InMemoryStockPickingRepository()
+        self.package_types = InMemoryStockPackageTypeRepository()
+        self.packages = InMemoryStockQuantPackageRepository()
+        self.partners.create(ResPartner(name="Bench"))
+
+    def __enter__(self) -> "SlowUoW":
+        self.connection = self.pool.acquire()
+        time.sleep(self.latency)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.pool.release(self.connection)
+
+
+def _simulated(pool_size: int, latency: float):
+    pool = MySQLConnectionPool(SimulatedFactory(), MySQLPoolConfig(max_size=pool_size, timeout=60))
+    # Una sola instancia: los repositorios en memoria no guardan estado por request.
+    uow = SlowUoW(pool, latency)
+    return pool, lambda: uow, 1
+
+
+def _mysql(pool_size: int, latency: float):
+    app_main.conn_factory.ensure_schema(app_main.SCRIPTS_DIR)
+    pool = MySQLConnectionPool(app_main.conn_factory, MySQLPoolConfig(max_size=pool_size, timeout=60))
+    with MySQLUnitOfWork(pool) as uow:
+        partner = uow.partners.create(ResPartner(name="Bench"))
+    return pool, lambda: MySQLUnitOfWork(pool), partner.id
+
+
+async def measure_rps(app, path: str, concurrency: int, total: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def _one() -> None:
+            async with semaphore:
+                r = await client.get(path)
+                r.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_one() for _ in range(total)))
+        elapsed = time.perf_counter() - started
+    return total / elapsed
+
+
+async def _run(
+    backend: str, thread_limit: int, pool_size: int, latency: float, concurrency: int, total: int
+) -> float:
+    pool, app_main.uow_factory, partner_id = BACKENDS[backend](pool_size, latency)
+    app = app_main.create_app()
+    app_main.configure_thread_limit(thread_limit)
+    rps = await measure_rps(app, f"/api/v1/res-partners/{partner_id}", concurrency, total)
+    pool.close()
+    return rps
+
+
+BACKENDS = {"simulated": _simulated, "mysql": _mysql}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="RPS del camino sync segun API_THREAD_LIMIT y DB_POOL_MAX_SIZE")
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default="simulated",
+        help="simulated: latencia fija con el pool real; mysql: MySQLUnitOfWork sobre la base de .env",
+    )
+    parser.add_argument(
+        "--latency-ms", type=float, default=50.0, help="latencia simulada de DB por request (solo simulated)"
+    )
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--thread-limits", default="40,100,200")
+    parser.add_argument(
+        "--pool-size", type=int, default=0, help="DB_POOL_MAX_SIZE fijo; 0 = igual a cada API_THREAD_LIMIT"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"backend={args.backend} latencia={args.latency_ms}ms "
+        f"concurrencia={args.concurrency} requests={args.requests}"
+    )
+    for limit in [int(v) for v in args.thread_limits.split(",")]:
+        pool_size = args.pool_size or limit
+        rps = asyncio.run(
+            _run(args.backend, limit, pool_size, args.latency_ms / 1000, args.concurrency, args.requests)
+        )
+        print(f"API_THREAD_LIMIT={limit:>4}  DB_POOL_MAX_SIZE={pool_size:>4}  {rps:8.1f} req/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,12 @@
+from typing import ClassVar
+
+
+class PartialUpdateMixin:
+    # Valores validos de relleno para los campos obligatorios que no se envian.
+    PLACEHOLDERS: ClassVar[dict] = {}
+
+    @classmethod
+    def validate_changes(cls, **changes) -> dict:
+        # Valida solo los campos enviados con las reglas de la entidad.
+        entity = cls(**{**cls.PLACEHOLDERS, **changes})
+        return {field: getattr(entity, field) for field in changes}
@@ -1,12 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import ClassVar
 from domain.exceptions import ValidationError
+from domain.entities._partial_update import PartialUpdateMixin
 
 
 @dataclass
-class StockPackageType:
+class StockPackageType(PartialUpdateMixin):
+    PLACEHOLDERS: ClassVar[dict] = {"name": "-"}
+
     name: str
     weight: float = 0.0
     id: int | None = None
+    updated_at: datetime | None = field(default=None, compare=False)
 
     def __post_init__(self) -> None:
         name = self.name.strip() if self.name else ""
@@ -1,14 +1,20 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import ClassVar
 from domain.exceptions import ValidationError
+from domain.entities._partial_update import PartialUpdateMixin
 
 
 @dataclass
-class StockQuantPackage:
+class StockQuantPackage(PartialUpdateMixin):
+    PLACEHOLDERS: ClassVar[dict] = {"name": "-", "package_type_id": 1, "picking_id": 1}
+
     name: str
     package_type_id: int
     shipping_weight: float = 0.0
     picking_id: int = 0
     id: int | None = None
+    updated_at: datetime | None = field(default=None, compare=False)
 
     def __post_init__(self) -> None:
         name = self.name.strip() if self.name else ""
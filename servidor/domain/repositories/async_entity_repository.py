@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+# Operaciones del camino async (API_ASYNC=1): alta y lectura por id de cada entidad.
+# El resto de los endpoints sigue en los repositorios sync.
+class IAsyncEntityRepository(ABC, Generic[T]):
+    @abstractmethod
+    async def create(self, entity: T) -> T: ...
+
+    @abstractmethod
+    async def get_by_id(self, entity_id: int) -> T | None: ...
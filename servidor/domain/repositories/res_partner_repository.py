@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from domain.entities.res_partner import ResPartner
+from domain.value_objects.res_partner_filter import ResPartnerFilter
 
 
 class IResPartnerRepository(ABC):
@@ -10,10 +12,25 @@ class IResPartnerRepository(ABC):
     def update(self, partner: ResPartner) -> ResPartner: ...
 
     @abstractmethod
-    def delete(self, partner_id: int) -> None: ...
+    def update_fields(
+        self, partner_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> ResPartner | None: ...
+
+    @abstractmethod
+    def delete(self, partner_id: int, expected_updated_at: datetime | None = None) -> bool: ...
 
     @abstractmethod
     def get_by_id(self, partner_id: int) -> ResPartner | None: ...
 
     @abstractmethod
-    def list(self, limit: int, offset: int) -> list[ResPartner]: ...
+    def get_many(self, partner_ids: list[int]) -> list[ResPartner]: ...
+
+    @abstractmethod
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: ResPartnerFilter | None = None,
+    ) -> list[ResPartner]: ...
@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from domain.entities.stock_package_type import StockPackageType
+from domain.value_objects.stock_package_type_filter import StockPackageTypeFilter
 
 
 class IStockPackageTypeRepository(ABC):
@@ -10,10 +12,25 @@ class IStockPackageTypeRepository(ABC):
     def update(self, package_type: StockPackageType) -> StockPackageType: ...
 
     @abstractmethod
-    def delete(self, package_type_id: int) -> None: ...
+    def update_fields(
+        self, package_type_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> StockPackageType | None: ...
+
+    @abstractmethod
+    def delete(self, package_type_id: int, expected_updated_at: datetime | None = None) -> bool: ...
 
     @abstractmethod
     def get_by_id(self, package_type_id: int) -> StockPackageType | None: ...
 
     @abstractmethod
-    def list(self, limit: int, offset: int) -> list[StockPackageType]: ...
+    def get_many(self, package_type_ids: list[int]) -> list[StockPackageType]: ...
+
+    @abstractmethod
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: StockPackageTypeFilter | None = None,
+    ) -> list[StockPackageType]: ...
@@ -1,19 +1,48 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from domain.entities.stock_picking import StockPicking
+from domain.value_objects.stock_picking_filter import StockPickingFilter
 
 
 class IStockPickingRepository(ABC):
     @abstractmethod
     def create(self, picking: StockPicking) -> StockPicking: ...
 
+    # Clave de comparacion de cada nombre segun el almacenamiento (mayusculas, acentos)
+    # y el id de la fila existente con ese nombre, o None.
+    @abstractmethod
+    def name_matches(self, names: list[str]) -> list[tuple[str, int | None]]: ...
+
+    # Inserta o actualiza por nombre; los nombres no deben repetirse segun name_matches.
+    @abstractmethod
+    def upsert_many(self, pickings: list[StockPicking]) -> list[StockPicking]: ...
+
     @abstractmethod
     def update(self, picking: StockPicking) -> StockPicking: ...
 
     @abstractmethod
-    def delete(self, picking_id: int) -> None: ...
+    def update_fields(
+        self, picking_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> StockPicking | None: ...
+
+    @abstractmethod
+    def delete(self, picking_id: int, expected_updated_at: datetime | None = None) -> bool: ...
 
     @abstractmethod
     def get_by_id(self, picking_id: int) -> StockPicking | None: ...
 
     @abstractmethod
-    def list(self, limit: int, offset: int) -> list[StockPicking]: ...
+    def get_many(self, picking_ids: list[int]) -> list[StockPicking]: ...
+
+    @abstractmethod
+    def get_by_name(self, name: str) -> StockPicking | None: ...
+
+    @abstractmethod
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: StockPickingFilter | None = None,
+    ) -> list[StockPicking]: ...
@@ -1,22 +1,74 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from collections.abc import Iterator
 from domain.entities.stock_quant_package import StockQuantPackage
+from domain.value_objects.stock_quant_package_filter import StockQuantPackageFilter
+from domain.value_objects.picking_weight_summary import PickingWeightSummary
+from domain.value_objects.stock_quant_package_detail import StockQuantPackageDetail
 
 
 class IStockQuantPackageRepository(ABC):
     @abstractmethod
     def create(self, package: StockQuantPackage) -> StockQuantPackage: ...
 
+    @abstractmethod
+    def create_many(self, packages: list[StockQuantPackage]) -> list[StockQuantPackage]: ...
+
+    # Clave de comparacion de cada nombre segun el almacenamiento (mayusculas, acentos)
+    # y el id de la fila existente con ese nombre, o None.
+    @abstractmethod
+    def name_matches(self, names: list[str]) -> list[tuple[str, int | None]]: ...
+
+    # Inserta o actualiza por nombre; los nombres no deben repetirse segun name_matches.
+    @abstractmethod
+    def upsert_many(self, packages: list[StockQuantPackage]) -> list[StockQuantPackage]: ...
+
     @abstractmethod
     def update(self, package: StockQuantPackage) -> StockQuantPackage: ...
 
     @abstractmethod
-    def delete(self, package_id: int) -> None: ...
+    def update_fields(
+        self, package_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> StockQuantPackage | None: ...
+
+    @abstractmethod
+    def delete(self, package_id: int, expected_updated_at: datetime | None = None) -> bool: ...
 
     @abstractmethod
     def get_by_id(self, package_id: int) -> StockQuantPackage | None: ...
 
+    @abstractmethod
+    def get_many(self, package_ids: list[int]) -> list[StockQuantPackage]: ...
+
     @abstractmethod
     def get_by_name(self, name: str) -> StockQuantPackage | None: ...
 
     @abstractmethod
-    def list(self, limit: int, offset: int) -> list[StockQuantPackage]: ...
+    def list_details(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        with_package_type: bool = False,
+        with_picking: bool = False,
+        filters: StockQuantPackageFilter | None = None,
+    ) -> list[StockQuantPackageDetail]: ...
+
+    @abstractmethod
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: StockQuantPackageFilter | None = None,
+    ) -> list[StockQuantPackage]: ...
+
+    @abstractmethod
+    def stream(
+        self, picking_id: int | None = None, package_type_id: int | None = None
+    ) -> Iterator[StockQuantPackage]: ...
+
+    @abstractmethod
+    def summarize_by_picking(self, picking_id: int) -> PickingWeightSummary | None: ...
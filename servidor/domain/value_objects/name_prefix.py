@@ -0,0 +1,19 @@
+from domain.exceptions import ValidationError
+
+MAX_NAME_PREFIX = 255
+
+
+def normalize_name_prefix(prefix: str | None) -> str | None:
+    if prefix is None:
+        return None
+    prefix = prefix.strip()
+    if not prefix:
+        return None
+    if len(prefix) > MAX_NAME_PREFIX:
+        raise ValidationError("Prefijo de nombre demasiado largo")
+    return prefix
+
+
+def starts_with(name: str, prefix: str | None) -> bool:
+    # Igual que la collation *_ci de MySQL: sin distinguir mayusculas.
+    return prefix is None or name.casefold().startswith(prefix.casefold())
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PickingWeightSummary:
+    picking_id: int
+    package_count: int = 0
+    gross_weight: float = 0.0
+    tare_weight: float = 0.0
+    net_weight: float = 0.0
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from domain.entities.res_partner import ResPartner
+from domain.value_objects.name_prefix import normalize_name_prefix, starts_with
+
+
+@dataclass(frozen=True)
+class ResPartnerFilter:
+    name_prefix: str | None = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name_prefix", normalize_name_prefix(self.name_prefix))
+
+    def matches(self, partner: ResPartner) -> bool:
+        return starts_with(partner.name, self.name_prefix)
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from domain.entities.stock_package_type import StockPackageType
+from domain.value_objects.name_prefix import normalize_name_prefix, starts_with
+
+
+@dataclass(frozen=True)
+class StockPackageTypeFilter:
+    name_prefix: str | None = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name_prefix", normalize_name_prefix(self.name_prefix))
+
+    def matches(self, package_type: StockPackageType) -> bool:
+        return starts_with(package_type.name, self.name_prefix)
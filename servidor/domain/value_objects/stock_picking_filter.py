@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from domain.entities.stock_picking import StockPicking
+from domain.exceptions import ValidationError
+from domain.value_objects.name_prefix import normalize_name_prefix, starts_with
+
+
+@dataclass(frozen=True)
+class StockPickingFilter:
+    partner_id: int | None = None
+    name_prefix: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.partner_id is not None and self.partner_id <= 0:
+            raise ValidationError("partner_id invalido")
+        object.__setattr__(self, "name_prefix", normalize_name_prefix(self.name_prefix))
+
+    def matches(self, picking: StockPicking) -> bool:
+        if self.partner_id is not None and picking.partner_id != self.partner_id:
+            return False
+        return starts_with(picking.name, self.name_prefix)
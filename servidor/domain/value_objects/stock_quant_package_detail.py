@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from domain.entities.stock_package_type import StockPackageType
+from domain.entities.stock_picking import StockPicking
+from domain.entities.stock_quant_package import StockQuantPackage
+
+
+@dataclass(frozen=True)
+class StockQuantPackageDetail:
+    package: StockQuantPackage
+    package_type: StockPackageType | None = None
+    picking: StockPicking | None = None
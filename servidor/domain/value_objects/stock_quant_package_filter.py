@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from domain.entities.stock_quant_package import StockQuantPackage
+from domain.exceptions import ValidationError
+
+
+@dataclass(frozen=True)
+class StockQuantPackageFilter:
+    picking_id: int | None = None
+    package_type_id: int | None = None
+    min_weight: float | None = None
+    max_weight: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.picking_id is not None and self.picking_id <= 0:
+            raise ValidationError("picking_id invalido")
+        if self.package_type_id is not None and self.package_type_id <= 0:
+            raise ValidationError("package_type_id invalido")
+        if self.min_weight is not None and self.min_weight < 0:
+            raise ValidationError("Peso minimo invalido")
+        if self.max_weight is not None and self.max_weight < 0:
+            raise ValidationError("Peso maximo invalido")
+        if (
+            self.min_weight is not None
+            and self.max_weight is not None
+            and self.min_weight > self.max_weight
+        ):
+            raise ValidationError("Rango de peso invalido")
+
+    def matches(self, package: StockQuantPackage) -> bool:
+        if self.picking_id is not None and package.picking_id != self.picking_id:
+            return False
+        if self.package_type_id is not None and package.package_type_id != self.package_type_id:
+            return False
+        if self.min_weight is not None and package.shipping_weight < self.min_weight:
+            return False
+        if self.max_weight is not None and package.shipping_weight > self.max_weight:
+            return False
+        return True
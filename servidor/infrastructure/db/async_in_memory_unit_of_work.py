@@ -0,0 +1,22 @@
+from application.ports.async_unit_of_work import IAsyncUnitOfWork
+from infrastructure.db.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.repositories.async_repository_adapter import AsyncRepositoryAdapter
+
+
+class AsyncInMemoryUnitOfWork(IAsyncUnitOfWork):
+    # Comparte los datos y el lock con la UoW sync: los endpoints que no tienen version
+    # async ven las mismas filas. El lock se toma sin await de por medio, asi que el
+    # event loop solo espera a un hilo sync que este dentro de su propia UoW.
+    def __init__(self, inner: InMemoryUnitOfWork) -> None:
+        self.inner = inner
+        self.partners = AsyncRepositoryAdapter(inner.partners)
+        self.pickings = AsyncRepositoryAdapter(inner.pickings)
+        self.package_types = AsyncRepositoryAdapter(inner.package_types)
+        self.packages = AsyncRepositoryAdapter(inner.packages)
+
+    async def __aenter__(self) -> "AsyncInMemoryUnitOfWork":
+        self.inner.lock.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.inner.lock.release()
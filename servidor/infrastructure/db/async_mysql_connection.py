@@ -0,0 +1,70 @@
+import asyncio
+from pymysql.constants import CLIENT
+from application.exceptions import DatabaseError
+from infrastructure.db.mysql_connection import MySQLConfig, MySQLConnectionFactory, MySQLPoolConfig
+
+try:
+    import aiomysql
+except ImportError:  # dependencia opcional (pip install .[async])
+    aiomysql = None
+
+
+class AsyncMySQLConnectionPool:
+    # Pool de aiomysql con la misma configuracion (DB_*, DB_POOL_*) que el pool sync.
+    # Mientras una request espera a MySQL el event loop atiende otras: no ocupa un hilo.
+    def __init__(self, config: MySQLConfig, pool_config: MySQLPoolConfig | None = None) -> None:
+        if aiomysql is None:
+            raise ValueError("API_ASYNC=1 requiere el paquete aiomysql")
+        self.config = config
+        self.pool_config = pool_config or MySQLPoolConfig()
+        self._pool = None
+
+    @classmethod
+    def from_env(cls, factory: MySQLConnectionFactory, default_max_size: int = 10) -> "AsyncMySQLConnectionPool":
+        return cls(factory.config, MySQLPoolConfig.from_env(default_max_size))
+
+    @property
+    def size(self) -> int:
+        return self._pool.size if self._pool is not None else 0
+
+    @property
+    def idle(self) -> int:
+        return self._pool.freesize if self._pool is not None else 0
+
+    async def open(self) -> None:
+        if self._pool is not None:
+            return
+        self._pool = await aiomysql.create_pool(
+            host=self.config.host,
+            port=self.config.port,
+            user=self.config.user,
+            password=self.config.password,
+            db=self.config.db,
+            minsize=self.pool_config.min_size,
+            maxsize=self.pool_config.max_size,
+            pool_recycle=int(self.pool_config.recycle),
+            autocommit=False,
+            cursorclass=aiomysql.DictCursor,
+            charset="utf8mb4",
+            client_flag=CLIENT.FOUND_ROWS,
+        )
+
+    async def acquire(self):
+        await self.open()
+        try:
+            return await asyncio.wait_for(self._pool.acquire(), self.pool_config.timeout)
+        except asyncio.TimeoutError as exc:
+            raise DatabaseError("No hay conexiones disponibles a la base de datos") from exc
+
+    def release(self, conn, discard: bool = False) -> None:
+        if discard:
+            # aiomysql descarta del pool las conexiones cerradas al devolverlas.
+            conn.close()
+        self._pool.release(conn)
+
+    async def close(self) -> None:
+        if self._pool is None:
+            return
+        self._pool.close()
+        await self._pool.wait_closed()
+        self._pool = None
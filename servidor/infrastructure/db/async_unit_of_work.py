@@ -0,0 +1,51 @@
+from application.ports.async_unit_of_work import IAsyncUnitOfWork
+from infrastructure.db.async_mysql_connection import AsyncMySQLConnectionPool
+from infrastructure.repositories.async_mysql_repository import AsyncMySQLRepository
+from infrastructure.repositories.mysql_res_partner_repository import MySQLResPartnerRepository
+from infrastructure.repositories.mysql_stock_picking_repository import MySQLStockPickingRepository
+from infrastructure.repositories.mysql_stock_package_type_repository import MySQLStockPackageTypeRepository
+from infrastructure.repositories.mysql_stock_quant_package_repository import MySQLStockQuantPackageRepository
+
+
+class AsyncMySQLUnitOfWork(IAsyncUnitOfWork):
+    # Sin cache de tipos de paquete: el camino async solo da altas (ids nuevos, nada que
+    # invalidar) y lecturas por id, que van a la base.
+    def __init__(self, pool: AsyncMySQLConnectionPool) -> None:
+        self.pool = pool
+        self.connection = None
+
+    async def __aenter__(self) -> "AsyncMySQLUnitOfWork":
+        self.connection = await self.pool.acquire()
+        conn = self.connection
+        self.partners = AsyncMySQLRepository(
+            conn, "res_partner", ("name", "email", "phone"), MySQLResPartnerRepository._row_to_partner
+        )
+        self.pickings = AsyncMySQLRepository(
+            conn, "stock_picking", ("name", "partner_id"), MySQLStockPickingRepository._row_to_picking
+        )
+        self.package_types = AsyncMySQLRepository(
+            conn, "stock_package_type", ("name", "weight"), MySQLStockPackageTypeRepository._row_to_package_type
+        )
+        self.packages = AsyncMySQLRepository(
+            conn,
+            "stock_quant_package",
+            ("name", "package_type_id", "shipping_weight", "picking_id"),
+            MySQLStockQuantPackageRepository._row_to_package,
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if not self.connection:
+            return
+        discard = False
+        try:
+            if exc_type:
+                await self.connection.rollback()
+            else:
+                await self.connection.commit()
+        except Exception:
+            discard = True
+            raise
+        finally:
+            self.pool.release(self.connection, discard=discard)
+            self.connection = None
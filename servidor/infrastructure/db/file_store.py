@@ -0,0 +1,174 @@
+from dataclasses import asdict
+from datetime import datetime
+import json
+import mmap
+import os
+from pathlib import Path
+import threading
+from collections.abc import Iterator
+from application.exceptions import DatabaseError
+from domain.entities.res_partner import ResPartner
+from domain.entities.stock_picking import StockPicking
+from domain.entities.stock_package_type import StockPackageType
+from domain.entities.stock_quant_package import StockQuantPackage
+from infrastructure.db.in_memory_unit_of_work import InMemoryUnitOfWork
+
+TABLES = {
+    "partners": ResPartner,
+    "pickings": StockPicking,
+    "package_types": StockPackageType,
+    "packages": StockQuantPackage,
+}
+SNAPSHOT_PAGE_SIZE = 1000
+
+
+class FileStore:
+    def __init__(self, path: str | Path, snapshot_every: int = 10000, fsync: bool = True) -> None:
+        self.path = Path(path)
+        self.snapshot_every = snapshot_every
+        self.fsync = fsync
+        self.lock = threading.Lock()
+        self.data = InMemoryUnitOfWork()
+        self._wal = None
+        self._wal_records = 0
+        self._open_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "FileStore":
+        return cls(
+            os.getenv("STORAGE_PATH", "data"),
+            snapshot_every=int(os.getenv("STORAGE_SNAPSHOT_EVERY", "10000")),
+            fsync=os.getenv("STORAGE_FSYNC", "1") != "0",
+        )
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.path / "snapshot.jsonl"
+
+    @property
+    def wal_path(self) -> Path:
+        return self.path / "wal.jsonl"
+
+    @property
+    def wal_records(self) -> int:
+        return self._wal_records
+
+    def open(self) -> None:
+        with self._open_lock:
+            if self._wal is not None:
+                return
+            self.path.mkdir(parents=True, exist_ok=True)
+            for _, line in _read_lines(self.snapshot_path):
+                record = json.loads(line)
+                self._put(record["t"], record["row"])
+            valid_size = self._replay_wal()
+            self._wal = open(self.wal_path, "ab")
+            if os.fstat(self._wal.fileno()).st_size > valid_size:
+                self._wal.truncate(valid_size)
+
+    def append(self, ops: list) -> None:
+        line = json.dumps({"ops": ops}, separators=(",", ":")).encode("utf-8") + b"\n"
+        position = os.fstat(self._wal.fileno()).st_size
+        try:
+            self._wal.write(line)
+            self._wal.flush()
+            if self.fsync:
+                os.fsync(self._wal.fileno())
+        except OSError as exc:
+            try:
+                self._wal.truncate(position)
+            except OSError:
+                pass
+            raise DatabaseError("No se pudo escribir el log de la base local") from exc
+        self._wal_records += 1
+        if self.snapshot_every and self._wal_records >= self.snapshot_every:
+            try:
+                self._snapshot()
+            except Exception:
+                # El lote ya es durable en el WAL: revertirlo en memoria lo haria
+                # reaparecer al reiniciar. El snapshot se reintenta en el proximo append.
+                pass
+
+    def apply(self, ops: list) -> None:
+        for table, action, value in ops:
+            if action == "put":
+                self._put(table, value)
+            else:
+                getattr(self.data, table).delete(value)
+
+    def snapshot(self) -> None:
+        with self.lock:
+            self._snapshot()
+
+    def close(self) -> None:
+        with self.lock:
+            if self._wal is None:
+                return
+            if self._wal_records:
+                self._snapshot()
+            self._wal.close()
+            self._wal = None
+
+    def _snapshot(self) -> None:
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            for table in TABLES:
+                for entity in _all_rows(getattr(self.data, table)):
+                    record = {"t": table, "row": to_row(entity)}
+                    f.write(json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n")
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, self.snapshot_path)
+        # Si se corta entre el replace y el truncate, reaplicar el WAL es idempotente.
+        self._wal.truncate(0)
+        self._wal_records = 0
+
+    def _replay_wal(self) -> int:
+        valid_size = 0
+        for next_offset, line in _read_lines(self.wal_path):
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                raise DatabaseError(f"Log de la base local corrupto (byte {valid_size})") from exc
+            self.apply(record["ops"])
+            self._wal_records += 1
+            valid_size = next_offset
+        return valid_size
+
+    def _put(self, table: str, row: dict) -> None:
+        if row.get("updated_at"):
+            row = {**row, "updated_at": datetime.fromisoformat(row["updated_at"])}
+        getattr(self.data, table).update(TABLES[table](**row))
+
+
+def to_row(entity) -> dict:
+    row = asdict(entity)
+    if row.get("updated_at") is not None:
+        row["updated_at"] = row["updated_at"].isoformat()
+    return row
+
+
+def _read_lines(path: Path) -> Iterator[tuple[int, bytes]]:
+    if not path.exists() or path.stat().st_size == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        offset = 0
+        size = len(mm)
+        while offset < size:
+            end = mm.find(b"\n", offset)
+            if end == -1:
+                # Ultimo registro sin "\n": escritura cortada, se descarta.
+                return
+            yield end + 1, mm[offset:end]
+            offset = end + 1
+
+
+def _all_rows(repo) -> Iterator:
+    before_id = 0
+    while True:
+        page = repo.list(limit=SNAPSHOT_PAGE_SIZE, offset=0, before_id=before_id)
+        if not page:
+            return
+        yield from reversed(page)
+        before_id = page[0].id
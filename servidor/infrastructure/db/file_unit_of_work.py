@@ -0,0 +1,114 @@
+from copy import copy
+from datetime import datetime
+from application.ports.unit_of_work import IUnitOfWork
+from infrastructure.db.file_store import FileStore, to_row
+
+
+class _Journal:
+    def __init__(self) -> None:
+        self.ops: list = []
+        self.undo: list = []
+
+    def rollback(self) -> None:
+        for action in reversed(self.undo):
+            action()
+        self.ops.clear()
+        self.undo.clear()
+
+
+class JournaledRepository:
+    def __init__(self, inner, table: str, journal: _Journal) -> None:
+        self.inner = inner
+        self.table = table
+        self.journal = journal
+
+    def create(self, entity):
+        created = self.inner.create(entity)
+        self.journal.ops.append((self.table, "put", to_row(created)))
+        self.journal.undo.append(lambda: self.inner.delete(created.id))
+        return created
+
+    def create_many(self, entities: list) -> list:
+        return [self.create(entity) for entity in entities]
+
+    def upsert_many(self, entities: list) -> list:
+        previous = {}
+        for entity in entities:
+            current = self.inner.get_by_name(entity.name)
+            previous[entity.name.lower()] = copy(current) if current is not None else None
+        results = self.inner.upsert_many(entities)
+        for stored in results:
+            self.journal.ops.append((self.table, "put", to_row(stored)))
+            before = previous[stored.name.lower()]
+            self.journal.undo.append(lambda entity_id=stored.id, before=before: self._restore(entity_id, before))
+        return results
+
+    def update(self, entity):
+        previous = self._snapshot(entity.id)
+        updated = self.inner.update(entity)
+        self.journal.ops.append((self.table, "put", to_row(updated)))
+        self.journal.undo.append(lambda: self._restore(entity.id, previous))
+        return updated
+
+    def update_fields(self, entity_id: int, changes: dict, expected_updated_at: datetime | None = None):
+        previous = self._snapshot(entity_id)
+        updated = self.inner.update_fields(entity_id, changes, expected_updated_at)
+        if updated is None:
+            return None
+        self.journal.ops.append((self.table, "put", to_row(updated)))
+        self.journal.undo.append(lambda: self._restore(entity_id, previous))
+        return updated
+
+    def delete(self, entity_id: int, expected_updated_at: datetime | None = None) -> bool:
+        previous = self._snapshot(entity_id)
+        if not self.inner.delete(entity_id, expected_updated_at):
+            return False
+        self.journal.ops.append((self.table, "del", entity_id))
+        self.journal.undo.append(lambda: self._restore(entity_id, previous))
+        return True
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    def _snapshot(self, entity_id: int):
+        current = self.inner.get_by_id(entity_id)
+        return copy(current) if current is not None else None
+
+    def _restore(self, entity_id: int, previous) -> None:
+        if previous is None:
+            self.inner.delete(entity_id)
+        else:
+            self.inner.update(previous)
+
+
+class FileUnitOfWork(IUnitOfWork):
+    exclusive = True
+
+    def __init__(self, store: FileStore) -> None:
+        self.store = store
+        self._journal: _Journal | None = None
+
+    def __enter__(self) -> "FileUnitOfWork":
+        self.store.open()
+        self.store.lock.acquire()
+        self._journal = _Journal()
+        data = self.store.data
+        self.partners = JournaledRepository(data.partners, "partners", self._journal)
+        self.pickings = JournaledRepository(data.pickings, "pickings", self._journal)
+        self.package_types = JournaledRepository(data.package_types, "package_types", self._journal)
+        self.packages = JournaledRepository(data.packages, "packages", self._journal)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        journal, self._journal = self._journal, None
+        try:
+            if exc_type:
+                journal.rollback()
+            elif journal.ops:
+                try:
+                    self.store.append(journal.ops)
+                except Exception:
+                    journal.rollback()
+                    raise
+        finally:
+            self.store.lock.release()
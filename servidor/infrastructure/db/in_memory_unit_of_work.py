@@ -0,0 +1,26 @@
+import threading
+from application.ports.unit_of_work import IUnitOfWork
+from infrastructure.repositories.in_memory_res_partner_repository import InMemoryResPartnerRepository
+from infrastructure.repositories.in_memory_stock_picking_repository import InMemoryStockPickingRepository
+from infrastructure.repositories.in_memory_stock_package_type_repository import InMemoryStockPackageTypeRepository
+from infrastructure.repositories.in_memory_stock_quant_package_repository import InMemoryStockQuantPackageRepository
+
+
+class InMemoryUnitOfWork(IUnitOfWork):
+    exclusive = True
+
+    def __init__(self) -> None:
+        # Una sola instancia se comparte entre los hilos del threadpool: sin lock dos
+        # altas concurrentes pueden tomar el mismo next_id.
+        self.lock = threading.Lock()
+        self.partners = InMemoryResPartnerRepository()
+        self.pickings = InMemoryStockPickingRepository()
+        self.package_types = InMemoryStockPackageTypeRepository()
+        self.packages = InMemoryStockQuantPackageRepository(self.package_types, self.pickings)
+
+    def __enter__(self) -> "InMemoryUnitOfWork":
+        self.lock.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.lock.release()
@@ -0,0 +1,89 @@
+from contextvars import ContextVar
+from dataclasses import dataclass
+import time
+
+
+@dataclass
+class QueryStats:
+    queries: int = 0
+    rows: int = 0
+    db_time: float = 0.0
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+class InstrumentedCursor:
+    def __init__(self, cursor) -> None:
+        self._cursor = cursor
+
+    def execute(self, query, args=None):
+        started = time.perf_counter()
+        try:
+            return self._cursor.execute(query, args)
+        finally:
+            self._record_execute(time.perf_counter() - started)
+
+    def executemany(self, query, args):
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(query, args)
+        finally:
+            self._record_execute(time.perf_counter() - started)
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._record_fetch(time.perf_counter() - started, 0 if row is None else 1)
+        return row
+
+    def fetchmany(self, size=None):
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(size)
+        self._record_fetch(time.perf_counter() - started, len(rows))
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._record_fetch(time.perf_counter() - started, len(rows))
+        return rows
+
+    def _record_execute(self, elapsed: float) -> None:
+        stats = current_query_stats.get()
+        if stats is None:
+            return
+        stats.queries += 1
+        stats.db_time += elapsed
+        if self._cursor.description is None and self._cursor.rowcount > 0:
+            stats.rows += self._cursor.rowcount
+
+    def _record_fetch(self, elapsed: float, rows: int) -> None:
+        stats = current_query_stats.get()
+        if stats is None:
+            return
+        stats.rows += rows
+        stats.db_time += elapsed
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __enter__(self) -> "InstrumentedCursor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._cursor.close()
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class InstrumentedConnection:
+    def __init__(self, connection) -> None:
+        self._connection = connection
+
+    def cursor(self, cursor=None) -> InstrumentedCursor:
+        return InstrumentedCursor(self._connection.cursor(cursor))
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
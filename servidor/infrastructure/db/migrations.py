@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+from pathlib import Path
+import re
+from pymysql.err import ProgrammingError
+from application.exceptions import DatabaseError
+
+MIGRATION_FILE = re.compile(r"^(\d{4})_(\w+)\.sql$")
+LOCK_NAME = "odoo_like_schema_migrations"
+LOCK_TIMEOUT = 60
+
+SCHEMA_VERSION_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_version (
+  version INT PRIMARY KEY,
+  name VARCHAR(128) NOT NULL,
+  applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+) CHARACTER SET utf8mb4
+"""
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    path: Path
+
+    def statements(self) -> list[str]:
+        # Los comentarios de linea se descartan antes de partir por ";": un ";" dentro
+        # de un comentario cortaria la sentencia siguiente.
+        lines = self.path.read_text(encoding="utf-8").splitlines()
+        sql = "\n".join(line for line in lines if not line.lstrip().startswith("--"))
+        return [s.strip() for s in sql.split(";") if s.strip()]
+
+
+def load_migrations(scripts_dir: str | Path) -> list[Migration]:
+    scripts_dir = Path(scripts_dir)
+    migrations = [Migration(1, "schema", scripts_dir / "schema.sql")]
+    migrations_dir = scripts_dir / "migrations"
+    if migrations_dir.is_dir():
+        for path in sorted(migrations_dir.iterdir()):
+            match = MIGRATION_FILE.match(path.name)
+            if match:
+                migrations.append(Migration(int(match.group(1)), match.group(2), path))
+    versions = [m.version for m in migrations]
+    if versions != sorted(set(versions)):
+        raise ValueError("Versiones de migracion duplicadas o desordenadas")
+    return migrations
+
+
+class MigrationRunner:
+    def __init__(self, factory, migrations: list[Migration]) -> None:
+        self.factory = factory
+        self.migrations = migrations
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+    def current_version(self) -> int:
+        conn = self.factory.connect()
+        try:
+            return self._current_version(conn)
+        finally:
+            conn.close()
+
+    def pending(self) -> list[Migration]:
+        current = self.current_version()
+        return [m for m in self.migrations if m.version > current]
+
+    def ensure_current(self, auto_migrate: bool = True) -> list[Migration]:
+        current = self.current_version()
+        if current >= self.latest_version:
+            return []
+        if not auto_migrate:
+            raise DatabaseError(
+                f"Esquema desactualizado (v{current}, se requiere v{self.latest_version}). "
+                "Ejecuta python -m servidor.scripts.migrate"
+            )
+        return self.migrate()
+
+    def migrate(self) -> list[Migration]:
+        conn = self.factory.connect()
+        applied: list[Migration] = []
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT GET_LOCK(%s, %s) AS locked", (LOCK_NAME, LOCK_TIMEOUT))
+                if not cur.fetchone()["locked"]:
+                    raise DatabaseError("No se pudo tomar el lock de migraciones")
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(SCHEMA_VERSION_TABLE)
+                # Otro worker pudo haber migrado mientras esperabamos el lock.
+                current = self._current_version(conn)
+                for migration in self.migrations:
+                    if migration.version <= current:
+                        continue
+                    # El DDL de MySQL hace commit implicito: si una migracion falla a mitad de
+                    # camino se vuelve a correr entera. Por eso cada sentencia tiene que ser
+                    # reejecutable (IF NOT EXISTS, MODIFY, o un ALTER guardado con una consulta
+                    # a information_schema).
+                    with conn.cursor() as cur:
+                        for stmt in migration.statements():
+                            cur.execute(stmt)
+                        cur.execute(
+                            "INSERT INTO schema_version (version, name) VALUES (%s, %s)",
+                            (migration.version, migration.name),
+                        )
+                    conn.commit()
+                    applied.append(migration)
+            finally:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT RELEASE_LOCK(%s)", (LOCK_NAME,))
+        finally:
+            conn.close()
+        return applied
+
+    def _current_version(self, conn) -> int:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT MAX(version) AS version FROM schema_version")
+                row = cur.fetchone()
+        except ProgrammingError as exc:
+            if exc.args and exc.args[0] == 1146:
+                return 0
+            raise
+        if not row:
+            return 0
+        return row["version"] or 0
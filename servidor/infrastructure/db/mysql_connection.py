@@ -1,8 +1,14 @@
+from collections import deque
 from dataclasses import dataclass
 import os
 from pathlib import Path
+import threading
+import time
 import pymysql
+from pymysql.constants import CLIENT
 from pymysql.connections import Connection
+from application.exceptions import DatabaseError
+from infrastructure.db.migrations import MigrationRunner, load_migrations
 
 
 @dataclass(frozen=True)
@@ -14,6 +20,23 @@ class MySQLConfig:
     db: str
 
 
+@dataclass(frozen=True)
+class MySQLPoolConfig:
+    min_size: int = 1
+    max_size: int = 10
+    recycle: float = 3600.0
+    timeout: float = 10.0
+
+    @classmethod
+    def from_env(cls, default_max_size: int = 10) -> "MySQLPoolConfig":
+        return cls(
+            min_size=int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+            max_size=int(os.getenv("DB_POOL_MAX_SIZE") or default_max_size),
+            recycle=float(os.getenv("DB_POOL_RECYCLE", "3600")),
+            timeout=float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        )
+
+
 class MySQLConnectionFactory:
     def __init__(self, config: MySQLConfig) -> None:
         self.config = config
@@ -37,20 +60,12 @@ class MySQLConnectionFactory:
             autocommit=False,
             cursorclass=pymysql.cursors.DictCursor,
             charset="utf8mb4",
+            client_flag=CLIENT.FOUND_ROWS,
         )
 
-    def ensure_schema(self, schema_path: str | Path) -> None:
-        path = Path(schema_path)
-        sql = path.read_text(encoding="utf-8")
-        statements = [s.strip() for s in sql.split(";") if s.strip()]
-        conn = self.connect()
-        try:
-            with conn.cursor() as cur:
-                for stmt in statements:
-                    cur.execute(stmt)
-            conn.commit()
-        finally:
-            conn.close()
+    def ensure_schema(self, scripts_dir: str | Path, auto_migrate: bool = True) -> None:
+        runner = MigrationRunner(self, load_migrations(scripts_dir))
+        runner.ensure_current(auto_migrate=auto_migrate)
 
     def __enter__(self) -> Connection:
         self._conn = self.connect()
@@ -59,3 +74,109 @@ class MySQLConnectionFactory:
     def __exit__(self, exc_type, exc, tb) -> None:
         if hasattr(self, "_conn"):
             self._conn.close()
+
+
+class MySQLConnectionPool:
+    def __init__(self, factory: MySQLConnectionFactory, config: MySQLPoolConfig | None = None) -> None:
+        config = config or MySQLPoolConfig()
+        if config.max_size < 1 or config.min_size < 0 or config.min_size > config.max_size:
+            raise ValueError("Tamaño de pool invalido")
+        self.factory = factory
+        self.config = config
+        self._idle: deque[Connection] = deque()
+        self._born: dict[int, float] = {}
+        self._size = 0
+        self._cond = threading.Condition()
+
+    @classmethod
+    def from_env(cls, factory: MySQLConnectionFactory, default_max_size: int = 10) -> "MySQLConnectionPool":
+        return cls(factory, MySQLPoolConfig.from_env(default_max_size))
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    def fill(self) -> None:
+        while True:
+            with self._cond:
+                if self._size >= self.config.min_size:
+                    return
+                self._size += 1
+            conn = self._open()
+            self.release(conn)
+
+    def acquire(self) -> Connection:
+        deadline = time.monotonic() + self.config.timeout
+        while True:
+            conn = self._checkout(deadline)
+            if conn is None:
+                return self._open()
+            if self._is_usable(conn):
+                return conn
+            self._discard(conn)
+
+    def release(self, conn: Connection, discard: bool = False) -> None:
+        if discard or not conn.open or self._expired(conn):
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append(conn)
+            self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn in idle:
+            self._discard(conn)
+
+    def _checkout(self, deadline: float) -> Connection | None:
+        with self._cond:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._size < self.config.max_size:
+                    self._size += 1
+                    return None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DatabaseError("No hay conexiones disponibles a la base de datos")
+                self._cond.wait(remaining)
+
+    def _open(self) -> Connection:
+        try:
+            conn = self.factory.connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        self._born[id(conn)] = time.monotonic()
+        return conn
+
+    def _is_usable(self, conn: Connection) -> bool:
+        if self._expired(conn):
+            return False
+        try:
+            conn.ping(reconnect=False)
+        except Exception:
+            return False
+        return True
+
+    def _expired(self, conn: Connection) -> bool:
+        born = self._born.get(id(conn))
+        return born is None or time.monotonic() - born > self.config.recycle
+
+    def _discard(self, conn: Connection) -> None:
+        self._born.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
@@ -1,34 +1,52 @@
 from pymysql.connections import Connection
 from application.ports.unit_of_work import IUnitOfWork
-from infrastructure.db.mysql_connection import MySQLConnectionFactory
+from infrastructure.cache.ttl_cache import TTLCache
+from infrastructure.db.instrumentation import InstrumentedConnection
+from infrastructure.db.mysql_connection import MySQLConnectionPool
 from infrastructure.repositories.mysql_res_partner_repository import MySQLResPartnerRepository
 from infrastructure.repositories.mysql_stock_picking_repository import MySQLStockPickingRepository
 from infrastructure.repositories.mysql_stock_package_type_repository import MySQLStockPackageTypeRepository
 from infrastructure.repositories.mysql_stock_quant_package_repository import MySQLStockQuantPackageRepository
+from infrastructure.repositories.cached_stock_package_type_repository import CachedStockPackageTypeRepository
 
 
 class MySQLUnitOfWork(IUnitOfWork):
-    def __init__(self, conn_factory: MySQLConnectionFactory) -> None:
-        self.conn_factory = conn_factory
+    def __init__(self, pool: MySQLConnectionPool, package_type_cache: TTLCache | None = None) -> None:
+        self.pool = pool
+        self.package_type_cache = package_type_cache
         self.connection: Connection | None = None
         self.partners: MySQLResPartnerRepository | None = None
         self.pickings: MySQLStockPickingRepository | None = None
-        self.package_types: MySQLStockPackageTypeRepository | None = None
+        self.package_types: MySQLStockPackageTypeRepository | CachedStockPackageTypeRepository | None = None
         self.packages: MySQLStockQuantPackageRepository | None = None
 
     def __enter__(self) -> "MySQLUnitOfWork":
-        self.connection = self.conn_factory.connect()
-        self.partners = MySQLResPartnerRepository(self.connection)
-        self.pickings = MySQLStockPickingRepository(self.connection)
-        self.package_types = MySQLStockPackageTypeRepository(self.connection)
-        self.packages = MySQLStockQuantPackageRepository(self.connection)
+        self.connection = self.pool.acquire()
+        conn = InstrumentedConnection(self.connection)
+        self.partners = MySQLResPartnerRepository(conn)
+        self.pickings = MySQLStockPickingRepository(conn)
+        self.package_types = MySQLStockPackageTypeRepository(conn)
+        if self.package_type_cache is not None:
+            self.package_types = CachedStockPackageTypeRepository(
+                self.package_types, self.package_type_cache
+            )
+        self.packages = MySQLStockQuantPackageRepository(conn)
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
         if not self.connection:
             return
-        if exc_type:
-            self.connection.rollback()
-        else:
-            self.connection.commit()
-        self.connection.close()
+        discard = False
+        try:
+            if exc_type:
+                self.connection.rollback()
+            else:
+                self.connection.commit()
+        except Exception:
+            discard = True
+            raise
+        finally:
+            self.pool.release(self.connection, discard=discard)
+            self.connection = None
+            if isinstance(self.package_types, CachedStockPackageTypeRepository):
+                self.package_types.flush_invalidations()
@@ -0,0 +1,25 @@
+import threading
+from application.ports.idempotency_store import IIdempotencyStore, IdempotencyRecord
+from infrastructure.cache.ttl_cache import TTLCache
+
+
+class InMemoryIdempotencyStore(IIdempotencyStore):
+    def __init__(self, cache: TTLCache) -> None:
+        self.cache = cache
+        # begin() es leer y reservar: sin este lock dos reintentos simultaneos
+        # podrian reservar la misma clave.
+        self._lock = threading.Lock()
+
+    def begin(self, key: str, fingerprint: str) -> IdempotencyRecord | None:
+        with self._lock:
+            record = self.cache.get(key)
+            if record is not None:
+                return record
+            self.cache.set(key, IdempotencyRecord(fingerprint=fingerprint))
+            return None
+
+    def complete(self, key: str, record: IdempotencyRecord) -> None:
+        self.cache.set(key, record)
+
+    def release(self, key: str) -> None:
+        self.cache.invalidate(key)
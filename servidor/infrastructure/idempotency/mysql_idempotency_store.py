@@ -0,0 +1,115 @@
+import hashlib
+import json
+import threading
+from collections.abc import Callable
+from pymysql.err import ProgrammingError, OperationalError
+from application.exceptions import DatabaseError
+from application.ports.idempotency_store import IIdempotencyStore, IdempotencyRecord
+from infrastructure.db.mysql_connection import MySQLConnectionPool
+
+PURGE_EVERY = 100
+PURGE_BATCH = 500
+
+
+def _key_hash(key: str) -> str:
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class MySQLIdempotencyStore(IIdempotencyStore):
+    def __init__(self, pool: MySQLConnectionPool, ttl: float = 3600.0, lease: float = 60.0) -> None:
+        self.pool = pool
+        self.ttl = ttl
+        # Una reserva cuyo proceso murio se libera sola al vencer el lease, en vez
+        # de bloquear la clave durante todo el ttl.
+        self.lease = lease
+        self._begins = 0
+        self._lock = threading.Lock()
+
+    def begin(self, key: str, fingerprint: str) -> IdempotencyRecord | None:
+        key_hash = _key_hash(key)
+
+        def run(cur) -> IdempotencyRecord | None:
+            cur.execute(
+                "DELETE FROM idempotency_key WHERE key_hash=%s AND expires_at < NOW(6)", (key_hash,)
+            )
+            for _ in range(2):
+                cur.execute(
+                    "INSERT IGNORE INTO idempotency_key (key_hash, fingerprint, expires_at) "
+                    "VALUES (%s, %s, NOW(6) + INTERVAL %s MICROSECOND)",
+                    (key_hash, fingerprint, int(self.lease * 1_000_000)),
+                )
+                if cur.rowcount == 1:
+                    return None
+                cur.execute(
+                    "SELECT fingerprint, status_code, headers, body FROM idempotency_key WHERE key_hash=%s",
+                    (key_hash,),
+                )
+                row = cur.fetchone()
+                if row is not None:
+                    return self._row_to_record(row)
+            raise DatabaseError("No se pudo reservar la Idempotency-Key")
+
+        record = self._execute(run)
+        if self._should_purge():
+            self._execute(self._purge)
+        return record
+
+    def complete(self, key: str, record: IdempotencyRecord) -> None:
+        def run(cur) -> None:
+            cur.execute(
+                "UPDATE idempotency_key SET status_code=%s, headers=%s, body=%s, "
+                "expires_at=NOW(6) + INTERVAL %s MICROSECOND WHERE key_hash=%s",
+                (
+                    record.status,
+                    json.dumps([list(header) for header in record.headers]),
+                    record.body,
+                    int(self.ttl * 1_000_000),
+                    _key_hash(key),
+                ),
+            )
+
+        self._execute(run)
+
+    def release(self, key: str) -> None:
+        self._execute(
+            lambda cur: cur.execute("DELETE FROM idempotency_key WHERE key_hash=%s", (_key_hash(key),))
+        )
+
+    def _should_purge(self) -> bool:
+        with self._lock:
+            self._begins += 1
+            return self._begins % PURGE_EVERY == 0
+
+    def _purge(self, cur) -> None:
+        cur.execute("DELETE FROM idempotency_key WHERE expires_at < NOW(6) LIMIT %s", (PURGE_BATCH,))
+
+    def _execute(self, run: Callable):
+        conn = self.pool.acquire()
+        discard = False
+        try:
+            with conn.cursor() as cur:
+                result = run(cur)
+            conn.commit()
+            return result
+        except (ProgrammingError, OperationalError) as exc:
+            discard = True
+            if exc.args and exc.args[0] == 1146:
+                raise DatabaseError(
+                    "Tabla 'idempotency_key' no existe. Ejecuta python -m servidor.scripts.migrate"
+                ) from exc
+            raise DatabaseError("Error de base de datos") from exc
+        except Exception:
+            discard = True
+            raise
+        finally:
+            # Descartar la conexion cierra la transaccion sin commit.
+            self.pool.release(conn, discard=discard)
+
+    def _row_to_record(self, row: dict) -> IdempotencyRecord:
+        headers = json.loads(row["headers"]) if row["headers"] else []
+        return IdempotencyRecord(
+            fingerprint=row["fingerprint"],
+            status=row["status_code"],
+            headers=tuple((name, value) for name, value in headers),
+            body=row["body"] or b"",
+        )
@@ -0,0 +1,9 @@
+def like_prefix(prefix: str) -> str:
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped + "%"
+
+
+def name_prefix_conditions(name_prefix: str | None, column: str = "name") -> tuple[list[str], list]:
+    if name_prefix is None:
+        return [], []
+    return [f"{column} LIKE %s"], [like_prefix(name_prefix)]
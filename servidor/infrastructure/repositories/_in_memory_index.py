@@ -0,0 +1,108 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Callable, Iterable, Iterator
+from datetime import datetime, timedelta
+from typing import Generic, TypeVar
+from infrastructure.repositories._pagination import keyset_ids
+
+T = TypeVar("T")
+
+
+def next_version(previous: datetime | None) -> datetime:
+    # Equivalente a updated_at TIMESTAMP(6): siempre crece, aunque el reloj no avance.
+    now = datetime.now()
+    if previous is not None and now <= previous:
+        return previous + timedelta(microseconds=1)
+    return now
+
+
+class InMemoryIndex(Generic[T]):
+    def __init__(self) -> None:
+        self._items: dict[int, T] = {}
+        self._ids: list[int] = []
+        self._names: dict[int, str] = {}
+        # Clave en minusculas: igual que el indice unico _ci de MySQL.
+        self._by_name: dict[str, dict[int, None]] = {}
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def next_id(self) -> int:
+        item_id = self._next_id
+        self._next_id += 1
+        return item_id
+
+    def put(self, item_id: int, item: T, name: str) -> None:
+        if item_id in self._items:
+            self._unindex_name(item_id)
+        elif self._ids and item_id < self._ids[-1]:
+            insort(self._ids, item_id)
+        else:
+            self._ids.append(item_id)
+        if item_id >= self._next_id:
+            self._next_id = item_id + 1
+        self._items[item_id] = item
+        self._names[item_id] = name
+        self._by_name.setdefault(name.lower(), {})[item_id] = None
+
+    def remove(self, item_id: int) -> bool:
+        if self._items.pop(item_id, None) is None:
+            return False
+        self._unindex_name(item_id)
+        pos = bisect_left(self._ids, item_id)
+        del self._ids[pos]
+        return True
+
+    def get(self, item_id: int) -> T | None:
+        return self._items.get(item_id)
+
+    def get_many(self, item_ids: Iterable[int]) -> list[T]:
+        return [self._items[i] for i in dict.fromkeys(item_ids) if i in self._items]
+
+    def get_by_name(self, name: str) -> T | None:
+        ids = self._by_name.get(name.lower())
+        if not ids:
+            return None
+        return self._items[next(iter(ids))]
+
+    def page(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        predicate: Callable[[T], bool] | None = None,
+    ) -> list[T]:
+        if predicate is None:
+            return [self._items[i] for i in keyset_ids(self._ids, limit, offset, after_id, before_id)]
+        if limit <= 0 or offset < 0:
+            return []
+        # Recorre desde el borde del cursor y corta apenas junta offset + limit coincidencias.
+        if before_id is not None:
+            start = bisect_right(self._ids, before_id)
+            candidates = (self._ids[i] for i in range(start, len(self._ids)))
+        else:
+            end = bisect_left(self._ids, after_id) if after_id is not None else len(self._ids)
+            candidates = (self._ids[i] for i in range(end - 1, -1, -1))
+        matched: list[T] = []
+        for item_id in candidates:
+            item = self._items[item_id]
+            if predicate(item):
+                matched.append(item)
+                if len(matched) >= offset + limit:
+                    break
+        page = matched[offset:]
+        return page[::-1] if before_id is not None else page
+
+    def values(self) -> Iterator[T]:
+        for item_id in tuple(self._ids):
+            item = self._items.get(item_id)
+            if item is not None:
+                yield item
+
+    def _unindex_name(self, item_id: int) -> None:
+        key = self._names.pop(item_id).lower()
+        ids = self._by_name[key]
+        ids.pop(item_id, None)
+        if not ids:
+            del self._by_name[key]
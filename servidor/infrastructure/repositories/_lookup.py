@@ -0,0 +1,20 @@
+from collections.abc import Iterable
+
+# Tope de placeholders por SELECT: mantiene acotados el tamano del paquete y el
+# costo de parseo aunque el pedido traiga miles de ids.
+LOOKUP_CHUNK_SIZE = 500
+
+
+def select_by_ids(cur, table: str, ids: Iterable[int], chunk_size: int = LOOKUP_CHUNK_SIZE) -> list[dict]:
+    return select_in(cur, table, "id", ids, chunk_size)
+
+
+def select_in(cur, table: str, column: str, values: Iterable, chunk_size: int = LOOKUP_CHUNK_SIZE) -> list[dict]:
+    values = list(dict.fromkeys(values))
+    rows: list[dict] = []
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start : start + chunk_size]
+        placeholders = ", ".join(["%s"] * len(chunk))
+        cur.execute(f"SELECT * FROM {table} WHERE {column} IN ({placeholders})", chunk)
+        rows.extend(cur.fetchall())
+    return rows
@@ -0,0 +1,51 @@
+from bisect import bisect_left, bisect_right
+
+
+def keyset_query(
+    select_sql: str,
+    conditions: list[str],
+    params: list,
+    limit: int,
+    offset: int,
+    after_id: int | None = None,
+    before_id: int | None = None,
+    id_column: str = "id",
+) -> tuple[str, tuple, bool]:
+    conditions = list(conditions)
+    params = list(params)
+    order = "DESC"
+    reverse = False
+    if before_id is not None:
+        conditions.append(f"{id_column} > %s")
+        params.append(before_id)
+        order = "ASC"
+        reverse = True
+    elif after_id is not None:
+        conditions.append(f"{id_column} < %s")
+        params.append(after_id)
+    sql = select_sql
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += f" ORDER BY {id_column} {order} LIMIT %s OFFSET %s"
+    params.extend((limit, offset))
+    return sql, tuple(params), reverse
+
+
+def keyset_ids(
+    ids: list[int],
+    limit: int,
+    offset: int,
+    after_id: int | None = None,
+    before_id: int | None = None,
+) -> list[int]:
+    # ids ascendente: bisect + slice de la ventana, sin copiar el resto.
+    if limit <= 0 or offset < 0:
+        return []
+    if before_id is not None:
+        lo = bisect_right(ids, before_id) + offset
+        return ids[lo : lo + limit][::-1]
+    end = bisect_left(ids, after_id) if after_id is not None else len(ids)
+    hi = end - offset
+    if hi <= 0:
+        return []
+    return ids[max(hi - limit, 0) : hi][::-1]
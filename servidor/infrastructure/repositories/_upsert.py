@@ -0,0 +1,76 @@
+import re
+from collections.abc import Sequence
+
+
+# Collation de la columna "name" por tabla; se lee una vez por proceso.
+_NAME_COLLATIONS: dict[str, str] = {}
+_COLLATION_PATTERN = re.compile(r"^\w+$")
+
+
+def _name_collation(cur, table: str) -> str:
+    collation = _NAME_COLLATIONS.get(table)
+    if collation is None:
+        cur.execute(
+            "SELECT COLLATION_NAME AS collation_name FROM information_schema.COLUMNS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = 'name'",
+            (table,),
+        )
+        row = cur.fetchone()
+        collation = row["collation_name"] if row else None
+        # Se interpola en el SQL: solo se acepta un identificador simple.
+        if not collation or not _COLLATION_PATTERN.match(collation):
+            raise ValueError(f"Collation invalida para {table}.name: {collation!r}")
+        _NAME_COLLATIONS[table] = collation
+    return collation
+
+
+def _names_table(names: Sequence[str], collation: str) -> str:
+    # Tabla derivada (idx, name) con la misma collation que la columna: la comparacion
+    # y WEIGHT_STRING siguen las reglas del indice unico (acentos, mayusculas, PAD
+    # SPACE si lo hubiera), no las de Python.
+    value = f"CONVERT(%s USING utf8mb4) COLLATE {collation}"
+    selects = [f"SELECT {index} AS idx, {value} AS name" for index in range(len(names))]
+    return " UNION ALL ".join(selects)
+
+
+def name_matches(cur, table: str, names: Sequence[str]) -> list[tuple[str, int | None]]:
+    # Por cada nombre: su clave de comparacion segun la collation de la columna y el id
+    # de la fila guardada con ese nombre (None si no existe). Una sola consulta.
+    if not names:
+        return []
+    derived = _names_table(names, _name_collation(cur, table))
+    # Lectura sin FOR UPDATE: con nombres nuevos tomaria gap locks y dos lotes
+    # concurrentes con nombres contiguos (PACK0001, PACK0002...) se bloquearian el
+    # INSERT mutuamente hasta un deadlock (1213). A cambio la clasificacion
+    # inserted/updated es de mejor esfuerzo. Las filas resultantes son las mismas.
+    cur.execute(
+        f"SELECT j.idx, HEX(WEIGHT_STRING(j.name)) AS name_key, t.id "
+        f"FROM ({derived}) AS j LEFT JOIN {table} AS t ON t.name = j.name",
+        list(names),
+    )
+    by_index = {row["idx"]: (row["name_key"], row["id"]) for row in cur.fetchall()}
+    return [by_index[index] for index in range(len(names))]
+
+
+def upsert_by_name(cur, table: str, columns: Sequence[str], rows: Sequence[tuple]) -> list[dict]:
+    # columns[0] debe ser "name" (clave unica) y los nombres no deben repetirse segun
+    # la collation (ver name_matches). Devuelve la fila resultante de cada entrada.
+    assignments = ", ".join(f"{column}=VALUES({column})" for column in columns[1:])
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))}) "
+        f"ON DUPLICATE KEY UPDATE {assignments}"
+    )
+    # executemany arma un unico INSERT multi-fila: una sentencia por lote.
+    cur.executemany(sql, rows)
+    # El INSERT no informa el id de cada fila (con ON DUPLICATE KEY UPDATE los ids
+    # insertados no son consecutivos ni dicen cuales se actualizaron): se releen
+    # uniendo por nombre con la collation de la columna, sin comparar en Python.
+    names = [row[0] for row in rows]
+    derived = _names_table(names, _name_collation(cur, table))
+    cur.execute(
+        f"SELECT j.idx, t.* FROM ({derived}) AS j JOIN {table} AS t ON t.name = j.name",
+        names,
+    )
+    by_index = {row.pop("idx"): row for row in cur.fetchall()}
+    return [by_index[index] for index in range(len(rows))]
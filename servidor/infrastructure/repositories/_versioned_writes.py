@@ -0,0 +1,67 @@
+from datetime import datetime
+from application.exceptions import PreconditionFailedError
+
+STALE_VERSION = "El registro fue modificado por otro usuario"
+
+
+def ensure_version(current, expected_updated_at: datetime | None) -> None:
+    if current is None or expected_updated_at is None:
+        return
+    if current.updated_at != expected_updated_at:
+        raise PreconditionFailedError(STALE_VERSION)
+
+
+def update_returning(
+    cur,
+    table: str,
+    entity_id: int,
+    changes: dict,
+    columns: tuple[str, ...],
+    expected_updated_at: datetime | None = None,
+) -> dict | None:
+    unknown = set(changes) - set(columns)
+    if unknown:
+        raise ValueError(f"Columnas no actualizables en {table}: {', '.join(sorted(unknown))}")
+    assignments = ", ".join(f"{column}=%s" for column in changes)
+    where, params = _where_version(entity_id, expected_updated_at)
+    # Con CLIENT.FOUND_ROWS el rowcount cuenta filas encontradas, no solo modificadas.
+    # Son dos round trips (UPDATE + SELECT, sin CLIENT.MULTI_STATEMENTS): el pedido solo
+    # trae los campos enviados y la respuesta es la fila completa con su nuevo updated_at.
+    # Lo que se gana frente a get + UPDATE es atomicidad: el UPDATE ya toma el lock de la
+    # fila y verifica la version, y el SELECT lee lo escrito en la misma transaccion.
+    cur.execute(f"UPDATE {table} SET {assignments} WHERE {where}", (*changes.values(), *params))
+    matched = cur.rowcount > 0
+    cur.execute(f"SELECT * FROM {table} WHERE id=%s", (entity_id,))
+    row = cur.fetchone()
+    if row is not None and not matched:
+        raise PreconditionFailedError(STALE_VERSION)
+    return row
+
+
+def inserted_version(cur, table: str, entity_id: int) -> datetime | None:
+    # updated_at lo pone MySQL (DEFAULT CURRENT_TIMESTAMP(6)): se relee para que el alta
+    # devuelva la version y el cliente pueda mandar If-Match sin otro GET.
+    cur.execute(f"SELECT updated_at FROM {table} WHERE id=%s", (entity_id,))
+    row = cur.fetchone()
+    return row["updated_at"] if row else None
+
+
+def delete_versioned(cur, table: str, entity_id: int, expected_updated_at: datetime | None = None) -> bool:
+    if expected_updated_at is None:
+        cur.execute(f"DELETE FROM {table} WHERE id=%s", (entity_id,))
+        return cur.rowcount > 0
+    where, params = _where_version(entity_id, expected_updated_at)
+    cur.execute(f"DELETE FROM {table} WHERE {where}", params)
+    if cur.rowcount > 0:
+        return True
+    # Solo si no borro nada: distingue version vieja de fila inexistente.
+    cur.execute(f"SELECT id FROM {table} WHERE id=%s", (entity_id,))
+    if cur.fetchone() is not None:
+        raise PreconditionFailedError(STALE_VERSION)
+    return False
+
+
+def _where_version(entity_id: int, expected_updated_at: datetime | None) -> tuple[str, tuple]:
+    if expected_updated_at is None:
+        return "id=%s", (entity_id,)
+    return "id=%s AND updated_at=%s", (entity_id, expected_updated_at)
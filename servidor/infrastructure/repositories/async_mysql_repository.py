@@ -0,0 +1,52 @@
+from collections.abc import Callable, Sequence
+from typing import TypeVar
+from pymysql.err import IntegrityError, ProgrammingError, OperationalError
+from domain.repositories.async_entity_repository import IAsyncEntityRepository
+from application.exceptions import DatabaseError
+
+T = TypeVar("T")
+
+
+class AsyncMySQLRepository(IAsyncEntityRepository[T]):
+    # aiomysql reutiliza las excepciones de PyMySQL: se mapean igual que en los
+    # repositorios sync, y las filas se convierten con el mismo _row_to_* de cada uno.
+    def __init__(
+        self, connection, table: str, columns: Sequence[str], row_to_entity: Callable[[dict], T]
+    ) -> None:
+        self.connection = connection
+        self.table = table
+        self.columns = tuple(columns)
+        self.row_to_entity = row_to_entity
+
+    async def create(self, entity: T) -> T:
+        sql = (
+            f"INSERT INTO {self.table} ({', '.join(self.columns)}) "
+            f"VALUES ({', '.join(['%s'] * len(self.columns))})"
+        )
+        try:
+            async with self.connection.cursor() as cur:
+                await cur.execute(sql, tuple(getattr(entity, column) for column in self.columns))
+                entity.id = cur.lastrowid
+                # Como inserted_version: la version la fija la base, el POST la devuelve en ETag.
+                await cur.execute(f"SELECT updated_at FROM {self.table} WHERE id=%s", (entity.id,))
+                row = await cur.fetchone()
+            entity.updated_at = row["updated_at"] if row else None
+            return entity
+        except (IntegrityError, ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+
+    async def get_by_id(self, entity_id: int) -> T | None:
+        try:
+            async with self.connection.cursor() as cur:
+                await cur.execute(f"SELECT * FROM {self.table} WHERE id=%s", (entity_id,))
+                row = await cur.fetchone()
+        except (ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        return self.row_to_entity(row) if row else None
+
+    def _raise_db_error(self, exc: Exception) -> None:
+        if isinstance(exc, ProgrammingError) and exc.args and exc.args[0] == 1146:
+            raise DatabaseError(
+                f"Tabla '{self.table}' no existe. Ejecuta servidor/scripts/schema.sql en la base configurada."
+            ) from exc
+        raise DatabaseError("Error de base de datos") from exc
@@ -0,0 +1,16 @@
+from typing import TypeVar
+from domain.repositories.async_entity_repository import IAsyncEntityRepository
+
+T = TypeVar("T")
+
+
+class AsyncRepositoryAdapter(IAsyncEntityRepository[T]):
+    # Expone un repositorio sync que no hace I/O (en memoria) con la interfaz async.
+    def __init__(self, inner) -> None:
+        self.inner = inner
+
+    async def create(self, entity: T) -> T:
+        return self.inner.create(entity)
+
+    async def get_by_id(self, entity_id: int) -> T | None:
+        return self.inner.get_by_id(entity_id)
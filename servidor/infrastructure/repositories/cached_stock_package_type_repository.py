@@ -0,0 +1,82 @@
+from dataclasses import replace
+from datetime import datetime
+from domain.entities.stock_package_type import StockPackageType
+from domain.value_objects.stock_package_type_filter import StockPackageTypeFilter
+from domain.repositories.stock_package_type_repository import IStockPackageTypeRepository
+from infrastructure.cache.ttl_cache import TTLCache
+
+
+class CachedStockPackageTypeRepository(IStockPackageTypeRepository):
+    def __init__(self, inner: IStockPackageTypeRepository, cache: TTLCache) -> None:
+        self.inner = inner
+        self.cache = cache
+        self._pending: set[int] = set()
+
+    def create(self, package_type: StockPackageType) -> StockPackageType:
+        created = self.inner.create(package_type)
+        self._invalidate(created.id)
+        return created
+
+    def update(self, package_type: StockPackageType) -> StockPackageType:
+        updated = self.inner.update(package_type)
+        self._invalidate(package_type.id)
+        return updated
+
+    def update_fields(
+        self, package_type_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> StockPackageType | None:
+        updated = self.inner.update_fields(package_type_id, changes, expected_updated_at)
+        self._invalidate(package_type_id)
+        return updated
+
+    def delete(self, package_type_id: int, expected_updated_at: datetime | None = None) -> bool:
+        deleted = self.inner.delete(package_type_id, expected_updated_at)
+        self._invalidate(package_type_id)
+        return deleted
+
+    def flush_invalidations(self) -> None:
+        # La unidad de trabajo lo llama despues del commit/rollback: entre la escritura
+        # y el commit otra conexion pudo leer la fila vieja y volver a cachearla.
+        for package_type_id in self._pending:
+            self.cache.invalidate(package_type_id)
+        self._pending.clear()
+
+    def get_by_id(self, package_type_id: int) -> StockPackageType | None:
+        cached = self.cache.get(package_type_id)
+        if cached is not None:
+            return replace(cached)
+        package_type = self.inner.get_by_id(package_type_id)
+        if package_type is not None:
+            self.cache.set(package_type_id, replace(package_type))
+        return package_type
+
+    def get_many(self, package_type_ids: list[int]) -> list[StockPackageType]:
+        found: list[StockPackageType] = []
+        missing: list[int] = []
+        for package_type_id in dict.fromkeys(package_type_ids):
+            cached = self.cache.get(package_type_id)
+            if cached is not None:
+                found.append(replace(cached))
+            else:
+                missing.append(package_type_id)
+        if missing:
+            for package_type in self.inner.get_many(missing):
+                self.cache.set(package_type.id, replace(package_type))
+                found.append(package_type)
+        return found
+
+    def _invalidate(self, package_type_id: int) -> None:
+        self.cache.invalidate(package_type_id)
+        self._pending.add(package_type_id)
+
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: StockPackageTypeFilter | None = None,
+    ) -> list[StockPackageType]:
+        return self.inner.list(
+            limit=limit, offset=offset, after_id=after_id, before_id=before_id, filters=filters
+        )
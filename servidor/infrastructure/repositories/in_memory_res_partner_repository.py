@@ -1,28 +1,55 @@
+from dataclasses import replace
+from datetime import datetime
 from domain.entities.res_partner import ResPartner
+from domain.value_objects.res_partner_filter import ResPartnerFilter
 from domain.repositories.res_partner_repository import IResPartnerRepository
+from infrastructure.repositories._in_memory_index import InMemoryIndex, next_version
+from infrastructure.repositories._versioned_writes import ensure_version
 
 
 class InMemoryResPartnerRepository(IResPartnerRepository):
     def __init__(self) -> None:
-        self._items: dict[int, ResPartner] = {}
-        self._next_id = 1
+        self._index: InMemoryIndex[ResPartner] = InMemoryIndex()
 
     def create(self, partner: ResPartner) -> ResPartner:
-        partner.id = self._next_id
-        self._next_id += 1
-        self._items[partner.id] = partner
+        partner.id = self._index.next_id()
+        partner.updated_at = next_version(None)
+        self._index.put(partner.id, partner, partner.name)
         return partner
 
     def update(self, partner: ResPartner) -> ResPartner:
-        self._items[partner.id] = partner
+        self._index.put(partner.id, partner, partner.name)
         return partner
 
-    def delete(self, partner_id: int) -> None:
-        self._items.pop(partner_id, None)
+    def update_fields(
+        self, partner_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> ResPartner | None:
+        current = self._index.get(partner_id)
+        if current is None:
+            return None
+        ensure_version(current, expected_updated_at)
+        updated = replace(current, **changes, updated_at=next_version(current.updated_at))
+        self._index.put(partner_id, updated, updated.name)
+        return updated
+
+    def delete(self, partner_id: int, expected_updated_at: datetime | None = None) -> bool:
+        ensure_version(self._index.get(partner_id), expected_updated_at)
+        return self._index.remove(partner_id)
 
     def get_by_id(self, partner_id: int) -> ResPartner | None:
-        return self._items.get(partner_id)
+        return self._index.get(partner_id)
+
+    def get_many(self, partner_ids: list[int]) -> list[ResPartner]:
+        return self._index.get_many(partner_ids)
 
-    def list(self, limit: int, offset: int) -> list[ResPartner]:
-        items = list(self._items.values())
-        return items[offset : offset + limit]
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: ResPartnerFilter | None = None,
+    ) -> list[ResPartner]:
+        return self._index.page(
+            limit, offset, after_id, before_id, filters.matches if filters else None
+        )
@@ -1,28 +1,55 @@
+from dataclasses import replace
+from datetime import datetime
 from domain.entities.stock_package_type import StockPackageType
+from domain.value_objects.stock_package_type_filter import StockPackageTypeFilter
 from domain.repositories.stock_package_type_repository import IStockPackageTypeRepository
+from infrastructure.repositories._in_memory_index import InMemoryIndex, next_version
+from infrastructure.repositories._versioned_writes import ensure_version
 
 
 class InMemoryStockPackageTypeRepository(IStockPackageTypeRepository):
     def __init__(self) -> None:
-        self._items: dict[int, StockPackageType] = {}
-        self._next_id = 1
+        self._index: InMemoryIndex[StockPackageType] = InMemoryIndex()
 
     def create(self, package_type: StockPackageType) -> StockPackageType:
-        package_type.id = self._next_id
-        self._next_id += 1
-        self._items[package_type.id] = package_type
+        package_type.id = self._index.next_id()
+        package_type.updated_at = next_version(None)
+        self._index.put(package_type.id, package_type, package_type.name)
         return package_type
 
     def update(self, package_type: StockPackageType) -> StockPackageType:
-        self._items[package_type.id] = package_type
+        self._index.put(package_type.id, package_type, package_type.name)
         return package_type
 
-    def delete(self, package_type_id: int) -> None:
-        self._items.pop(package_type_id, None)
+    def update_fields(
+        self, package_type_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> StockPackageType | None:
+        current = self._index.get(package_type_id)
+        if current is None:
+            return None
+        ensure_version(current, expected_updated_at)
+        updated = replace(current, **changes, updated_at=next_version(current.updated_at))
+        self._index.put(package_type_id, updated, updated.name)
+        return updated
+
+    def delete(self, package_type_id: int, expected_updated_at: datetime | None = None) -> bool:
+        ensure_version(self._index.get(package_type_id), expected_updated_at)
+        return self._index.remove(package_type_id)
 
     def get_by_id(self, package_type_id: int) -> StockPackageType | None:
-        return self._items.get(package_type_id)
+        return self._index.get(package_type_id)
+
+    def get_many(self, package_type_ids: list[int]) -> list[StockPackageType]:
+        return self._index.get_many(package_type_ids)
 
-    def list(self, limit: int, offset: int) -> list[StockPackageType]:
-        items = list(self._items.values())
-        return items[offset : offset + limit]
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: StockPackageTypeFilter | None = None,
+    ) -> list[StockPackageType]:
+        return self._index.page(
+            limit, offset, after_id, before_id, filters.matches if filters else None
+        )
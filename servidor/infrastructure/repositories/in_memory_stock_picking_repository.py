@@ -1,28 +1,80 @@
+from dataclasses import replace
+from datetime import datetime
 from domain.entities.stock_picking import StockPicking
+from domain.value_objects.stock_picking_filter import StockPickingFilter
 from domain.repositories.stock_picking_repository import IStockPickingRepository
+from infrastructure.repositories._in_memory_index import InMemoryIndex, next_version
+from infrastructure.repositories._versioned_writes import ensure_version
 
 
 class InMemoryStockPickingRepository(IStockPickingRepository):
     def __init__(self) -> None:
-        self._items: dict[int, StockPicking] = {}
-        self._next_id = 1
+        self._index: InMemoryIndex[StockPicking] = InMemoryIndex()
 
     def create(self, picking: StockPicking) -> StockPicking:
-        picking.id = self._next_id
-        self._next_id += 1
-        self._items[picking.id] = picking
+        picking.id = self._index.next_id()
+        picking.updated_at = next_version(None)
+        self._index.put(picking.id, picking, picking.name)
         return picking
 
+    def name_matches(self, names: list[str]) -> list[tuple[str, int | None]]:
+        matches = []
+        for name in names:
+            current = self._index.get_by_name(name)
+            matches.append((name.lower(), current.id if current is not None else None))
+        return matches
+
+    def upsert_many(self, pickings: list[StockPicking]) -> list[StockPicking]:
+        results = []
+        for picking in pickings:
+            current = self._index.get_by_name(picking.name)
+            if current is None:
+                results.append(self.create(picking))
+                continue
+            picking.id = current.id
+            # Como ON DUPLICATE KEY UPDATE: la referencia guardada no cambia de mayusculas.
+            picking.name = current.name
+            picking.updated_at = next_version(current.updated_at)
+            self._index.put(picking.id, picking, picking.name)
+            results.append(picking)
+        return results
+
     def update(self, picking: StockPicking) -> StockPicking:
-        self._items[picking.id] = picking
+        self._index.put(picking.id, picking, picking.name)
         return picking
 
-    def delete(self, picking_id: int) -> None:
-        self._items.pop(picking_id, None)
+    def update_fields(
+        self, picking_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> StockPicking | None:
+        current = self._index.get(picking_id)
+        if current is None:
+            return None
+        ensure_version(current, expected_updated_at)
+        updated = replace(current, **changes, updated_at=next_version(current.updated_at))
+        self._index.put(picking_id, updated, updated.name)
+        return updated
+
+    def delete(self, picking_id: int, expected_updated_at: datetime | None = None) -> bool:
+        ensure_version(self._index.get(picking_id), expected_updated_at)
+        return self._index.remove(picking_id)
 
     def get_by_id(self, picking_id: int) -> StockPicking | None:
-        return self._items.get(picking_id)
+        return self._index.get(picking_id)
+
+    def get_many(self, picking_ids: list[int]) -> list[StockPicking]:
+        return self._index.get_many(picking_ids)
+
+    def get_by_name(self, name: str) -> StockPicking | None:
+        return self._index.get_by_name(name)
 
-    def list(self, limit: int, offset: int) -> list[StockPicking]:
-        items = list(self._items.values())
-        return items[offset : offset + limit]
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: StockPickingFilter | None = None,
+    ) -> list[StockPicking]:
+        return self._index.page(
+            limit, offset, after_id, before_id, filters.matches if filters else None
+        )
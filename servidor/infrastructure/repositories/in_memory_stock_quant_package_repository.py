@@ -1,34 +1,145 @@
+from dataclasses import replace
+from datetime import datetime
+from collections.abc import Iterator
 from domain.entities.stock_quant_package import StockQuantPackage
+from domain.value_objects.stock_quant_package_filter import StockQuantPackageFilter
+from domain.repositories.stock_package_type_repository import IStockPackageTypeRepository
+from domain.repositories.stock_picking_repository import IStockPickingRepository
+from domain.value_objects.picking_weight_summary import PickingWeightSummary
+from domain.value_objects.stock_quant_package_detail import StockQuantPackageDetail
 from domain.repositories.stock_quant_package_repository import IStockQuantPackageRepository
+from infrastructure.repositories._in_memory_index import InMemoryIndex, next_version
+from infrastructure.repositories._versioned_writes import ensure_version
 
 
 class InMemoryStockQuantPackageRepository(IStockQuantPackageRepository):
-    def __init__(self) -> None:
-        self._items: dict[int, StockQuantPackage] = {}
-        self._next_id = 1
+    def __init__(
+        self,
+        package_types: IStockPackageTypeRepository | None = None,
+        pickings: IStockPickingRepository | None = None,
+    ) -> None:
+        self._package_types = package_types
+        self._pickings = pickings
+        self._index: InMemoryIndex[StockQuantPackage] = InMemoryIndex()
 
     def create(self, package: StockQuantPackage) -> StockQuantPackage:
-        package.id = self._next_id
-        self._next_id += 1
-        self._items[package.id] = package
+        package.id = self._index.next_id()
+        package.updated_at = next_version(None)
+        self._index.put(package.id, package, package.name)
         return package
 
+    def create_many(self, packages: list[StockQuantPackage]) -> list[StockQuantPackage]:
+        return [self.create(package) for package in packages]
+
+    def name_matches(self, names: list[str]) -> list[tuple[str, int | None]]:
+        matches = []
+        for name in names:
+            current = self._index.get_by_name(name)
+            matches.append((name.lower(), current.id if current is not None else None))
+        return matches
+
+    def upsert_many(self, packages: list[StockQuantPackage]) -> list[StockQuantPackage]:
+        results = []
+        for package in packages:
+            current = self._index.get_by_name(package.name)
+            if current is None:
+                results.append(self.create(package))
+                continue
+            package.id = current.id
+            # Como ON DUPLICATE KEY UPDATE: la referencia guardada no cambia de mayusculas.
+            package.name = current.name
+            package.updated_at = next_version(current.updated_at)
+            self._index.put(package.id, package, package.name)
+            results.append(package)
+        return results
+
     def update(self, package: StockQuantPackage) -> StockQuantPackage:
-        self._items[package.id] = package
+        self._index.put(package.id, package, package.name)
         return package
 
-    def delete(self, package_id: int) -> None:
-        self._items.pop(package_id, None)
+    def update_fields(
+        self, package_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> StockQuantPackage | None:
+        current = self._index.get(package_id)
+        if current is None:
+            return None
+        ensure_version(current, expected_updated_at)
+        updated = replace(current, **changes, updated_at=next_version(current.updated_at))
+        self._index.put(package_id, updated, updated.name)
+        return updated
+
+    def delete(self, package_id: int, expected_updated_at: datetime | None = None) -> bool:
+        ensure_version(self._index.get(package_id), expected_updated_at)
+        return self._index.remove(package_id)
 
     def get_by_id(self, package_id: int) -> StockQuantPackage | None:
-        return self._items.get(package_id)
+        return self._index.get(package_id)
+
+    def get_many(self, package_ids: list[int]) -> list[StockQuantPackage]:
+        return self._index.get_many(package_ids)
 
     def get_by_name(self, name: str) -> StockQuantPackage | None:
-        for item in self._items.values():
-            if item.name == name:
-                return item
-        return None
-
-    def list(self, limit: int, offset: int) -> list[StockQuantPackage]:
-        items = list(self._items.values())
-        return items[offset : offset + limit]
+        return self._index.get_by_name(name)
+
+    def list_details(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        with_package_type: bool = False,
+        with_picking: bool = False,
+        filters: StockQuantPackageFilter | None = None,
+    ) -> list[StockQuantPackageDetail]:
+        details = []
+        for package in self.list(limit, offset, after_id, before_id, filters):
+            package_type = None
+            if with_package_type and self._package_types is not None:
+                package_type = self._package_types.get_by_id(package.package_type_id)
+            picking = None
+            if with_picking and self._pickings is not None:
+                picking = self._pickings.get_by_id(package.picking_id)
+            details.append(StockQuantPackageDetail(package, package_type, picking))
+        return details
+
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: StockQuantPackageFilter | None = None,
+    ) -> list[StockQuantPackage]:
+        return self._index.page(
+            limit, offset, after_id, before_id, filters.matches if filters else None
+        )
+
+    def stream(
+        self, picking_id: int | None = None, package_type_id: int | None = None
+    ) -> Iterator[StockQuantPackage]:
+        for package in self._index.values():
+            if picking_id is not None and package.picking_id != picking_id:
+                continue
+            if package_type_id is not None and package.package_type_id != package_type_id:
+                continue
+            yield package
+
+    def summarize_by_picking(self, picking_id: int) -> PickingWeightSummary | None:
+        packages = [p for p in self._index.values() if p.picking_id == picking_id]
+        if not packages:
+            return None
+        gross = sum(p.shipping_weight for p in packages)
+        tare = sum(self._tare(p.package_type_id) for p in packages)
+        return PickingWeightSummary(
+            picking_id=picking_id,
+            package_count=len(packages),
+            gross_weight=gross,
+            tare_weight=tare,
+            net_weight=gross - tare,
+        )
+
+    def _tare(self, package_type_id: int) -> float:
+        if self._package_types is None:
+            return 0.0
+        package_type = self._package_types.get_by_id(package_type_id)
+        return package_type.weight if package_type else 0.0
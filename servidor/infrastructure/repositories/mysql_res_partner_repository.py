@@ -1,8 +1,22 @@
+from datetime import datetime
 from pymysql.connections import Connection
 from pymysql.err import IntegrityError, ProgrammingError, OperationalError
 from domain.entities.res_partner import ResPartner
+from domain.value_objects.res_partner_filter import ResPartnerFilter
 from domain.repositories.res_partner_repository import IResPartnerRepository
 from application.exceptions import DatabaseError
+from infrastructure.repositories._filters import name_prefix_conditions
+from infrastructure.repositories._lookup import select_by_ids
+from infrastructure.repositories._pagination import keyset_query
+from infrastructure.repositories._versioned_writes import (
+    delete_versioned,
+    ensure_version,
+    inserted_version,
+    update_returning,
+)
+
+
+UPDATABLE_COLUMNS = ("name", "email", "phone")
 
 
 class MySQLResPartnerRepository(IResPartnerRepository):
@@ -15,6 +29,7 @@ class MySQLResPartnerRepository(IResPartnerRepository):
             with self.connection.cursor() as cur:
                 cur.execute(sql, (partner.name, partner.email, partner.phone))
                 partner.id = cur.lastrowid
+                partner.updated_at = inserted_version(cur, "res_partner", partner.id)
             return partner
         except (IntegrityError, ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
@@ -28,10 +43,26 @@ class MySQLResPartnerRepository(IResPartnerRepository):
         except (IntegrityError, ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
 
-    def delete(self, partner_id: int) -> None:
+    def update_fields(
+        self, partner_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> ResPartner | None:
+        if not changes:
+            current = self.get_by_id(partner_id)
+            ensure_version(current, expected_updated_at)
+            return current
+        try:
+            with self.connection.cursor() as cur:
+                row = update_returning(
+                    cur, "res_partner", partner_id, changes, UPDATABLE_COLUMNS, expected_updated_at
+                )
+        except (IntegrityError, ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        return self._row_to_partner(row) if row else None
+
+    def delete(self, partner_id: int, expected_updated_at: datetime | None = None) -> bool:
         try:
             with self.connection.cursor() as cur:
-                cur.execute("DELETE FROM res_partner WHERE id=%s", (partner_id,))
+                return delete_versioned(cur, "res_partner", partner_id, expected_updated_at)
         except (ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
 
@@ -44,22 +75,43 @@ class MySQLResPartnerRepository(IResPartnerRepository):
             self._raise_db_error(exc)
         return self._row_to_partner(row) if row else None
 
-    def list(self, limit: int, offset: int) -> list[ResPartner]:
-        sql = "SELECT * FROM res_partner ORDER BY id DESC LIMIT %s OFFSET %s"
+    def get_many(self, partner_ids: list[int]) -> list[ResPartner]:
         try:
             with self.connection.cursor() as cur:
-                cur.execute(sql, (limit, offset))
-                rows = cur.fetchall()
+                rows = select_by_ids(cur, "res_partner", partner_ids)
         except (ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
         return [self._row_to_partner(r) for r in rows]
 
-    def _row_to_partner(self, row: dict) -> ResPartner:
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: ResPartnerFilter | None = None,
+    ) -> list[ResPartner]:
+        conditions, params = name_prefix_conditions(filters.name_prefix if filters else None)
+        sql, params, reverse = keyset_query(
+            "SELECT * FROM res_partner", conditions, params, limit, offset, after_id, before_id
+        )
+        try:
+            with self.connection.cursor() as cur:
+                cur.execute(sql, params)
+                rows = cur.fetchall()
+        except (ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        items = [self._row_to_partner(r) for r in rows]
+        return items[::-1] if reverse else items
+
+    @staticmethod
+    def _row_to_partner(row: dict) -> ResPartner:
         return ResPartner(
             id=row["id"],
             name=row["name"],
             email=row.get("email"),
             phone=row.get("phone"),
+            updated_at=row.get("updated_at"),
         )
 
     def _raise_db_error(self, exc: Exception) -> None:
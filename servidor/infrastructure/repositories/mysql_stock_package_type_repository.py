@@ -1,8 +1,22 @@
+from datetime import datetime
 from pymysql.connections import Connection
 from pymysql.err import IntegrityError, ProgrammingError, OperationalError
 from domain.entities.stock_package_type import StockPackageType
+from domain.value_objects.stock_package_type_filter import StockPackageTypeFilter
 from domain.repositories.stock_package_type_repository import IStockPackageTypeRepository
 from application.exceptions import DatabaseError
+from infrastructure.repositories._filters import name_prefix_conditions
+from infrastructure.repositories._lookup import select_by_ids
+from infrastructure.repositories._pagination import keyset_query
+from infrastructure.repositories._versioned_writes import (
+    delete_versioned,
+    ensure_version,
+    inserted_version,
+    update_returning,
+)
+
+
+UPDATABLE_COLUMNS = ("name", "weight")
 
 
 class MySQLStockPackageTypeRepository(IStockPackageTypeRepository):
@@ -15,6 +29,7 @@ class MySQLStockPackageTypeRepository(IStockPackageTypeRepository):
             with self.connection.cursor() as cur:
                 cur.execute(sql, (package_type.name, package_type.weight))
                 package_type.id = cur.lastrowid
+                package_type.updated_at = inserted_version(cur, "stock_package_type", package_type.id)
             return package_type
         except (IntegrityError, ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
@@ -28,10 +43,26 @@ class MySQLStockPackageTypeRepository(IStockPackageTypeRepository):
         except (IntegrityError, ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
 
-    def delete(self, package_type_id: int) -> None:
+    def update_fields(
+        self, package_type_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> StockPackageType | None:
+        if not changes:
+            current = self.get_by_id(package_type_id)
+            ensure_version(current, expected_updated_at)
+            return current
+        try:
+            with self.connection.cursor() as cur:
+                row = update_returning(
+                    cur, "stock_package_type", package_type_id, changes, UPDATABLE_COLUMNS, expected_updated_at
+                )
+        except (IntegrityError, ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        return self._row_to_package_type(row) if row else None
+
+    def delete(self, package_type_id: int, expected_updated_at: datetime | None = None) -> bool:
         try:
             with self.connection.cursor() as cur:
-                cur.execute("DELETE FROM stock_package_type WHERE id=%s", (package_type_id,))
+                return delete_versioned(cur, "stock_package_type", package_type_id, expected_updated_at)
         except (ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
 
@@ -44,21 +75,42 @@ class MySQLStockPackageTypeRepository(IStockPackageTypeRepository):
             self._raise_db_error(exc)
         return self._row_to_package_type(row) if row else None
 
-    def list(self, limit: int, offset: int) -> list[StockPackageType]:
-        sql = "SELECT * FROM stock_package_type ORDER BY id DESC LIMIT %s OFFSET %s"
+    def get_many(self, package_type_ids: list[int]) -> list[StockPackageType]:
         try:
             with self.connection.cursor() as cur:
-                cur.execute(sql, (limit, offset))
-                rows = cur.fetchall()
+                rows = select_by_ids(cur, "stock_package_type", package_type_ids)
         except (ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
         return [self._row_to_package_type(r) for r in rows]
 
-    def _row_to_package_type(self, row: dict) -> StockPackageType:
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: StockPackageTypeFilter | None = None,
+    ) -> list[StockPackageType]:
+        conditions, params = name_prefix_conditions(filters.name_prefix if filters else None)
+        sql, params, reverse = keyset_query(
+            "SELECT * FROM stock_package_type", conditions, params, limit, offset, after_id, before_id
+        )
+        try:
+            with self.connection.cursor() as cur:
+                cur.execute(sql, params)
+                rows = cur.fetchall()
+        except (ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        items = [self._row_to_package_type(r) for r in rows]
+        return items[::-1] if reverse else items
+
+    @staticmethod
+    def _row_to_package_type(row: dict) -> StockPackageType:
         return StockPackageType(
             id=row["id"],
             name=row["name"],
             weight=float(row["weight"]),
+            updated_at=row.get("updated_at"),
         )
 
     def _raise_db_error(self, exc: Exception) -> None:
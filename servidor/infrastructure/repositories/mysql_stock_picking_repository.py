@@ -1,8 +1,23 @@
+from datetime import datetime
 from pymysql.connections import Connection
 from pymysql.err import IntegrityError, ProgrammingError, OperationalError
 from domain.entities.stock_picking import StockPicking
+from domain.value_objects.stock_picking_filter import StockPickingFilter
 from domain.repositories.stock_picking_repository import IStockPickingRepository
 from application.exceptions import DatabaseError
+from infrastructure.repositories._filters import name_prefix_conditions
+from infrastructure.repositories._lookup import select_by_ids
+from infrastructure.repositories._pagination import keyset_query
+from infrastructure.repositories._upsert import name_matches, upsert_by_name
+from infrastructure.repositories._versioned_writes import (
+    delete_versioned,
+    ensure_version,
+    inserted_version,
+    update_returning,
+)
+
+
+UPDATABLE_COLUMNS = ("name", "partner_id")
 
 
 class MySQLStockPickingRepository(IStockPickingRepository):
@@ -15,10 +30,29 @@ class MySQLStockPickingRepository(IStockPickingRepository):
             with self.connection.cursor() as cur:
                 cur.execute(sql, (picking.name, picking.partner_id))
                 picking.id = cur.lastrowid
+                picking.updated_at = inserted_version(cur, "stock_picking", picking.id)
             return picking
         except (IntegrityError, ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
 
+    def name_matches(self, names: list[str]) -> list[tuple[str, int | None]]:
+        try:
+            with self.connection.cursor() as cur:
+                return name_matches(cur, "stock_picking", names)
+        except (IntegrityError, ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+
+    def upsert_many(self, pickings: list[StockPicking]) -> list[StockPicking]:
+        if not pickings:
+            return []
+        rows = [(p.name, p.partner_id) for p in pickings]
+        try:
+            with self.connection.cursor() as cur:
+                stored = upsert_by_name(cur, "stock_picking", UPDATABLE_COLUMNS, rows)
+        except (IntegrityError, ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        return [self._row_to_picking(row) for row in stored]
+
     def update(self, picking: StockPicking) -> StockPicking:
         sql = "UPDATE stock_picking SET name=%s, partner_id=%s WHERE id=%s"
         try:
@@ -28,10 +62,26 @@ class MySQLStockPickingRepository(IStockPickingRepository):
         except (IntegrityError, ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
 
-    def delete(self, picking_id: int) -> None:
+    def update_fields(
+        self, picking_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> StockPicking | None:
+        if not changes:
+            current = self.get_by_id(picking_id)
+            ensure_version(current, expected_updated_at)
+            return current
         try:
             with self.connection.cursor() as cur:
-                cur.execute("DELETE FROM stock_picking WHERE id=%s", (picking_id,))
+                row = update_returning(
+                    cur, "stock_picking", picking_id, changes, UPDATABLE_COLUMNS, expected_updated_at
+                )
+        except (IntegrityError, ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        return self._row_to_picking(row) if row else None
+
+    def delete(self, picking_id: int, expected_updated_at: datetime | None = None) -> bool:
+        try:
+            with self.connection.cursor() as cur:
+                return delete_versioned(cur, "stock_picking", picking_id, expected_updated_at)
         except (ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
 
@@ -44,21 +94,59 @@ class MySQLStockPickingRepository(IStockPickingRepository):
             self._raise_db_error(exc)
         return self._row_to_picking(row) if row else None
 
-    def list(self, limit: int, offset: int) -> list[StockPicking]:
-        sql = "SELECT * FROM stock_picking ORDER BY id DESC LIMIT %s OFFSET %s"
+    def get_many(self, picking_ids: list[int]) -> list[StockPicking]:
         try:
             with self.connection.cursor() as cur:
-                cur.execute(sql, (limit, offset))
-                rows = cur.fetchall()
+                rows = select_by_ids(cur, "stock_picking", picking_ids)
         except (ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
         return [self._row_to_picking(r) for r in rows]
 
-    def _row_to_picking(self, row: dict) -> StockPicking:
+    def get_by_name(self, name: str) -> StockPicking | None:
+        try:
+            with self.connection.cursor() as cur:
+                cur.execute("SELECT * FROM stock_picking WHERE name=%s", (name,))
+                row = cur.fetchone()
+        except (ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        return self._row_to_picking(row) if row else None
+
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: StockPickingFilter | None = None,
+    ) -> list[StockPicking]:
+        conditions: list[str] = []
+        params: list = []
+        if filters is not None:
+            if filters.partner_id is not None:
+                conditions.append("partner_id = %s")
+                params.append(filters.partner_id)
+            name_conditions, name_params = name_prefix_conditions(filters.name_prefix)
+            conditions += name_conditions
+            params += name_params
+        sql, params, reverse = keyset_query(
+            "SELECT * FROM stock_picking", conditions, params, limit, offset, after_id, before_id
+        )
+        try:
+            with self.connection.cursor() as cur:
+                cur.execute(sql, params)
+                rows = cur.fetchall()
+        except (ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        items = [self._row_to_picking(r) for r in rows]
+        return items[::-1] if reverse else items
+
+    @staticmethod
+    def _row_to_picking(row: dict) -> StockPicking:
         return StockPicking(
             id=row["id"],
             name=row["name"],
             partner_id=row["partner_id"],
+            updated_at=row.get("updated_at"),
         )
 
     def _raise_db_error(self, exc: Exception) -> None:
@@ -1,8 +1,50 @@
+from collections.abc import Iterator
+from datetime import datetime
 from pymysql.connections import Connection
+from pymysql.cursors import SSDictCursor
 from pymysql.err import IntegrityError, ProgrammingError, OperationalError
+from domain.entities.stock_package_type import StockPackageType
+from domain.entities.stock_picking import StockPicking
 from domain.entities.stock_quant_package import StockQuantPackage
+from domain.value_objects.stock_quant_package_filter import StockQuantPackageFilter
 from domain.repositories.stock_quant_package_repository import IStockQuantPackageRepository
+from domain.value_objects.picking_weight_summary import PickingWeightSummary
+from domain.value_objects.stock_quant_package_detail import StockQuantPackageDetail
 from application.exceptions import DatabaseError
+from infrastructure.repositories._lookup import select_by_ids
+from infrastructure.repositories._pagination import keyset_query
+from infrastructure.repositories._upsert import name_matches, upsert_by_name
+from infrastructure.repositories._versioned_writes import (
+    delete_versioned,
+    ensure_version,
+    inserted_version,
+    update_returning,
+)
+
+
+UPDATABLE_COLUMNS = ("name", "package_type_id", "shipping_weight", "picking_id")
+
+
+def _package_conditions(
+    filters: StockQuantPackageFilter | None, alias: str = ""
+) -> tuple[list[str], list]:
+    conditions: list[str] = []
+    params: list = []
+    if filters is None:
+        return conditions, params
+    if filters.picking_id is not None:
+        conditions.append(f"{alias}picking_id = %s")
+        params.append(filters.picking_id)
+    if filters.package_type_id is not None:
+        conditions.append(f"{alias}package_type_id = %s")
+        params.append(filters.package_type_id)
+    if filters.min_weight is not None:
+        conditions.append(f"{alias}shipping_weight >= %s")
+        params.append(filters.min_weight)
+    if filters.max_weight is not None:
+        conditions.append(f"{alias}shipping_weight <= %s")
+        params.append(filters.max_weight)
+    return conditions, params
 
 
 class MySQLStockQuantPackageRepository(IStockQuantPackageRepository):
@@ -26,10 +68,58 @@ class MySQLStockQuantPackageRepository(IStockQuantPackageRepository):
                     ),
                 )
                 package.id = cur.lastrowid
+                package.updated_at = inserted_version(cur, "stock_quant_package", package.id)
             return package
         except (IntegrityError, ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
 
+    def create_many(self, packages: list[StockQuantPackage]) -> list[StockQuantPackage]:
+        if not packages:
+            return []
+        sql = (
+            "INSERT INTO stock_quant_package (name, package_type_id, shipping_weight, picking_id) "
+            "VALUES (%s, %s, %s, %s)"
+        )
+        rows = [
+            (p.name, p.package_type_id, p.shipping_weight, p.picking_id) for p in packages
+        ]
+        names = [p.name for p in packages]
+        placeholders = ", ".join(["%s"] * len(names))
+        try:
+            with self.connection.cursor() as cur:
+                cur.executemany(sql, rows)
+                cur.execute(
+                    f"SELECT id, name, updated_at FROM stock_quant_package WHERE name IN ({placeholders})",
+                    names,
+                )
+                rows = {row["name"]: row for row in cur.fetchall()}
+        except (IntegrityError, ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        for package in packages:
+            package.id = rows[package.name]["id"]
+            package.updated_at = rows[package.name]["updated_at"]
+        return packages
+
+    def name_matches(self, names: list[str]) -> list[tuple[str, int | None]]:
+        try:
+            with self.connection.cursor() as cur:
+                return name_matches(cur, "stock_quant_package", names)
+        except (IntegrityError, ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+
+    def upsert_many(self, packages: list[StockQuantPackage]) -> list[StockQuantPackage]:
+        if not packages:
+            return []
+        rows = [
+            (p.name, p.package_type_id, p.shipping_weight, p.picking_id) for p in packages
+        ]
+        try:
+            with self.connection.cursor() as cur:
+                stored = upsert_by_name(cur, "stock_quant_package", UPDATABLE_COLUMNS, rows)
+        except (IntegrityError, ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        return [self._row_to_package(row) for row in stored]
+
     def update(self, package: StockQuantPackage) -> StockQuantPackage:
         sql = (
             "UPDATE stock_quant_package SET name=%s, package_type_id=%s, shipping_weight=%s, "
@@ -51,10 +141,26 @@ class MySQLStockQuantPackageRepository(IStockQuantPackageRepository):
         except (IntegrityError, ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
 
-    def delete(self, package_id: int) -> None:
+    def update_fields(
+        self, package_id: int, changes: dict, expected_updated_at: datetime | None = None
+    ) -> StockQuantPackage | None:
+        if not changes:
+            current = self.get_by_id(package_id)
+            ensure_version(current, expected_updated_at)
+            return current
+        try:
+            with self.connection.cursor() as cur:
+                row = update_returning(
+                    cur, "stock_quant_package", package_id, changes, UPDATABLE_COLUMNS, expected_updated_at
+                )
+        except (IntegrityError, ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        return self._row_to_package(row) if row else None
+
+    def delete(self, package_id: int, expected_updated_at: datetime | None = None) -> bool:
         try:
             with self.connection.cursor() as cur:
-                cur.execute("DELETE FROM stock_quant_package WHERE id=%s", (package_id,))
+                return delete_versioned(cur, "stock_quant_package", package_id, expected_updated_at)
         except (ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
 
@@ -67,6 +173,14 @@ class MySQLStockQuantPackageRepository(IStockQuantPackageRepository):
             self._raise_db_error(exc)
         return self._row_to_package(row) if row else None
 
+    def get_many(self, package_ids: list[int]) -> list[StockQuantPackage]:
+        try:
+            with self.connection.cursor() as cur:
+                rows = select_by_ids(cur, "stock_quant_package", package_ids)
+        except (ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        return [self._row_to_package(r) for r in rows]
+
     def get_by_name(self, name: str) -> StockQuantPackage | None:
         try:
             with self.connection.cursor() as cur:
@@ -76,23 +190,150 @@ class MySQLStockQuantPackageRepository(IStockQuantPackageRepository):
             self._raise_db_error(exc)
         return self._row_to_package(row) if row else None
 
-    def list(self, limit: int, offset: int) -> list[StockQuantPackage]:
-        sql = "SELECT * FROM stock_quant_package ORDER BY id DESC LIMIT %s OFFSET %s"
+    def list_details(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        with_package_type: bool = False,
+        with_picking: bool = False,
+        filters: StockQuantPackageFilter | None = None,
+    ) -> list[StockQuantPackageDetail]:
+        columns = ["p.id", "p.name", "p.package_type_id", "p.shipping_weight", "p.picking_id", "p.updated_at"]
+        joins = []
+        if with_package_type:
+            columns += ["t.name AS type_name", "t.weight AS type_weight", "t.updated_at AS type_updated_at"]
+            joins.append("LEFT JOIN stock_package_type t ON t.id = p.package_type_id")
+        if with_picking:
+            columns += [
+                "k.name AS picking_name",
+                "k.partner_id AS picking_partner_id",
+                "k.updated_at AS picking_updated_at",
+            ]
+            joins.append("LEFT JOIN stock_picking k ON k.id = p.picking_id")
+        select_sql = " ".join(
+            [f"SELECT {', '.join(columns)} FROM stock_quant_package p", *joins]
+        )
+        conditions, params = _package_conditions(filters, alias="p.")
+        sql, params, reverse = keyset_query(
+            select_sql, conditions, params, limit, offset, after_id, before_id, id_column="p.id"
+        )
+        try:
+            with self.connection.cursor() as cur:
+                cur.execute(sql, params)
+                rows = cur.fetchall()
+        except (ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        items = [self._row_to_detail(r) for r in rows]
+        return items[::-1] if reverse else items
+
+    def list(
+        self,
+        limit: int,
+        offset: int,
+        after_id: int | None = None,
+        before_id: int | None = None,
+        filters: StockQuantPackageFilter | None = None,
+    ) -> list[StockQuantPackage]:
+        conditions, params = _package_conditions(filters)
+        sql, params, reverse = keyset_query(
+            "SELECT * FROM stock_quant_package", conditions, params, limit, offset, after_id, before_id
+        )
         try:
             with self.connection.cursor() as cur:
-                cur.execute(sql, (limit, offset))
+                cur.execute(sql, params)
                 rows = cur.fetchall()
         except (ProgrammingError, OperationalError) as exc:
             self._raise_db_error(exc)
-        return [self._row_to_package(r) for r in rows]
+        items = [self._row_to_package(r) for r in rows]
+        return items[::-1] if reverse else items
 
-    def _row_to_package(self, row: dict) -> StockQuantPackage:
+    def stream(
+        self,
+        picking_id: int | None = None,
+        package_type_id: int | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[StockQuantPackage]:
+        conditions: list[str] = []
+        params: list = []
+        if picking_id is not None:
+            conditions.append("picking_id = %s")
+            params.append(picking_id)
+        if package_type_id is not None:
+            conditions.append("package_type_id = %s")
+            params.append(package_type_id)
+        sql = "SELECT id, name, package_type_id, shipping_weight, picking_id FROM stock_quant_package"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY id"
+        try:
+            with self.connection.cursor(SSDictCursor) as cur:
+                cur.execute(sql, params)
+                while True:
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield self._row_to_package(row)
+        except (ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+
+    def summarize_by_picking(self, picking_id: int) -> PickingWeightSummary | None:
+        sql = (
+            "SELECT p.picking_id, COUNT(*) AS package_count, "
+            "SUM(p.shipping_weight) AS gross_weight, SUM(t.weight) AS tare_weight, "
+            "SUM(p.shipping_weight - t.weight) AS net_weight "
+            "FROM stock_quant_package p "
+            "JOIN stock_package_type t ON t.id = p.package_type_id "
+            "WHERE p.picking_id = %s GROUP BY p.picking_id"
+        )
+        try:
+            with self.connection.cursor() as cur:
+                cur.execute(sql, (picking_id,))
+                row = cur.fetchone()
+        except (ProgrammingError, OperationalError) as exc:
+            self._raise_db_error(exc)
+        if not row:
+            return None
+        return PickingWeightSummary(
+            picking_id=row["picking_id"],
+            package_count=row["package_count"],
+            gross_weight=float(row["gross_weight"]),
+            tare_weight=float(row["tare_weight"]),
+            net_weight=float(row["net_weight"]),
+        )
+
+    @staticmethod
+    def _row_to_package(row: dict) -> StockQuantPackage:
         return StockQuantPackage(
             id=row["id"],
             name=row["name"],
             package_type_id=row["package_type_id"],
             shipping_weight=float(row["shipping_weight"]),
             picking_id=row["picking_id"],
+            updated_at=row.get("updated_at"),
+        )
+
+    def _row_to_detail(self, row: dict) -> StockQuantPackageDetail:
+        package_type = None
+        if row.get("type_name") is not None:
+            package_type = StockPackageType(
+                id=row["package_type_id"],
+                name=row["type_name"],
+                weight=float(row["type_weight"]),
+                updated_at=row.get("type_updated_at"),
+            )
+        picking = None
+        if row.get("picking_name") is not None:
+            picking = StockPicking(
+                id=row["picking_id"],
+                name=row["picking_name"],
+                partner_id=row["picking_partner_id"],
+                updated_at=row.get("picking_updated_at"),
+            )
+        return StockQuantPackageDetail(
+            package=self._row_to_package(row), package_type=package_type, picking=picking
         )
 
     def _raise_db_error(self, exc: Exception) -> None:
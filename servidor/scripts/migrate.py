@@ -0,0 +1,37 @@
+import argparse
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from dotenv import load_dotenv
+from infrastructure.db.migrations import MigrationRunner, load_migrations
+from infrastructure.db.mysql_connection import MySQLConnectionFactory
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Aplica las migraciones pendientes del esquema MySQL")
+    parser.add_argument("--status", action="store_true", help="solo muestra la version actual y las pendientes")
+    args = parser.parse_args()
+
+    load_dotenv()
+    runner = MigrationRunner(MySQLConnectionFactory.from_env(), load_migrations(BASE_DIR / "scripts"))
+    current = runner.current_version()
+    pending = [m for m in runner.migrations if m.version > current]
+    print(f"version actual: {current}  ultima: {runner.latest_version}")
+    if args.status:
+        for migration in pending:
+            print(f"  pendiente {migration.version:04d} {migration.name}")
+        return 0
+    if not pending:
+        print("El esquema esta al dia")
+        return 0
+    for migration in runner.migrate():
+        print(f"  aplicada {migration.version:04d} {migration.name}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
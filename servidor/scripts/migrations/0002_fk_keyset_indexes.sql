@@ -0,0 +1,31 @@
+-- Indices compuestos (fk, id) para filtros + ORDER BY id de los listados keyset.
+-- Reemplazan a los indices implicitos de las FK, que quedarian redundantes.
+-- Cada ALTER es atomico y se salta si su indice ya existe: la migracion se puede
+-- reejecutar si fallo a mitad de camino (el DDL de MySQL hace commit implicito).
+SET @ddl = IF(
+  (SELECT COUNT(*) FROM information_schema.statistics
+   WHERE table_schema = DATABASE() AND table_name = 'stock_quant_package'
+     AND index_name = 'ix_stock_quant_package_picking_id') = 0,
+  'ALTER TABLE stock_quant_package
+     ADD INDEX ix_stock_quant_package_picking_id (picking_id, id),
+     ADD INDEX ix_stock_quant_package_package_type_id (package_type_id, id),
+     DROP INDEX fk_stock_quant_package_picking,
+     DROP INDEX fk_stock_quant_package_type',
+  'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+  (SELECT COUNT(*) FROM information_schema.statistics
+   WHERE table_schema = DATABASE() AND table_name = 'stock_picking'
+     AND index_name = 'ix_stock_picking_partner_id') = 0,
+  'ALTER TABLE stock_picking
+     ADD INDEX ix_stock_picking_partner_id (partner_id, id),
+     DROP INDEX fk_stock_picking_partner',
+  'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
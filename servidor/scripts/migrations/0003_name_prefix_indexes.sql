@@ -0,0 +1,23 @@
+-- Filtros por prefijo de nombre (name LIKE 'x%'); stock_picking ya tiene uq_stock_picking_name.
+-- Cada indice se crea solo si falta, asi la migracion se puede reejecutar.
+SET @ddl = IF(
+  (SELECT COUNT(*) FROM information_schema.statistics
+   WHERE table_schema = DATABASE() AND table_name = 'res_partner'
+     AND index_name = 'ix_res_partner_name') = 0,
+  'ALTER TABLE res_partner ADD INDEX ix_res_partner_name (name)',
+  'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+  (SELECT COUNT(*) FROM information_schema.statistics
+   WHERE table_schema = DATABASE() AND table_name = 'stock_package_type'
+     AND index_name = 'ix_stock_package_type_name') = 0,
+  'ALTER TABLE stock_package_type ADD INDEX ix_stock_package_type_name (name)',
+  'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
@@ -0,0 +1,11 @@
+-- Respuestas guardadas por Idempotency-Key (IDEMPOTENCY_STORE=mysql). key_hash es el
+-- sha256 de ruta + clave; status_code NULL marca un pedido todavia en curso.
+CREATE TABLE IF NOT EXISTS idempotency_key (
+  key_hash CHAR(64) NOT NULL PRIMARY KEY,
+  fingerprint CHAR(64) NOT NULL,
+  status_code SMALLINT NULL,
+  headers TEXT NULL,
+  body MEDIUMBLOB NULL,
+  expires_at TIMESTAMP(6) NOT NULL,
+  KEY ix_idempotency_key_expires_at (expires_at)
+) CHARACTER SET utf8mb4;
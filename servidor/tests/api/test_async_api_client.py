@@ -0,0 +1,76 @@
+import asyncio
+import inspect
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from cliente.infrastructure.api_client import ApiClient, ApiError
+from cliente.infrastructure.async_api_client import AsyncApiClient
+from cliente.infrastructure.http_options import HttpOptions
+from infrastructure.db.in_memory_unit_of_work import InMemoryUnitOfWork
+from servidor.app.main import create_app
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _public_methods(cls) -> set[str]:
+    return {name for name, _ in inspect.getmembers(cls, inspect.isfunction) if not name.startswith("_")}
+
+
+def test_async_client_mirrors_sync_client():
+    # La cache de respuestas es propia de la CLI (ApiClient).
+    assert _public_methods(ApiClient) - {"cache_stats"} <= _public_methods(AsyncApiClient)
+
+
+@pytest.mark.anyio
+async def test_fan_out_keeps_order_and_reports_errors(monkeypatch):
+    uow = InMemoryUnitOfWork()
+    monkeypatch.setattr("servidor.app.main.uow_factory", lambda: uow)
+    transport = httpx.ASGITransport(app=create_app())
+    async with AsyncApiClient("http://test", options=HttpOptions(retries=0), transport=transport) as api:
+        partners = await api.create_many_res_partners(
+            [{"name": f"P{i}"} for i in range(6)] + [{"name": ""}], concurrency=3
+        )
+        assert [p.name for p in partners[:6]] == [f"P{i}" for i in range(6)]
+        assert isinstance(partners[6], ApiError) and partners[6].status_code == 400
+
+        ids = [p.id for p in reversed(partners[:6])]
+        fetched = await api.get_many_res_partners(ids + [999], concurrency=2)
+        assert [p.id for p in fetched[:6]] == ids
+        assert isinstance(fetched[6], ApiError) and fetched[6].status_code == 404
+
+        looked_up = await api.lookup_res_partners([ids[0], 999, ids[1]])
+        assert [p.name if p else None for p in looked_up] == [partners[5].name, None, partners[4].name]
+
+
+@pytest.mark.anyio
+async def test_fan_out_respects_concurrency_limit():
+    running = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        package_id = int(request.url.path.rsplit("/", 1)[1])
+        return httpx.Response(
+            200,
+            json={
+                "id": package_id,
+                "name": f"PK{package_id}",
+                "package_type_id": 1,
+                "shipping_weight": 1.0,
+                "picking_id": 1,
+            },
+        )
+
+    async with AsyncApiClient("http://test", transport=httpx.MockTransport(handler)) as api:
+        packages = await api.get_many_stock_quant_packages(range(10), concurrency=3)
+    assert [p.id for p in packages] == list(range(10))
+    assert peak == 3
@@ -0,0 +1,90 @@
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from infrastructure.db.async_in_memory_unit_of_work import AsyncInMemoryUnitOfWork
+from infrastructure.db.in_memory_unit_of_work import InMemoryUnitOfWork
+from servidor.app.main import create_app
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _install(monkeypatch, api_async: bool) -> dict[str, int]:
+    # Cuenta que UoW atiende cada request para saber si respondio el handler sync o el async.
+    uow = InMemoryUnitOfWork()
+    async_uow = AsyncInMemoryUnitOfWork(uow)
+    calls = {"sync": 0, "async": 0}
+
+    def _sync():
+        calls["sync"] += 1
+        return uow
+
+    def _async():
+        calls["async"] += 1
+        return async_uow
+
+    monkeypatch.setattr("servidor.app.main.api_async", api_async)
+    monkeypatch.setattr("servidor.app.main.uow_factory", _sync)
+    monkeypatch.setattr("servidor.app.main.async_uow_factory", _async)
+    return calls
+
+
+@pytest.mark.anyio
+async def test_async_routes_take_precedence_over_sync(monkeypatch):
+    calls = _install(monkeypatch, api_async=True)
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.post("/api/v1/res-partners", json={"name": "Cliente"})
+        await client.get("/api/v1/res-partners/1")
+        assert calls == {"sync": 0, "async": 2}
+        # Lo que no tiene version async sigue en el handler sync.
+        await client.get("/api/v1/res-partners")
+        assert calls == {"sync": 1, "async": 2}
+
+
+@pytest.mark.anyio
+async def test_sync_routes_without_flag(monkeypatch):
+    calls = _install(monkeypatch, api_async=False)
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/api/v1/res-partners/1")
+    assert calls == {"sync": 1, "async": 0}
+
+
+@pytest.mark.anyio
+async def test_async_create_and_get(monkeypatch):
+    _install(monkeypatch, api_async=True)
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post("/api/v1/res-partners", json={"name": "Cliente"})
+        assert r.status_code == 201
+        partner = r.json()
+        etag = r.headers["etag"]
+
+        r = await client.get(f"/api/v1/res-partners/{partner['id']}")
+        assert r.status_code == 200
+        assert r.json() == partner
+        assert r.headers["etag"] == etag
+        r = await client.get(f"/api/v1/res-partners/{partner['id']}", headers={"If-None-Match": etag})
+        assert r.status_code == 304
+        assert (await client.get("/api/v1/res-partners/999")).status_code == 404
+        assert (await client.post("/api/v1/res-partners", json={"name": ""})).status_code == 400
+
+        r = await client.post("/api/v1/stock-pickings", json={"name": "PICK001", "partner_id": partner["id"]})
+        picking_id = r.json()["id"]
+        r = await client.post("/api/v1/stock-package-types", json={"name": "Caja", "weight": 0.5})
+        package_type_id = r.json()["id"]
+        r = await client.post(
+            "/api/v1/stock-quant-packages",
+            json={"name": "PACK0001", "package_type_id": package_type_id, "shipping_weight": 2.0, "picking_id": picking_id},
+        )
+        assert r.status_code == 201
+        r = await client.get(f"/api/v1/stock-quant-packages/{r.json()['id']}")
+        assert r.json()["name"] == "PACK0001"
+
+        # Las rutas sync ven las mismas filas que las async.
+        r = await client.get("/api/v1/stock-pickings")
+        assert [item["name"] for item in r.json()["items"]] == ["PICK001"]
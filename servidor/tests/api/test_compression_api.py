@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from domain.entities.res_partner import ResPartner
+from infrastructure.db.in_memory_unit_of_work import InMemoryUnitOfWork
+from servidor.app.compression import CompressionMiddleware, compression_from_env, negotiate
+from servidor.app.main import create_app
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _app(monkeypatch, rows: int, **env: str):
+    uow = InMemoryUnitOfWork()
+    for i in range(rows):
+        uow.partners.create(ResPartner(name=f"Cliente {i:04d}", email=f"c{i}@example.com"))
+    monkeypatch.setattr("servidor.app.main.uow_factory", lambda: uow)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    return create_app()
+
+
+@pytest.mark.anyio
+async def test_gzip_only_above_minimum_size(monkeypatch):
+    app = _app(monkeypatch, 200, API_COMPRESSION="gzip", API_COMPRESSION_MIN_SIZE="2048")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.get("/api/v1/res-partners", params={"limit": 200}, headers={"Accept-Encoding": "gzip"})
+        assert r.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in r.headers["vary"]
+        assert r.num_bytes_downloaded < len(r.content) / 4
+        assert len(r.json()["items"]) == 200
+
+        r = await client.get("/api/v1/res-partners", params={"limit": 1}, headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in r.headers
+
+        etag = (await client.get("/api/v1/res-partners", params={"limit": 200})).headers["etag"]
+        r = await client.get(
+            "/api/v1/res-partners",
+            params={"limit": 200},
+            headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+        )
+        assert r.status_code == 304
+        assert "content-encoding" not in r.headers
+
+        r = await client.get("/api/v1/res-partners", params={"limit": 200}, headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in r.headers
+
+
+@pytest.mark.anyio
+async def test_streamed_export_is_compressed_per_chunk():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/x-ndjson")]})
+        for i in range(3):
+            line = json.dumps({"id": i, "name": "x" * 50}) + "\n"
+            await send({"type": "http.response.body", "body": line.encode(), "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    transport = httpx.ASGITransport(app=CompressionMiddleware(app, encodings=("gzip",), minimum_size=10_000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert "content-length" not in r.headers
+    assert [json.loads(line)["id"] for line in r.text.splitlines()] == [0, 1, 2]
+
+
+def test_negotiate_and_env(monkeypatch):
+    assert negotiate("gzip, deflate, br", ("br", "gzip")) == "br"
+    assert negotiate("br;q=0.5, gzip", ("br", "gzip")) == "gzip"
+    assert negotiate("br;q=0", ("br", "gzip")) is None
+    assert negotiate("*", ("gzip",)) == "gzip"
+    monkeypatch.setenv("API_COMPRESSION", "off")
+    assert compression_from_env() is None
+    monkeypatch.setenv("API_COMPRESSION", "gzip")
+    monkeypatch.setenv("API_COMPRESSION_MIN_SIZE", "512")
+    assert compression_from_env() == {"encodings": ("gzip",), "minimum_size": 512}
+    monkeypatch.setenv("API_COMPRESSION", "zstd")
+    with pytest.raises(ValueError):
+        compression_from_env()
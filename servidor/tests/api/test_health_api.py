@@ -12,7 +12,7 @@ def anyio_backend():
 
 @pytest.mark.anyio
 async def test_health(monkeypatch):
-    monkeypatch.setattr(app_main.conn_factory, "ensure_schema", lambda _: None)
+    monkeypatch.setattr(app_main.conn_factory, "ensure_schema", lambda *_, **__: None)
     app = app_main.create_app()
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
@@ -25,11 +25,65 @@ async def test_health(monkeypatch):
 async def test_startup_calls_ensure_schema(monkeypatch):
     called = {"ok": False}
 
-    def _ensure_schema(path):
+    def _ensure_schema(path, **kwargs):
         called["ok"] = True
 
     monkeypatch.setattr(app_main.conn_factory, "ensure_schema", _ensure_schema)
+    monkeypatch.setattr(app_main.conn_pool, "fill", lambda: None)
     app = app_main.create_app()
-    await app.router.startup()
-    assert called["ok"] is True
-    await app.router.shutdown()
+    async with app.router.lifespan_context(app):
+        assert called["ok"] is True
+
+
+class _FakeCursor:
+    description = None
+    rowcount = 2
+
+    def execute(self, query, args=None):
+        return 2
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeConnection:
+    def cursor(self, cursor=None):
+        return _FakeCursor()
+
+
+@pytest.mark.anyio
+async def test_server_timing_and_metrics(monkeypatch):
+    from infrastructure.db.in_memory_unit_of_work import InMemoryUnitOfWork
+    from infrastructure.db.instrumentation import InstrumentedConnection
+
+    class _QueryingUoW(InMemoryUnitOfWork):
+        def __enter__(self):
+            with InstrumentedConnection(_FakeConnection()).cursor() as cur:
+                cur.execute("UPDATE x SET y = 1")
+            return super().__enter__()
+
+    uow = _QueryingUoW()
+    monkeypatch.setattr("servidor.app.main.uow_factory", lambda: uow)
+    app = app_main.create_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post("/api/v1/res-partners", json={"name": "Ana"})
+        assert r.status_code == 201
+        timing = r.headers["server-timing"]
+        assert timing.startswith("app;dur=")
+        assert 'desc="1 queries 2 rows"' in timing
+
+        r = await client.get(f"/api/v1/res-partners/{r.json()['id']}")
+        assert r.status_code == 200
+
+        r = await client.get("/metrics")
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/plain")
+        body = r.text
+        assert (
+            'http_request_duration_seconds_count{method="GET",route="/api/v1/res-partners/{partner_id}",status="200"} 1'
+            in body
+        )
+        assert 'db_queries_total{method="POST",route="/api/v1/res-partners"} 1' in body
+        assert 'db_rows_total{method="POST",route="/api/v1/res-partners"} 2' in body
+        assert "db_pool_size" in body
@@ -0,0 +1,92 @@
+import anyio
+import httpx
+import pytest
+
+from infrastructure.cache.ttl_cache import TTLCache
+from infrastructure.db.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.idempotency.in_memory_idempotency_store import InMemoryIdempotencyStore
+from servidor.app.idempotency import IdempotencyMiddleware
+from servidor.app.main import create_app
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _store() -> InMemoryIdempotencyStore:
+    return InMemoryIdempotencyStore(TTLCache(max_size=16, ttl=60.0))
+
+
+class ScriptedApp:
+    def __init__(self, statuses: list[int]) -> None:
+        self.statuses = list(statuses)
+        self.calls = 0
+        self.release = anyio.Event()
+        self.blocking = False
+
+    async def __call__(self, scope, receive, send) -> None:
+        self.calls += 1
+        message = await receive()
+        if self.blocking:
+            await self.release.wait()
+        status = self.statuses.pop(0) if self.statuses else 201
+        await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"text/plain")]})
+        await send({"type": "http.response.body", "body": message["body"] + f" #{self.calls}".encode()})
+
+
+@pytest.mark.anyio
+async def test_post_with_key_is_replayed_without_touching_repositories(monkeypatch):
+    uow = InMemoryUnitOfWork()
+    monkeypatch.setattr("servidor.app.main.uow_factory", lambda: uow)
+    monkeypatch.setattr("servidor.app.main.idempotency_store", _store())
+    transport = httpx.ASGITransport(app=create_app())
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        headers = {"Idempotency-Key": "alta-1"}
+        first = await client.post("/api/v1/res-partners", json={"name": "ACME"}, headers=headers)
+        second = await client.post("/api/v1/res-partners", json={"name": "ACME"}, headers=headers)
+        assert first.status_code == second.status_code == 201
+        assert second.json() == first.json()
+        assert second.headers["idempotent-replayed"] == "true"
+        assert "idempotent-replayed" not in first.headers
+
+        r = await client.post("/api/v1/res-partners", json={"name": "Otro"}, headers=headers)
+        assert r.status_code == 422
+
+        r = await client.post("/api/v1/res-partners", json={"name": "ACME"})
+        assert r.status_code == 201
+        r = await client.get("/api/v1/res-partners")
+        assert len(r.json()["items"]) == 2
+
+        r = await client.post("/api/v1/res-partners", json={"name": "ACME"}, headers={"Idempotency-Key": " "})
+        assert r.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_concurrent_duplicate_gets_409_and_5xx_is_not_stored():
+    app = ScriptedApp([503])
+    transport = httpx.ASGITransport(app=IdempotencyMiddleware(app, store=_store()))
+    headers = {"Idempotency-Key": "k"}
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post("/x", content=b"body", headers=headers)
+        assert r.status_code == 503
+        r = await client.post("/x", content=b"body", headers=headers)
+        assert (r.status_code, r.text) == (201, "body #2")
+
+        app.blocking = True
+        responses = {}
+
+        async def original() -> None:
+            responses["original"] = await client.post("/y", content=b"body", headers=headers)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(original)
+            while app.calls < 3:
+                await anyio.sleep(0.01)
+            duplicate = await client.post("/y", content=b"body", headers=headers)
+            assert duplicate.status_code == 409
+            app.release.set()
+        assert responses["original"].text == "body #3"
+        assert app.calls == 3
@@ -0,0 +1,61 @@
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from servidor.app import main as app_main
+from servidor.benchmarks import load_test
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def test_percentile_interpolates():
+    values = [0.001, 0.002, 0.003, 0.004]
+    assert load_test.percentile(values, 50) == pytest.approx(0.0025)
+    assert load_test.percentile(values, 99) == pytest.approx(0.00397)
+    assert load_test.percentile([], 95) == 0.0
+
+
+@pytest.mark.anyio
+async def test_run_suite_in_memory(monkeypatch):
+    monkeypatch.setattr(app_main, "uow_factory", app_main.uow_factory)
+    report = await load_test.run_suite("memory", [1, 4], 60, seed_rows=3)
+
+    assert [level["concurrency"] for level in report["results"]] == [1, 4]
+    for level in report["results"]:
+        assert level["total"]["count"] == 60
+        assert level["total"]["errors"] == 0
+        assert level["total"]["p50_ms"] <= level["total"]["p99_ms"]
+    assert "stock-quant-packages.get" in report["results"][0]["endpoints"]
+
+    lines = load_test.compare(report, report)
+    assert any("+0.0%" in line for line in lines)
+
+
+@pytest.mark.anyio
+async def test_run_suite_mysql_applies_migrations(monkeypatch):
+    calls = []
+
+    def _ensure_schema(scripts_dir):
+        calls.append(scripts_dir)
+        raise RuntimeError("sin base")
+
+    monkeypatch.setattr(app_main.conn_factory, "ensure_schema", _ensure_schema)
+    with pytest.raises(RuntimeError):
+        await load_test.run_suite("mysql", [1], 1)
+    assert calls == [app_main.SCRIPTS_DIR]
+    assert (calls[0] / "schema.sql").is_file()
+    assert (calls[0] / "migrations").is_dir()
+
+
+@pytest.mark.anyio
+async def test_async_stack_benchmark_simulated(monkeypatch):
+    from servidor.benchmarks import async_stack
+
+    # El benchmark reemplaza las fabricas y el flag del modulo: monkeypatch los restaura.
+    for name in ("uow_factory", "async_uow_factory", "api_async"):
+        monkeypatch.setattr(app_main, name, getattr(app_main, name))
+    assert await async_stack._run_sync("simulated", 40, 4, 0.001, 8, 40) > 0
+    assert await async_stack._run_async("simulated", 4, 0.001, 8, 40) > 0
@@ -59,3 +59,56 @@ async def test_create_and_list_api(monkeypatch):
 
         r = await client.delete(f"/api/v1/res-partners/{data['id']}")
         assert r.status_code == 204
+
+
+@pytest.mark.anyio
+async def test_etag_conditional_requests(monkeypatch):
+    uow = FakeUoW()
+    monkeypatch.setattr("servidor.app.main.uow_factory", lambda: uow)
+    app = create_app()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post("/api/v1/res-partners", json={"name": "Ana"})
+        partner_id = r.json()["id"]
+        created_etag = r.headers["etag"]
+
+        r = await client.get(f"/api/v1/res-partners/{partner_id}")
+        etag = r.headers["etag"]
+        assert etag.startswith(f'W/"{partner_id}-')
+        assert etag == created_etag
+
+        r = await client.get(f"/api/v1/res-partners/{partner_id}", headers={"If-None-Match": etag})
+        assert r.status_code == 304
+        assert r.content == b""
+        assert r.headers["etag"] == etag
+
+        r = await client.get("/api/v1/res-partners")
+        list_etag = r.headers["etag"]
+        r = await client.get("/api/v1/res-partners", headers={"If-None-Match": list_etag})
+        assert r.status_code == 304
+        # Mismos items, otra pagina: el cuerpo cambia (limit), el ETag tambien.
+        r = await client.get("/api/v1/res-partners?limit=5", headers={"If-None-Match": list_etag})
+        assert r.status_code == 200
+        assert r.json()["limit"] == 5
+
+        r = await client.put(
+            f"/api/v1/res-partners/{partner_id}", json={"name": "Ana B"}, headers={"If-Match": etag}
+        )
+        assert r.status_code == 200
+        new_etag = r.headers["etag"]
+        assert new_etag != etag
+
+        r = await client.put(
+            f"/api/v1/res-partners/{partner_id}", json={"name": "Ana C"}, headers={"If-Match": etag}
+        )
+        assert r.status_code == 412
+        assert (await client.get(f"/api/v1/res-partners/{partner_id}")).json()["name"] == "Ana B"
+
+        r = await client.get("/api/v1/res-partners", headers={"If-None-Match": list_etag})
+        assert r.status_code == 200
+
+        r = await client.delete(f"/api/v1/res-partners/{partner_id}", headers={"If-Match": etag})
+        assert r.status_code == 412
+        r = await client.delete(f"/api/v1/res-partners/{partner_id}", headers={"If-Match": new_etag})
+        assert r.status_code == 204
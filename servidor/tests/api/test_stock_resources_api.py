@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 httpx = pytest.importorskip("httpx")
@@ -7,6 +9,9 @@ from infrastructure.repositories.in_memory_stock_picking_repository import InMem
 from infrastructure.repositories.in_memory_stock_package_type_repository import InMemoryStockPackageTypeRepository
 from infrastructure.repositories.in_memory_stock_quant_package_repository import InMemoryStockQuantPackageRepository
 from application.ports.unit_of_work import IUnitOfWork
+from domain.entities.res_partner import ResPartner
+from domain.entities.stock_package_type import StockPackageType
+from domain.entities.stock_picking import StockPicking
 from servidor.app.main import create_app
 
 
@@ -15,7 +20,7 @@ class FakeUoW(IUnitOfWork):
         self.partners = InMemoryResPartnerRepository()
         self.pickings = InMemoryStockPickingRepository()
         self.package_types = InMemoryStockPackageTypeRepository()
-        self.packages = InMemoryStockQuantPackageRepository()
+        self.packages = InMemoryStockQuantPackageRepository(self.package_types, self.pickings)
 
     def __enter__(self):
         return self
@@ -72,6 +77,19 @@ async def test_create_and_list_stock_resources(monkeypatch):
         assert r.status_code == 200
         assert len(r.json()["items"]) == 1
 
+        r = await client.get(f"/api/v1/stock-pickings/{picking_id}/summary")
+        assert r.status_code == 200
+        assert r.json() == {
+            "picking_id": picking_id,
+            "package_count": 1,
+            "gross_weight": 10.0,
+            "tare_weight": 0.5,
+            "net_weight": 9.5,
+        }
+
+        r = await client.get("/api/v1/stock-pickings/999/summary")
+        assert r.status_code == 404
+
         r = await client.put(f"/api/v1/stock-pickings/{picking_id}", json={"name": "OUT/0002"})
         assert r.status_code == 200
 
@@ -102,3 +120,288 @@ async def test_create_and_list_stock_resources(monkeypatch):
 
         r = await client.delete(f"/api/v1/stock-pickings/{picking_id}")
         assert r.status_code == 204
+
+
+@pytest.mark.anyio
+async def test_list_with_cursor_pagination(monkeypatch):
+    uow = FakeUoW()
+
+    def _uow_factory():
+        return uow
+
+    monkeypatch.setattr("servidor.app.main.uow_factory", _uow_factory)
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for i in range(5):
+            r = await client.post("/api/v1/stock-package-types", json={"name": f"Caja {i}"})
+            assert r.status_code == 201
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            r = await client.get("/api/v1/stock-package-types", params=params)
+            assert r.status_code == 200
+            body = r.json()
+            seen.extend(item["id"] for item in body["items"])
+            cursor = body["next_cursor"]
+            if not cursor:
+                break
+        assert seen == [5, 4, 3, 2, 1]
+
+        r = await client.get("/api/v1/stock-package-types", params={"cursor": body["prev_cursor"], "limit": 2})
+        assert [item["id"] for item in r.json()["items"]] == [3, 2]
+
+        r = await client.get("/api/v1/stock-package-types", params={"cursor": "%%%"})
+        assert r.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_create_stock_quant_packages_batch(monkeypatch):
+    uow = FakeUoW()
+    uow.pickings.create(StockPicking(name="PICK001", partner_id=1))
+    uow.package_types.create(StockPackageType(name="Caja"))
+
+    def _uow_factory():
+        return uow
+
+    monkeypatch.setattr("servidor.app.main.uow_factory", _uow_factory)
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post(
+            "/api/v1/stock-quant-packages:batch",
+            json=[
+                {"name": "PACK0001", "package_type_id": 1, "shipping_weight": 3.0, "picking_id": 1},
+                {"name": "PACK0002", "package_type_id": 0, "shipping_weight": 3.0, "picking_id": 1},
+                {"name": "PACK0003", "package_type_id": 1, "shipping_weight": 3.0, "picking_id": 2},
+            ],
+        )
+        assert r.status_code == 200
+        items = r.json()["items"]
+        assert items[0]["item"]["name"] == "PACK0001"
+        assert items[0]["error"] is None
+        assert items[1]["item"] is None
+        assert items[1]["error"] == "package_type_id requerido"
+        assert items[2]["error"] == "picking_id inexistente"
+
+        r = await client.get("/api/v1/stock-quant-packages")
+        assert len(r.json()["items"]) == 1
+
+
+@pytest.mark.anyio
+async def test_export_stock_quant_packages_ndjson(monkeypatch):
+    uow = FakeUoW()
+    for i in range(3):
+        uow.pickings.create(StockPicking(name=f"PICK{i:03d}", partner_id=1))
+    for name in ("Caja", "Pallet"):
+        uow.package_types.create(StockPackageType(name=name))
+
+    def _uow_factory():
+        return uow
+
+    monkeypatch.setattr("servidor.app.main.uow_factory", _uow_factory)
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for start in (0, 600):
+            r = await client.post(
+                "/api/v1/stock-quant-packages:batch",
+                json=[
+                    {
+                        "name": f"PACK{i:04d}",
+                        "package_type_id": 1 + i % 2,
+                        "shipping_weight": i,
+                        "picking_id": 1 + i % 3,
+                    }
+                    for i in range(start, start + 600)
+                ],
+            )
+            assert r.status_code == 200
+
+        r = await client.get("/api/v1/stock-quant-packages/export")
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in r.text.splitlines()]
+        assert len(rows) == 1200
+        assert rows[0]["name"] == "PACK0000"
+
+        r = await client.get(
+            "/api/v1/stock-quant-packages/export", params={"picking_id": 1, "package_type_id": 2}
+        )
+        rows = [json.loads(line) for line in r.text.splitlines()]
+        assert rows
+        assert all(row["picking_id"] == 1 and row["package_type_id"] == 2 for row in rows)
+
+
+@pytest.mark.anyio
+async def test_list_stock_quant_packages_expanded(monkeypatch):
+    uow = FakeUoW()
+
+    def _uow_factory():
+        return uow
+
+    monkeypatch.setattr("servidor.app.main.uow_factory", _uow_factory)
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post("/api/v1/res-partners", json={"name": "Ana"})
+        partner_id = r.json()["id"]
+        r = await client.post("/api/v1/stock-pickings", json={"name": "WH/OUT/0001", "partner_id": partner_id})
+        picking_id = r.json()["id"]
+        r = await client.post("/api/v1/stock-package-types", json={"name": "Caja", "weight": 0.5})
+        type_id = r.json()["id"]
+        r = await client.post(
+            "/api/v1/stock-quant-packages",
+            json={"name": "PACK0001", "package_type_id": type_id, "picking_id": picking_id},
+        )
+        assert r.status_code == 201
+        # Sin expand la respuesta conserva las claves que esperan los clientes ya distribuidos.
+        assert set(r.json()) == {"id", "name", "package_type_id", "shipping_weight", "picking_id"}
+
+        r = await client.get("/api/v1/stock-quant-packages", params={"expand": "package_type,picking"})
+        assert r.status_code == 200
+        item = r.json()["items"][0]
+        assert item["package_type"] == {"id": type_id, "name": "Caja", "weight": 0.5}
+        assert item["picking"] == {"id": picking_id, "name": "WH/OUT/0001", "partner_id": partner_id}
+
+        r = await client.get("/api/v1/stock-quant-packages", params={"expand": "picking"})
+        item = r.json()["items"][0]
+        assert item["package_type"] is None
+        assert item["picking"]["name"] == "WH/OUT/0001"
+
+        r = await client.get("/api/v1/stock-quant-packages")
+        item = r.json()["items"][0]
+        assert "package_type" not in item and "picking" not in item
+
+        r = await client.get("/api/v1/stock-quant-packages", params={"expand": "partner"})
+        assert r.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_list_filters(monkeypatch):
+    uow = FakeUoW()
+    monkeypatch.setattr("servidor.app.main.uow_factory", lambda: uow)
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        partners = [(await client.post("/api/v1/res-partners", json={"name": n})).json()["id"] for n in ("Ana", "Beto")]
+        for i, partner_id in enumerate(partners * 2):
+            r = await client.post("/api/v1/stock-pickings", json={"name": f"OUT/{i}", "partner_id": partner_id})
+            assert r.status_code == 201
+        type_id = (await client.post("/api/v1/stock-package-types", json={"name": "Caja", "weight": 1})).json()["id"]
+        for weight in (1.0, 5.0, 9.0):
+            r = await client.post(
+                "/api/v1/stock-quant-packages",
+                json={"name": f"P{weight}", "package_type_id": type_id, "shipping_weight": weight, "picking_id": 1},
+            )
+            assert r.status_code == 201
+
+        r = await client.get("/api/v1/stock-pickings", params={"partner_id": partners[0]})
+        assert [p["name"] for p in r.json()["items"]] == ["OUT/2", "OUT/0"]
+
+        r = await client.get("/api/v1/res-partners", params={"name_prefix": "an"})
+        assert [p["name"] for p in r.json()["items"]] == ["Ana"]
+
+        r = await client.get(
+            "/api/v1/stock-quant-packages",
+            params={"picking_id": 1, "min_weight": 2, "max_weight": 9, "limit": 1, "expand": "package_type"},
+        )
+        assert [p["shipping_weight"] for p in r.json()["items"]] == [9.0]
+        assert r.json()["items"][0]["package_type"]["name"] == "Caja"
+        r = await client.get(
+            "/api/v1/stock-quant-packages",
+            params={"picking_id": 1, "min_weight": 2, "max_weight": 9, "cursor": r.json()["next_cursor"]},
+        )
+        assert [p["shipping_weight"] for p in r.json()["items"]] == [5.0]
+
+        r = await client.get("/api/v1/stock-quant-packages", params={"min_weight": 5, "max_weight": 1})
+        assert r.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_lookup_by_ids(monkeypatch):
+    uow = FakeUoW()
+    monkeypatch.setattr("servidor.app.main.uow_factory", lambda: uow)
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        ids = [(await client.post("/api/v1/stock-package-types", json={"name": n, "weight": 1})).json()["id"] for n in ("A", "B")]
+
+        r = await client.post("/api/v1/stock-package-types:lookup", json={"ids": [ids[1], 404, ids[0]]})
+        assert r.status_code == 200
+        items = r.json()["items"]
+        assert [(i["id"], i["found"]) for i in items] == [(ids[1], True), (404, False), (ids[0], True)]
+        assert [i["item"]["name"] if i["item"] else None for i in items] == ["B", None, "A"]
+
+        r = await client.post("/api/v1/res-partners:lookup", json={"ids": []})
+        assert r.json() == {"items": []}
+
+        r = await client.post("/api/v1/stock-quant-packages:lookup", json={"ids": list(range(1001))})
+        assert r.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_upsert_by_name(monkeypatch):
+    uow = FakeUoW()
+    uow.partners.create(ResPartner(name="Cliente"))
+    uow.package_types.create(StockPackageType(name="Caja"))
+    monkeypatch.setattr("servidor.app.main.uow_factory", lambda: uow)
+    transport = httpx.ASGITransport(app=create_app())
+    batch = [
+        {"name": "PICK001", "partner_id": 1},
+        {"name": "PICK002", "partner_id": 1},
+    ]
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        r = await client.post("/api/v1/stock-pickings:upsert", json=batch)
+        assert r.status_code == 200
+        body = r.json()
+        assert (body["inserted"], body["updated"]) == (2, 0)
+
+        # Reintentar el mismo lote no duplica filas: todo sale como actualizado.
+        r = await client.post(
+            "/api/v1/stock-pickings:upsert",
+            json=[*batch, {"name": "", "partner_id": 1}, {"name": "PICK003", "partner_id": 99}],
+        )
+        body = r.json()
+        assert (body["inserted"], body["updated"]) == (0, 2)
+        assert [item["action"] for item in body["items"]] == ["updated", "updated", None, None]
+        assert body["items"][2]["error"] == "Referencia requerida"
+        # Una FK inexistente es un error del item, no un 500 para todo el lote.
+        assert body["items"][3]["error"] == "partner_id inexistente"
+
+        r = await client.post(
+            "/api/v1/stock-quant-packages:upsert",
+            json=[{"name": "PACK0001", "package_type_id": 1, "shipping_weight": 2.0, "picking_id": 1}],
+        )
+        assert r.json()["items"][0]["action"] == "inserted"
+        package_id = r.json()["items"][0]["item"]["id"]
+        r = await client.post(
+            "/api/v1/stock-quant-packages:upsert",
+            json=[{"name": "PACK0002", "package_type_id": 1, "shipping_weight": 2.0, "picking_id": 99}],
+        )
+        assert r.json()["items"][0]["error"] == "picking_id inexistente"
+        r = await client.post(
+            "/api/v1/stock-quant-packages:upsert",
+            json=[{"name": "PACK0001", "package_type_id": 1, "shipping_weight": 4.0, "picking_id": 1}],
+        )
+        assert r.json()["items"][0]["item"] == {
+            "id": package_id,
+            "name": "PACK0001",
+            "package_type_id": 1,
+            "shipping_weight": 4.0,
+            "picking_id": 1,
+        }
+
+        r = await client.post("/api/v1/stock-pickings:upsert", json=[batch[0]] * 1001)
+        assert r.status_code == 400
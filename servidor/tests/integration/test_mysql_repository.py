@@ -1,9 +1,12 @@
 import os
 import pytest
-from infrastructure.db.mysql_connection import MySQLConnectionFactory
+from infrastructure.db.mysql_connection import MySQLConnectionFactory, MySQLConnectionPool
 from infrastructure.db.unit_of_work import MySQLUnitOfWork
 from application.use_cases.create_res_partner import CreateResPartner
 from application.use_cases.list_res_partners import ListResPartners
+from application.use_cases.upsert_stock_pickings import UpsertStockPickings
+from application.ports.idempotency_store import IdempotencyRecord
+from infrastructure.idempotency.mysql_idempotency_store import MySQLIdempotencyStore
 
 
 @pytest.mark.integration
@@ -12,11 +15,80 @@ from application.use_cases.list_res_partners import ListResPartners
     reason="DB_HOST no configurado",
 )
 def test_mysql_repository_create_and_list():
-    factory = MySQLConnectionFactory.from_env()
-    with MySQLUnitOfWork(factory) as uow:
+    pool = MySQLConnectionPool(MySQLConnectionFactory.from_env())
+    with MySQLUnitOfWork(pool) as uow:
         create_uc = CreateResPartner(uow.partners)
-        create_uc.execute(name="Integracion", email="int@test.com")
-    with MySQLUnitOfWork(factory) as uow:
+        created = create_uc.execute(name="Integracion", email="int@test.com")
+        assert created.updated_at is not None
+    with MySQLUnitOfWork(pool) as uow:
         list_uc = ListResPartners(uow.partners)
         results = list_uc.execute(limit=5, offset=0)
         assert any(c.email == "int@test.com" for c in results)
+    pool.close()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not os.getenv("DB_HOST"),
+    reason="DB_HOST no configurado",
+)
+def test_mysql_repository_get_many():
+    pool = MySQLConnectionPool(MySQLConnectionFactory.from_env())
+    with MySQLUnitOfWork(pool) as uow:
+        create_uc = CreateResPartner(uow.partners)
+        ids = [create_uc.execute(name=f"Lookup {i}").id for i in range(3)]
+    with MySQLUnitOfWork(pool) as uow:
+        found = uow.partners.get_many([ids[2], ids[0], ids[2], 0])
+        assert sorted(p.id for p in found) == sorted([ids[0], ids[2]])
+        for partner_id in ids:
+            uow.partners.delete(partner_id)
+    pool.close()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not os.getenv("DB_HOST"),
+    reason="DB_HOST no configurado",
+)
+def test_mysql_repository_upsert_by_name():
+    pool = MySQLConnectionPool(MySQLConnectionFactory.from_env())
+    with MySQLUnitOfWork(pool) as uow:
+        partner_id = CreateResPartner(uow.partners).execute(name="Upsert").id
+        batch = [{"name": f"UPSERT{i}", "partner_id": partner_id} for i in range(2)]
+        first = UpsertStockPickings(uow.pickings).execute(batch)
+    with MySQLUnitOfWork(pool) as uow:
+        retried = UpsertStockPickings(uow.pickings).execute(batch)
+        assert [r.action for r in first] == ["inserted", "inserted"]
+        assert [r.action for r in retried] == ["updated", "updated"]
+        assert [r.item.id for r in retried] == [r.item.id for r in first]
+        # El indice _ai_ci tambien ignora acentos: se actualiza la fila existente.
+        accented = UpsertStockPickings(uow.pickings, uow.partners).execute(
+            [{"name": "upsért0", "partner_id": partner_id}, {"name": "UPSERT0", "partner_id": partner_id}]
+        )
+        assert accented[0].action == "updated"
+        assert accented[0].item.id == first[0].item.id
+        assert accented[1].error == "Referencia duplicada en el lote"
+        for result in retried:
+            uow.pickings.delete(result.item.id)
+        uow.partners.delete(partner_id)
+    pool.close()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not os.getenv("DB_HOST"),
+    reason="DB_HOST no configurado",
+)
+def test_mysql_idempotency_store():
+    pool = MySQLConnectionPool(MySQLConnectionFactory.from_env())
+    store = MySQLIdempotencyStore(pool, ttl=60.0)
+    key = f"/api/v1/res-partners {os.getpid()}"
+    assert store.begin(key, "f1") is None
+    assert not store.begin(key, "f1").completed
+    store.complete(key, IdempotencyRecord("f1", 201, (("content-type", "application/json"),), b"{}"))
+    record = store.begin(key, "f1")
+    assert (record.status, record.headers, record.body) == (201, (("content-type", "application/json"),), b"{}")
+    store.release(key)
+    assert store.begin(key, "f2") is None
+    store.release(key)
+    pool.close()
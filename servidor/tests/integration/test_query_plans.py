@@ -0,0 +1,129 @@
+import os
+from pathlib import Path
+import pytest
+from infrastructure.db.mysql_connection import MySQLConnectionFactory
+from infrastructure.repositories.mysql_res_partner_repository import MySQLResPartnerRepository
+from infrastructure.repositories.mysql_stock_picking_repository import MySQLStockPickingRepository
+from infrastructure.repositories.mysql_stock_quant_package_repository import MySQLStockQuantPackageRepository
+from domain.value_objects.res_partner_filter import ResPartnerFilter
+from domain.value_objects.stock_picking_filter import StockPickingFilter
+from domain.value_objects.stock_quant_package_filter import StockQuantPackageFilter
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[2] / "scripts"
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(not os.getenv("DB_HOST"), reason="DB_HOST no configurado"),
+]
+
+
+class RecordingCursor:
+    def __init__(self, cursor, statements: list) -> None:
+        self._cursor = cursor
+        self._statements = statements
+
+    def execute(self, sql, params=None):
+        self._statements.append((sql, params))
+        return self._cursor.execute(sql, params)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._cursor.close()
+
+
+class RecordingConnection:
+    def __init__(self, connection) -> None:
+        self._connection = connection
+        self.statements: list = []
+
+    def cursor(self, cursor=None):
+        return RecordingCursor(self._connection.cursor(cursor), self.statements)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+def explain(connection, sql: str, params) -> list[dict]:
+    with connection.cursor() as cur:
+        cur.execute("EXPLAIN " + sql, params)
+        return cur.fetchall()
+
+
+def _plans(connection, call) -> list[list[dict]]:
+    recording = RecordingConnection(connection)
+    result = call(recording)
+    if hasattr(result, "__next__"):
+        list(result)
+    return [explain(connection, sql, params) for sql, params in recording.statements]
+
+
+@pytest.fixture
+def connection():
+    factory = MySQLConnectionFactory.from_env()
+    factory.ensure_schema(SCRIPTS_DIR)
+    conn = factory.connect()
+    yield conn
+    conn.rollback()
+    conn.close()
+
+
+def test_export_by_picking_uses_picking_index(connection):
+    (plan,) = _plans(connection, lambda c: MySQLStockQuantPackageRepository(c).stream(picking_id=1))
+    assert plan[0]["key"] == "ix_stock_quant_package_picking_id"
+    assert "filesort" not in (plan[0]["Extra"] or "")
+
+
+def test_export_by_package_type_uses_type_index(connection):
+    (plan,) = _plans(connection, lambda c: MySQLStockQuantPackageRepository(c).stream(package_type_id=1))
+    assert plan[0]["key"] == "ix_stock_quant_package_package_type_id"
+    assert "filesort" not in (plan[0]["Extra"] or "")
+
+
+def test_picking_summary_uses_picking_index(connection):
+    (plan,) = _plans(connection, lambda c: MySQLStockQuantPackageRepository(c).summarize_by_picking(1))
+    package_row = next(row for row in plan if row["table"] == "p")
+    assert package_row["key"] == "ix_stock_quant_package_picking_id"
+
+
+def test_package_list_by_picking_uses_picking_index(connection):
+    (plan,) = _plans(
+        connection,
+        lambda c: MySQLStockQuantPackageRepository(c).list(
+            limit=10, offset=0, after_id=1000, filters=StockQuantPackageFilter(picking_id=1, min_weight=1.0)
+        ),
+    )
+    assert plan[0]["key"] == "ix_stock_quant_package_picking_id"
+    assert "filesort" not in (plan[0]["Extra"] or "")
+
+
+def test_picking_list_by_partner_uses_partner_index(connection):
+    (plan,) = _plans(
+        connection,
+        lambda c: MySQLStockPickingRepository(c).list(
+            limit=10, offset=0, filters=StockPickingFilter(partner_id=1)
+        ),
+    )
+    assert plan[0]["key"] == "ix_stock_picking_partner_id"
+    assert "filesort" not in (plan[0]["Extra"] or "")
+
+
+def test_partner_name_prefix_can_use_name_index(connection):
+    (plan,) = _plans(
+        connection,
+        lambda c: MySQLResPartnerRepository(c).list(
+            limit=10, offset=0, filters=ResPartnerFilter(name_prefix="Ana")
+        ),
+    )
+    assert "ix_res_partner_name" in (plan[0]["possible_keys"] or "")
+
+
+def test_stock_picking_partner_index_exists(connection):
+    with connection.cursor() as cur:
+        cur.execute("SHOW INDEX FROM stock_picking WHERE Key_name = 'ix_stock_picking_partner_id'")
+        columns = [row["Column_name"] for row in cur.fetchall()]
+    assert columns == ["partner_id", "id"]
@@ -1,6 +1,9 @@
 import importlib
 import sys
 
+import anyio.to_thread
+import pytest
+
 import servidor.app.main as app_main
 from infrastructure.db.unit_of_work import MySQLUnitOfWork
 
@@ -13,3 +16,33 @@ def test_sys_path_insertion_and_uow_factory():
     assert base_dir in sys.path
     uow = reloaded.uow_factory()
     assert isinstance(uow, MySQLUnitOfWork)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_configure_thread_limit_from_env(monkeypatch):
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    default = limiter.total_tokens
+    app_main.configure_thread_limit()
+    assert limiter.total_tokens == default
+
+    monkeypatch.setenv("API_THREAD_LIMIT", "123")
+    app_main.configure_thread_limit()
+    assert limiter.total_tokens == 123
+
+
+def test_json_response_class_from_env(monkeypatch):
+    from servidor.app.json_response import OrjsonResponse, orjson, response_class_from_env
+
+    assert response_class_from_env() is None
+    monkeypatch.setenv("API_JSON_RESPONSE", "ujson")
+    with pytest.raises(ValueError):
+        response_class_from_env()
+    if orjson is not None:
+        monkeypatch.setenv("API_JSON_RESPONSE", "orjson")
+        assert response_class_from_env() is OrjsonResponse
+        assert OrjsonResponse({"a": 1.5}).body == b'{"a":1.5}'
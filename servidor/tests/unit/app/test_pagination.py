@@ -0,0 +1,25 @@
+import pytest
+
+from servidor.app.pagination import decode_cursor, encode_cursor, page_cursors
+
+
+def test_cursor_roundtrip():
+    assert decode_cursor(encode_cursor("a", 42)) == (42, None)
+    assert decode_cursor(encode_cursor("b", 7)) == (None, 7)
+    assert decode_cursor(None) == (None, None)
+
+
+@pytest.mark.parametrize("cursor", ["???", encode_cursor("x", 1), "YTpmb28"])
+def test_cursor_invalid(cursor: str):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_page_cursors_first_and_last_page():
+    next_cursor, prev_cursor = page_cursors([9, 8], limit=2, offset=0, after_id=None, before_id=None)
+    assert decode_cursor(next_cursor) == (8, None)
+    assert prev_cursor is None
+
+    next_cursor, prev_cursor = page_cursors([3], limit=2, offset=0, after_id=4, before_id=None)
+    assert next_cursor is None
+    assert decode_cursor(prev_cursor) == (None, 3)
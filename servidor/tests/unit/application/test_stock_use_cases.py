@@ -12,11 +12,20 @@ from application.use_cases.delete_stock_package_type import DeleteStockPackageTy
 from application.use_cases.get_stock_package_type_by_id import GetStockPackageTypeById
 from application.use_cases.list_stock_package_types import ListStockPackageTypes
 from application.use_cases.create_stock_quant_package import CreateStockQuantPackage
+from application.use_cases.create_stock_quant_packages_batch import CreateStockQuantPackagesBatch
 from application.use_cases.update_stock_quant_package import UpdateStockQuantPackage
 from application.use_cases.delete_stock_quant_package import DeleteStockQuantPackage
 from application.use_cases.get_stock_quant_package_by_id import GetStockQuantPackageById
 from application.use_cases.list_stock_quant_packages import ListStockQuantPackages
+from application.use_cases.get_stock_quant_packages_by_ids import GetStockQuantPackagesByIds
+from application.use_cases.get_stock_package_types_by_ids import GetStockPackageTypesByIds
+from application.use_cases.get_stock_picking_summary import GetStockPickingSummary
+from application.use_cases.upsert_stock_pickings import UpsertStockPickings
+from application.use_cases.upsert_stock_quant_packages import UpsertStockQuantPackages
 from application.exceptions import NotFoundError
+from domain.exceptions import ValidationError
+from infrastructure.cache.ttl_cache import TTLCache
+from infrastructure.repositories.cached_stock_package_type_repository import CachedStockPackageTypeRepository
 
 
 def test_stock_picking_use_cases():
@@ -121,3 +130,194 @@ def test_stock_quant_packages_not_found():
         assert False, "Expected NotFoundError"
     except NotFoundError:
         assert True
+
+
+def test_create_stock_quant_packages_batch_reports_per_item():
+    repo = InMemoryStockQuantPackageRepository()
+    batch_uc = CreateStockQuantPackagesBatch(repo)
+
+    results = batch_uc.execute(
+        [
+            {"name": "PACK0001", "package_type_id": 1, "shipping_weight": 5.0, "picking_id": 1},
+            {"name": "", "package_type_id": 1, "shipping_weight": 5.0, "picking_id": 1},
+            {"name": "PACK0001", "package_type_id": 1, "shipping_weight": 1.0, "picking_id": 1},
+            {"name": "PACK0002", "package_type_id": 1, "shipping_weight": -1.0, "picking_id": 1},
+            {"name": "PACK0003", "package_type_id": 2, "shipping_weight": 7.5, "picking_id": 1},
+        ]
+    )
+    assert [r.index for r in results] == [0, 1, 2, 3, 4]
+    assert results[0].item.name == "PACK0001"
+    assert results[1].error == "Referencia requerida"
+    assert results[2].error == "Referencia duplicada en el lote"
+    assert results[3].error == "Peso invalido"
+    assert results[4].item.id == 2
+    assert len(ListStockQuantPackages(repo).execute(limit=10, offset=0)) == 2
+
+
+def test_create_stock_quant_packages_batch_reports_conflicts_per_item():
+    pickings = InMemoryStockPickingRepository()
+    package_types = InMemoryStockPackageTypeRepository()
+    repo = InMemoryStockQuantPackageRepository(package_types, pickings)
+    picking = CreateStockPicking(pickings).execute(name="PICK001", partner_id=1)
+    package_type = CreateStockPackageType(package_types).execute(name="Caja", weight=0.5)
+    batch_uc = CreateStockQuantPackagesBatch(repo, package_types, pickings)
+    batch_uc.execute(
+        [{"name": "PACK0001", "package_type_id": package_type.id, "shipping_weight": 1.0, "picking_id": picking.id}]
+    )
+
+    results = batch_uc.execute(
+        [
+            {"name": "pack0001", "package_type_id": package_type.id, "shipping_weight": 1.0, "picking_id": picking.id},
+            {"name": "PACK0002", "package_type_id": 99, "shipping_weight": 1.0, "picking_id": picking.id},
+            {"name": "PACK0003", "package_type_id": package_type.id, "shipping_weight": 1.0, "picking_id": 99},
+            {"name": "PACK0004", "package_type_id": package_type.id, "shipping_weight": 1.0, "picking_id": picking.id},
+            {"name": "pack0004", "package_type_id": package_type.id, "shipping_weight": 1.0, "picking_id": picking.id},
+        ]
+    )
+    assert results[0].error == "Referencia ya existente"
+    assert results[1].error == "package_type_id inexistente"
+    assert results[2].error == "picking_id inexistente"
+    assert results[3].item.name == "PACK0004"
+    assert results[4].error == "Referencia duplicada en el lote"
+    assert len(ListStockQuantPackages(repo).execute(limit=10, offset=0)) == 2
+
+
+def test_upsert_by_name_reports_inserted_and_updated():
+    repo = InMemoryStockQuantPackageRepository()
+    upsert_uc = UpsertStockQuantPackages(repo)
+    first = upsert_uc.execute(
+        [
+            {"name": "PACK0001", "package_type_id": 1, "shipping_weight": 5.0, "picking_id": 1},
+            {"name": "PACK0002", "package_type_id": 1, "shipping_weight": 6.0, "picking_id": 1},
+        ]
+    )
+    assert [r.action for r in first] == ["inserted", "inserted"]
+
+    retried = upsert_uc.execute(
+        [
+            {"name": "PACK0002", "package_type_id": 1, "shipping_weight": 9.0, "picking_id": 1},
+            {"name": "PACK0001", "package_type_id": 1, "shipping_weight": 5.0, "picking_id": 1},
+            {"name": "PACK0002", "package_type_id": 1, "shipping_weight": 1.0, "picking_id": 1},
+            {"name": "PACK0003", "package_type_id": 1, "shipping_weight": -1.0, "picking_id": 1},
+        ]
+    )
+    assert [r.action for r in retried] == ["updated", "updated", None, None]
+    assert retried[0].item.id == first[1].item.id
+    assert retried[0].item.updated_at > first[1].item.updated_at
+    assert retried[2].error == "Referencia duplicada en el lote"
+    assert retried[3].error == "Peso invalido"
+    assert repo.get_by_name("PACK0002").shipping_weight == 9.0
+    assert len(ListStockQuantPackages(repo).execute(limit=10, offset=0)) == 2
+
+    other_case = upsert_uc.execute(
+        [
+            {"name": "pack0001", "package_type_id": 1, "shipping_weight": 2.0, "picking_id": 1},
+            {"name": "PACK0001", "package_type_id": 1, "shipping_weight": 3.0, "picking_id": 1},
+        ]
+    )
+    assert other_case[0].action == "updated"
+    assert other_case[0].item.name == "PACK0001"
+    assert other_case[1].error == "Referencia duplicada en el lote"
+
+    pickings = InMemoryStockPickingRepository()
+    results = UpsertStockPickings(pickings).execute(
+        [{"name": "PICK001", "partner_id": 1}, {"name": "PICK002", "partner_id": 0}]
+    )
+    assert results[0].action == "inserted"
+    assert results[1].error == "partner_id requerido"
+    results = UpsertStockPickings(pickings).execute([{"name": "PICK001", "partner_id": 2}])
+    assert (results[0].action, results[0].item.partner_id) == ("updated", 2)
+
+
+def test_upsert_by_name_checks_references_per_item():
+    pickings = InMemoryStockPickingRepository()
+    package_types = InMemoryStockPackageTypeRepository()
+    repo = InMemoryStockQuantPackageRepository(package_types, pickings)
+    picking = CreateStockPicking(pickings).execute(name="PICK001", partner_id=1)
+    package_type = CreateStockPackageType(package_types).execute(name="Caja")
+    results = UpsertStockQuantPackages(repo, package_types, pickings).execute(
+        [
+            {"name": "PACK0001", "package_type_id": 99, "shipping_weight": 1.0, "picking_id": picking.id},
+            {"name": "PACK0001", "package_type_id": package_type.id, "shipping_weight": 2.0, "picking_id": 99},
+            {"name": "pack0001", "package_type_id": package_type.id, "shipping_weight": 3.0, "picking_id": picking.id},
+            {"name": "PACK0001", "package_type_id": package_type.id, "shipping_weight": 4.0, "picking_id": picking.id},
+        ]
+    )
+    assert results[0].error == "package_type_id inexistente"
+    assert results[1].error == "picking_id inexistente"
+    assert (results[2].action, results[2].item.shipping_weight) == ("inserted", 3.0)
+    assert results[3].error == "Referencia duplicada en el lote"
+    assert repo.get_by_name("PACK0001").shipping_weight == 3.0
+
+
+def test_stock_picking_summary():
+    pickings = InMemoryStockPickingRepository()
+    package_types = InMemoryStockPackageTypeRepository()
+    packages = InMemoryStockQuantPackageRepository(package_types)
+    picking = CreateStockPicking(pickings).execute(name="IN/0001", partner_id=1)
+    empty = CreateStockPicking(pickings).execute(name="IN/0002", partner_id=1)
+    cone = CreateStockPackageType(package_types).execute(name="Cono", weight=0.5)
+    create_uc = CreateStockQuantPackage(packages)
+    create_uc.execute(name="B1", package_type_id=cone.id, shipping_weight=10.0, picking_id=picking.id)
+    create_uc.execute(name="B2", package_type_id=cone.id, shipping_weight=12.0, picking_id=picking.id)
+
+    summary_uc = GetStockPickingSummary(pickings, packages)
+    summary = summary_uc.execute(picking.id)
+    assert summary.package_count == 2
+    assert summary.gross_weight == 22.0
+    assert summary.tare_weight == 1.0
+    assert summary.net_weight == 21.0
+
+    assert summary_uc.execute(empty.id).package_count == 0
+    try:
+        summary_uc.execute(999)
+        assert False, "Expected NotFoundError"
+    except NotFoundError:
+        assert True
+
+
+def test_update_and_delete_report_missing_rows():
+    repo = InMemoryStockQuantPackageRepository()
+    created = CreateStockQuantPackage(repo).execute(name="PACK1", package_type_id=1, shipping_weight=2.0, picking_id=3)
+    updated = UpdateStockQuantPackage(repo).execute(created.id, shipping_weight=4.5)
+    assert (updated.name, updated.package_type_id, updated.shipping_weight, updated.picking_id) == ("PACK1", 1, 4.5, 3)
+    try:
+        UpdateStockQuantPackage(repo).execute(created.id, shipping_weight=-1)
+        assert False, "Expected ValidationError"
+    except ValidationError:
+        assert repo.get_by_id(created.id).shipping_weight == 4.5
+    try:
+        UpdateStockQuantPackage(repo).execute(999, name="X")
+        assert False, "Expected NotFoundError"
+    except NotFoundError:
+        assert True
+    DeleteStockQuantPackage(repo).execute(created.id)
+    try:
+        DeleteStockQuantPackage(repo).execute(created.id)
+        assert False, "Expected NotFoundError"
+    except NotFoundError:
+        assert True
+
+
+def test_get_by_ids_keeps_request_order_and_marks_missing():
+    package_types = InMemoryStockPackageTypeRepository()
+    pickings = InMemoryStockPickingRepository()
+    packages = InMemoryStockQuantPackageRepository(package_types, pickings)
+    package_type = CreateStockPackageType(package_types).execute(name="Caja", weight=1.0)
+    picking = CreateStockPicking(pickings).execute(name="OUT/0001", partner_id=1)
+    created = [
+        CreateStockQuantPackage(packages).execute(
+            name=f"PK{i}", package_type_id=package_type.id, shipping_weight=1.0, picking_id=picking.id
+        )
+        for i in range(3)
+    ]
+
+    ids = [created[2].id, 999, created[0].id, created[2].id]
+    results = GetStockQuantPackagesByIds(packages).execute(ids)
+    assert [r.id for r in results] == ids
+    assert [r.item.name if r.item else None for r in results] == ["PK2", None, "PK0", "PK2"]
+
+    cached = CachedStockPackageTypeRepository(package_types, TTLCache(max_size=8, ttl=60.0))
+    cached.get_by_id(package_type.id)
+    results = GetStockPackageTypesByIds(cached).execute([999, package_type.id])
+    assert [r.item.name if r.item else None for r in results] == [None, "Caja"]
@@ -0,0 +1,110 @@
+import httpx
+import pytest
+
+from cliente.infrastructure.api_client import ApiClient, ApiError
+from cliente.infrastructure.http_options import HttpOptions, backoff_delay
+
+PARTNER = {"id": 1, "name": "ACME", "email": None, "phone": None}
+
+
+class FlakyServer:
+    def __init__(self, failures: list) -> None:
+        self.failures = list(failures)
+        self.calls: list[tuple[str, float | None]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls.append((request.method, request.extensions["timeout"]["read"]))
+        if self.failures:
+            failure = self.failures.pop(0)
+            if isinstance(failure, int):
+                return httpx.Response(failure, json={"detail": "caido"})
+            raise failure("falla", request=request)
+        if request.method == "POST":
+            return httpx.Response(201, json=PARTNER)
+        if request.url.path.endswith("res-partners"):
+            return httpx.Response(200, json={"items": [PARTNER]})
+        return httpx.Response(200, json=PARTNER)
+
+
+def _client(server: FlakyServer, retries: int = 2) -> tuple[ApiClient, list[float]]:
+    sleeps: list[float] = []
+    api = ApiClient(
+        base_url="http://api",
+        options=HttpOptions(retries=retries, backoff=0.1),
+        transport=httpx.MockTransport(server),
+        sleep=sleeps.append,
+    )
+    return api, sleeps
+
+
+def test_get_retries_connect_errors_and_5xx_with_backoff():
+    server = FlakyServer([httpx.ConnectError, 503])
+    api, sleeps = _client(server)
+    assert api.get_res_partner(1).name == "ACME"
+    assert len(server.calls) == 3
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 0.1 and 0 <= sleeps[1] <= 0.2
+    assert api.rtt.summary()["samples"] == 2
+
+
+def test_post_is_not_retried():
+    server = FlakyServer([httpx.ConnectError])
+    api, sleeps = _client(server)
+    with pytest.raises(ApiError) as exc:
+        api.create_res_partner({"name": "ACME"})
+    assert exc.value.status_code == 0
+    assert len(server.calls) == 1
+    assert sleeps == []
+
+
+def test_post_with_idempotency_key_is_retried_with_the_same_key():
+    keys: list[str | None] = []
+    server = FlakyServer([httpx.ReadError])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        keys.append(request.headers.get("idempotency-key"))
+        return server(request)
+
+    api = ApiClient(
+        base_url="http://api",
+        options=HttpOptions(retries=2, backoff=0.1, idempotency_keys=True),
+        transport=httpx.MockTransport(handler),
+        sleep=lambda _: None,
+    )
+    assert api.create_res_partner({"name": "ACME"}).name == "ACME"
+    assert len(keys) == 2 and keys[0] and keys[0] == keys[1]
+    api.create_res_partner({"name": "ACME"})
+    assert keys[2] != keys[0]
+
+
+def test_upsert_post_is_retried():
+    server = FlakyServer([503])
+    api, sleeps = _client(server)
+    with pytest.raises(ApiError):
+        # El FlakyServer no sabe responder un :upsert; alcanza con ver el reintento.
+        api.upsert_stock_pickings([{"name": "PICK001", "partner_id": 1}])
+    assert [method for method, _ in server.calls] == ["POST", "POST"]
+    assert len(sleeps) == 1
+
+
+def test_retries_are_bounded():
+    server = FlakyServer([httpx.ReadTimeout] * 5)
+    api, sleeps = _client(server, retries=2)
+    with pytest.raises(ApiError) as exc:
+        api.delete_res_partner(1)
+    assert "a tiempo" in exc.value.detail
+    assert len(server.calls) == 3
+    assert len(sleeps) == 2
+
+
+def test_per_call_timeout_overrides_default():
+    server = FlakyServer([])
+    api, _ = _client(server)
+    api.get_res_partner(1)
+    api.list_res_partners_page(timeout=30.0)
+    assert [timeout for _, timeout in server.calls] == [10.0, 30.0]
+
+
+def test_backoff_delay_is_capped():
+    options = HttpOptions(backoff=1.0, backoff_max=3.0)
+    assert all(backoff_delay(10, options) <= 3.0 for _ in range(20))
@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from cliente.dtos.page_dto import PageDTO
+from cliente.infrastructure.api_client import ApiError
+from cliente.presentation.cli.pager import PrefetchPager
+
+
+class FakeList:
+    def __init__(self, pages: int) -> None:
+        self.pages = pages
+        self.calls: list[str | None] = []
+        self.fetched = threading.Event()
+        self.fail_next = False
+
+    def __call__(self, cursor: str | None) -> PageDTO[int]:
+        self.calls.append(cursor)
+        self.fetched.set()
+        if self.fail_next:
+            self.fail_next = False
+            raise ApiError(503, "caido")
+        index = int(cursor) if cursor else 0
+        next_cursor = str(index + 1) if index + 1 < self.pages else None
+        return PageDTO(items=[index], next_cursor=next_cursor)
+
+
+def _wait_for_calls(source: FakeList, count: int) -> None:
+    for _ in range(200):
+        if len(source.calls) >= count:
+            return
+        source.fetched.wait(0.01)
+        source.fetched.clear()
+    raise AssertionError(f"se esperaban {count} fetches, hubo {len(source.calls)}")
+
+
+def test_pager_prefetches_next_page_in_background():
+    source = FakeList(pages=3)
+    with PrefetchPager(source) as pager:
+        assert pager.current().items == [0]
+        _wait_for_calls(source, 2)
+        assert source.calls == [None, "1"]
+        assert pager.next()
+        assert pager.current().items == [1]
+        _wait_for_calls(source, 3)
+        assert pager.next()
+        assert pager.current().items == [2]
+        assert not pager.next()
+        assert pager.index == 2
+    assert source.calls == [None, "1", "2"]
+
+
+def test_pager_back_navigation_uses_window_then_refetches_by_cursor():
+    source = FakeList(pages=6)
+    with PrefetchPager(source, window=2) as pager:
+        for _ in range(4):
+            pager.current()
+            pager.next()
+        assert pager.current().items == [4]
+        _wait_for_calls(source, 6)
+        calls = len(source.calls)
+        assert pager.previous()
+        assert pager.current().items == [3]
+        assert len(source.calls) == calls + 1
+        assert source.calls[-1] == "3"
+
+
+def test_pager_failed_page_is_retried():
+    source = FakeList(pages=2)
+    source.fail_next = True
+    with PrefetchPager(source) as pager:
+        with pytest.raises(ApiError):
+            pager.current()
+        assert pager.current().items == [0]
+
+
+def test_pager_close_does_not_wait_for_inflight_prefetch():
+    release = threading.Event()
+    started: list[str | None] = []
+
+    def slow(cursor: str | None) -> PageDTO[int]:
+        started.append(cursor)
+        if cursor:
+            release.wait(5)
+        return PageDTO(items=[0], next_cursor=str(len(started)))
+
+    pager = PrefetchPager(slow)
+    pager.current()
+    for _ in range(200):
+        if len(started) == 2:
+            break
+        release.wait(0.01)
+    pager.close()
+    assert not release.is_set()
+    release.set()
+    assert started == [None, "1"]
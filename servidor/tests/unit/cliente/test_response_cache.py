@@ -0,0 +1,83 @@
+import httpx
+
+from cliente.infrastructure.api_client import ApiClient
+from cliente.infrastructure.http_options import HttpOptions
+from cliente.infrastructure.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class VersionedServer:
+    def __init__(self) -> None:
+        self.version = 1
+        self.requests: list[tuple[str, str | None]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append((request.method, request.headers.get("if-none-match")))
+        if request.method == "PUT":
+            self.version += 1
+        etag = f'W/"7-{self.version}"'
+        if request.method == "GET" and request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        body = {"id": 7, "name": f"ACME v{self.version}", "email": None, "phone": None}
+        return httpx.Response(200, json=body, headers={"ETag": etag})
+
+
+def _client(server: VersionedServer, clock: FakeClock) -> ApiClient:
+    api = ApiClient(base_url="http://api", options=HttpOptions(retries=0), transport=httpx.MockTransport(server))
+    api.cache = ResponseCache(max_size=8, ttl=5.0, clock=clock)
+    return api
+
+
+def test_response_cache_lookup_keeps_stale_entries_for_revalidation():
+    clock = FakeClock()
+    cache = ResponseCache(max_size=2, ttl=5.0, clock=clock)
+    cache.store("a", 1, 'W/"a"')
+    assert cache.lookup("a").fresh
+    clock.now = 6.0
+    entry = cache.lookup("a")
+    assert (entry.value, entry.etag, entry.fresh) == (1, 'W/"a"', False)
+    cache.revalidated("a", entry)
+    assert cache.lookup("a").fresh
+    cache.store("b", 2, None)
+    cache.store("c", 3, None)
+    assert cache.lookup("a") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_api_client_serves_fresh_hits_and_revalidates_with_etag():
+    server, clock = VersionedServer(), FakeClock()
+    api = _client(server, clock)
+
+    assert api.get_res_partner(7).name == "ACME v1"
+    assert api.get_res_partner(7).name == "ACME v1"
+    assert len(server.requests) == 1
+
+    clock.now = 10.0
+    assert api.get_res_partner(7).name == "ACME v1"
+    assert server.requests[-1] == ("GET", 'W/"7-1"')
+
+    api.update_res_partner(7, {"name": "ACME v2"})
+    assert api.get_res_partner(7).name == "ACME v2"
+    assert server.requests[-1] == ("GET", None)
+    stats = api.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["revalidations"]) == (1, 2, 1)
+
+
+def test_api_client_without_cache_always_fetches():
+    server = VersionedServer()
+    api = ApiClient(
+        base_url="http://api",
+        options=HttpOptions(retries=0, cache_size=0),
+        transport=httpx.MockTransport(server),
+    )
+    api.get_res_partner(7)
+    api.get_res_partner(7)
+    assert len(server.requests) == 2
+    assert api.cache_stats() is None
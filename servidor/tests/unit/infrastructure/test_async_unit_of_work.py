@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import pytest
+from pymysql.err import ProgrammingError
+
+from application.exceptions import DatabaseError
+from domain.entities.res_partner import ResPartner
+from infrastructure.db.async_unit_of_work import AsyncMySQLUnitOfWork
+
+
+class FakeCursor:
+    def __init__(self, connection) -> None:
+        self.connection = connection
+        self.lastrowid = None
+        self.row = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
+
+    async def execute(self, sql, args=None):
+        self.connection.statements.append(sql)
+        if self.connection.missing_table:
+            raise ProgrammingError(1146, "Table doesn't exist")
+        if sql.startswith("INSERT"):
+            self.lastrowid = 7
+        elif "updated_at" in sql:
+            self.row = {"updated_at": datetime(2026, 1, 1)}
+        else:
+            self.row = {"id": args[0], "name": "Cliente", "email": None, "phone": None, "updated_at": None}
+
+    async def fetchone(self):
+        return self.row
+
+
+class FakeConnection:
+    def __init__(self, fail_commit: bool = False, missing_table: bool = False) -> None:
+        self.fail_commit = fail_commit
+        self.missing_table = missing_table
+        self.statements: list[str] = []
+        self.committed = False
+        self.rolled_back = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    async def commit(self) -> None:
+        if self.fail_commit:
+            raise RuntimeError("commit")
+        self.committed = True
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
+
+
+class FakePool:
+    def __init__(self, connection: FakeConnection) -> None:
+        self.connection = connection
+        self.released: list[bool] = []
+
+    async def acquire(self):
+        return self.connection
+
+    def release(self, conn, discard: bool = False) -> None:
+        self.released.append(discard)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_async_unit_of_work_commits_and_releases():
+    pool = FakePool(FakeConnection())
+    async with AsyncMySQLUnitOfWork(pool) as uow:
+        created = await uow.partners.create(ResPartner(name="Cliente"))
+        found = await uow.partners.get_by_id(created.id)
+    assert (created.id, created.updated_at) == (7, datetime(2026, 1, 1))
+    assert found.name == "Cliente"
+    assert pool.connection.statements[0].startswith("INSERT INTO res_partner (name, email, phone)")
+    assert pool.connection.committed
+    assert pool.released == [False]
+
+
+@pytest.mark.anyio
+async def test_async_unit_of_work_rolls_back_on_error():
+    pool = FakePool(FakeConnection(missing_table=True))
+    with pytest.raises(DatabaseError, match="res_partner"):
+        async with AsyncMySQLUnitOfWork(pool) as uow:
+            await uow.partners.get_by_id(1)
+    assert pool.connection.rolled_back
+    assert pool.released == [False]
+
+
+@pytest.mark.anyio
+async def test_async_unit_of_work_discards_connection_when_commit_fails():
+    pool = FakePool(FakeConnection(fail_commit=True))
+    with pytest.raises(RuntimeError):
+        async with AsyncMySQLUnitOfWork(pool):
+            pass
+    assert pool.released == [True]
@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pytest
+
+from infrastructure.db.mysql_connection import MySQLConnectionPool, MySQLPoolConfig
+from application.exceptions import DatabaseError
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.open = True
+        self.healthy = True
+        self.pings = 0
+
+    def ping(self, reconnect: bool = False) -> None:
+        self.pings += 1
+        if not self.healthy:
+            raise ConnectionError("gone")
+
+    def close(self) -> None:
+        self.open = False
+
+
+class FakeFactory:
+    def __init__(self) -> None:
+        self.created: list[FakeConnection] = []
+
+    def connect(self) -> FakeConnection:
+        conn = FakeConnection()
+        self.created.append(conn)
+        return conn
+
+
+def _pool(**kwargs) -> tuple[MySQLConnectionPool, FakeFactory]:
+    factory = FakeFactory()
+    return MySQLConnectionPool(factory, MySQLPoolConfig(**kwargs)), factory
+
+
+def test_pool_reuses_released_connection():
+    pool, factory = _pool(max_size=2)
+    conn = pool.acquire()
+    pool.release(conn)
+    again = pool.acquire()
+    assert again is conn
+    assert conn.pings == 1
+    assert len(factory.created) == 1
+
+
+def test_pool_fill_opens_min_size():
+    pool, factory = _pool(min_size=2, max_size=4)
+    pool.fill()
+    assert pool.size == 2
+    assert pool.idle == 2
+    assert len(factory.created) == 2
+
+
+def test_pool_discards_unhealthy_connection_on_checkout():
+    pool, factory = _pool(max_size=1)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.healthy = False
+    fresh = pool.acquire()
+    assert fresh is not conn
+    assert conn.open is False
+    assert pool.size == 1
+
+
+def test_pool_recycles_old_connections():
+    pool, factory = _pool(max_size=1, recycle=0.0)
+    conn = pool.acquire()
+    time.sleep(0.01)
+    pool.release(conn)
+    assert conn.open is False
+    assert pool.size == 0
+    assert pool.acquire() is not conn
+
+
+def test_pool_times_out_when_exhausted():
+    pool, _ = _pool(max_size=1, timeout=0.05)
+    pool.acquire()
+    with pytest.raises(DatabaseError):
+        pool.acquire()
+
+
+def test_pool_waiter_gets_released_connection():
+    pool, _ = _pool(max_size=1, timeout=2.0)
+    conn = pool.acquire()
+    got: list[FakeConnection] = []
+
+    def _borrow() -> None:
+        got.append(pool.acquire())
+
+    worker = threading.Thread(target=_borrow)
+    worker.start()
+    time.sleep(0.05)
+    pool.release(conn)
+    worker.join(timeout=2.0)
+    assert got == [conn]
+
+
+def test_pool_rejects_invalid_sizes():
+    with pytest.raises(ValueError):
+        _pool(min_size=3, max_size=2)
+
+
+def test_pool_from_env_defaults_max_size(monkeypatch):
+    monkeypatch.delenv("DB_POOL_MAX_SIZE", raising=False)
+    assert MySQLConnectionPool.from_env(FakeFactory(), default_max_size=40).config.max_size == 40
+    monkeypatch.setenv("DB_POOL_MAX_SIZE", "12")
+    assert MySQLConnectionPool.from_env(FakeFactory(), default_max_size=40).config.max_size == 12
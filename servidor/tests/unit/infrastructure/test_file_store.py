@@ -0,0 +1,125 @@
+from domain.entities.res_partner import ResPartner
+from domain.entities.stock_picking import StockPicking
+from domain.entities.stock_quant_package import StockQuantPackage
+from infrastructure.db.file_store import FileStore
+from infrastructure.db.file_unit_of_work import FileUnitOfWork
+from servidor.app.routers.stock_quant_packages import export_packages
+
+
+def _reopen(path, **kwargs) -> FileStore:
+    store = FileStore(path, fsync=False, **kwargs)
+    store.open()
+    return store
+
+
+def test_file_store_commit_survives_restart(tmp_path):
+    store = _reopen(tmp_path)
+    with FileUnitOfWork(store) as uow:
+        partner = uow.partners.create(ResPartner(name="Ana", email="ana@example.com"))
+        uow.packages.create(StockQuantPackage(name="PACK001", package_type_id=1, picking_id=1))
+    with FileUnitOfWork(store) as uow:
+        uow.partners.update(ResPartner(id=partner.id, name="Ana B"))
+
+    store = _reopen(tmp_path)
+    with FileUnitOfWork(store) as uow:
+        assert uow.partners.get_by_id(partner.id).name == "Ana B"
+        assert uow.packages.get_by_name("PACK001").id == 1
+        assert uow.partners.create(ResPartner(name="Beto")).id == partner.id + 1
+
+
+def test_file_store_rollback_restores_state(tmp_path):
+    store = _reopen(tmp_path)
+    with FileUnitOfWork(store) as uow:
+        kept = uow.partners.create(ResPartner(name="Ana"))
+        doomed = uow.partners.create(ResPartner(name="Beto"))
+    try:
+        with FileUnitOfWork(store) as uow:
+            uow.partners.update(ResPartner(id=kept.id, name="Cambiado"))
+            uow.partners.update_fields(doomed.id, {"email": "b@x.com"})
+            uow.partners.delete(doomed.id)
+            uow.partners.create(ResPartner(name="Nuevo"))
+            raise RuntimeError("fallo")
+    except RuntimeError:
+        pass
+
+    with FileUnitOfWork(store) as uow:
+        names = [p.name for p in uow.partners.list(limit=10, offset=0)]
+    assert names == ["Beto", "Ana"]
+    assert store.data.partners.get_by_id(doomed.id).email is None
+    assert _reopen(tmp_path).data.partners.list(limit=10, offset=0)[0].name == "Beto"
+
+
+def test_file_store_journals_upserts(tmp_path):
+    store = _reopen(tmp_path)
+    with FileUnitOfWork(store) as uow:
+        uow.pickings.upsert_many([StockPicking(name="PICK001", partner_id=1)])
+    try:
+        with FileUnitOfWork(store) as uow:
+            uow.pickings.upsert_many(
+                [StockPicking(name="PICK001", partner_id=2), StockPicking(name="PICK002", partner_id=1)]
+            )
+            raise RuntimeError("fallo")
+    except RuntimeError:
+        pass
+    assert store.data.pickings.get_by_name("PICK001").partner_id == 1
+    assert store.data.pickings.get_by_name("PICK002") is None
+
+    with FileUnitOfWork(store) as uow:
+        previous_id = store.data.pickings.get_by_name("PICK001").id
+        results = uow.pickings.upsert_many([StockPicking(name="PICK001", partner_id=3)])
+    assert [picking.id for picking in results] == [previous_id]
+    assert _reopen(tmp_path).data.pickings.get_by_name("PICK001").partner_id == 3
+
+
+def test_file_store_compacts_into_snapshot(tmp_path):
+    store = _reopen(tmp_path, snapshot_every=3)
+    for i in range(7):
+        with FileUnitOfWork(store) as uow:
+            uow.partners.create(ResPartner(name=f"Cliente {i}"))
+    with FileUnitOfWork(store) as uow:
+        uow.partners.delete(2)
+    assert store.wal_records == 2
+    assert store.snapshot_path.exists()
+
+    reopened = _reopen(tmp_path)
+    ids = [p.id for p in reopened.data.partners.list(limit=10, offset=0)]
+    assert ids == [7, 6, 5, 4, 3, 1]
+
+
+def test_file_store_keeps_commit_when_snapshot_fails(tmp_path, monkeypatch):
+    store = _reopen(tmp_path, snapshot_every=1)
+
+    def broken_snapshot():
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr(store, "_snapshot", broken_snapshot)
+    with FileUnitOfWork(store) as uow:
+        uow.partners.create(ResPartner(name="Ana"))
+    assert [p.name for p in store.data.partners.list(limit=10, offset=0)] == ["Ana"]
+    assert [p.name for p in _reopen(tmp_path).data.partners.list(limit=10, offset=0)] == ["Ana"]
+
+
+def test_file_store_export_releases_lock_before_streaming(tmp_path):
+    store = _reopen(tmp_path)
+    with FileUnitOfWork(store) as uow:
+        uow.packages.create(StockQuantPackage(name="PACK001", package_type_id=1, picking_id=1))
+    response = export_packages(uow=FileUnitOfWork(store))
+    # La primera parte ya se genero: el resto del stream no debe retener la base.
+    assert store.lock.acquire(blocking=False)
+    store.lock.release()
+    assert response.media_type == "application/x-ndjson"
+
+
+def test_file_store_discards_torn_tail(tmp_path):
+    store = _reopen(tmp_path)
+    with FileUnitOfWork(store) as uow:
+        uow.partners.create(ResPartner(name="Ana"))
+    store.close()
+    with open(store.wal_path, "ab") as f:
+        f.write(b'{"ops":[["partners","put",{"na')
+
+    reopened = _reopen(tmp_path)
+    assert [p.name for p in reopened.data.partners.list(limit=10, offset=0)] == ["Ana"]
+    with FileUnitOfWork(reopened) as uow:
+        uow.partners.create(ResPartner(name="Beto"))
+    assert len(_reopen(tmp_path).data.partners.list(limit=10, offset=0)) == 2
@@ -0,0 +1,24 @@
+from domain.exceptions import ValidationError
+from domain.value_objects.stock_picking_filter import StockPickingFilter
+from domain.value_objects.stock_quant_package_filter import StockQuantPackageFilter
+from infrastructure.repositories._filters import like_prefix, name_prefix_conditions
+
+
+def test_like_prefix_escapes_wildcards():
+    assert like_prefix("WH/OUT") == "WH/OUT%"
+    assert like_prefix("100%_a\\b") == "100\\%\\_a\\\\b%"
+
+
+def test_name_prefix_conditions():
+    assert name_prefix_conditions(None) == ([], [])
+    assert name_prefix_conditions("Ana", column="p.name") == (["p.name LIKE %s"], ["Ana%"])
+
+
+def test_filters_validate_input():
+    assert StockPickingFilter(name_prefix="   ").name_prefix is None
+    for kwargs in ({"min_weight": 5, "max_weight": 1}, {"picking_id": 0}, {"min_weight": -1}):
+        try:
+            StockQuantPackageFilter(**kwargs)
+            assert False, "Expected ValidationError"
+        except ValidationError:
+            assert True
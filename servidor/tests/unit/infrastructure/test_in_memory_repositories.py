@@ -2,6 +2,8 @@ from infrastructure.repositories.in_memory_res_partner_repository import InMemor
 from infrastructure.repositories.in_memory_stock_picking_repository import InMemoryStockPickingRepository
 from infrastructure.repositories.in_memory_stock_package_type_repository import InMemoryStockPackageTypeRepository
 from infrastructure.repositories.in_memory_stock_quant_package_repository import InMemoryStockQuantPackageRepository
+from concurrent.futures import ThreadPoolExecutor
+from infrastructure.db.in_memory_unit_of_work import InMemoryUnitOfWork
 from domain.entities.res_partner import ResPartner
 from domain.entities.stock_picking import StockPicking
 from domain.entities.stock_package_type import StockPackageType
@@ -46,3 +48,78 @@ def test_in_memory_stock_quant_package_repository():
     assert repo.get_by_name("NOPE") is None
     repo.delete(created.id)
     assert repo.get_by_id(created.id) is None
+
+
+def test_in_memory_keyset_pagination():
+    repo = InMemoryResPartnerRepository()
+    for i in range(5):
+        repo.create(ResPartner(name=f"Cliente {i}"))
+    assert [p.id for p in repo.list(limit=2, offset=0)] == [5, 4]
+    assert [p.id for p in repo.list(limit=2, offset=0, after_id=4)] == [3, 2]
+    assert [p.id for p in repo.list(limit=2, offset=0, after_id=2)] == [1]
+    assert [p.id for p in repo.list(limit=2, offset=0, before_id=1)] == [3, 2]
+    assert [p.id for p in repo.list(limit=2, offset=0, before_id=3)] == [5, 4]
+
+
+def test_in_memory_name_index_follows_updates():
+    repo = InMemoryStockQuantPackageRepository()
+    created = repo.create(
+        StockQuantPackage(name="PACK001", package_type_id=1, shipping_weight=1.0, picking_id=1)
+    )
+    repo.update(
+        StockQuantPackage(id=created.id, name="PACK002", package_type_id=1, shipping_weight=1.0, picking_id=1)
+    )
+    assert repo.get_by_name("PACK001") is None
+    assert repo.get_by_name("PACK002").id == created.id
+    repo.delete(created.id)
+    assert repo.get_by_name("PACK002") is None
+
+
+def test_in_memory_paging_matches_id_desc_after_deletes():
+    repo = InMemoryStockPackageTypeRepository()
+    for i in range(20):
+        repo.create(StockPackageType(name=f"Caja {i}"))
+    for package_type_id in (3, 4, 10, 20):
+        repo.delete(package_type_id)
+    expected = sorted(set(range(1, 21)) - {3, 4, 10, 20}, reverse=True)
+    assert [t.id for t in repo.list(limit=100, offset=0)] == expected
+    assert [t.id for t in repo.list(limit=3, offset=2)] == expected[2:5]
+    assert [t.id for t in repo.list(limit=3, offset=0, after_id=10)] == [9, 8, 7]
+    assert [t.id for t in repo.list(limit=3, offset=1, before_id=4)] == [8, 7, 6]
+    assert repo.list(limit=3, offset=50) == []
+
+
+def test_in_memory_filtered_paging():
+    from domain.value_objects.res_partner_filter import ResPartnerFilter
+    from domain.value_objects.stock_quant_package_filter import StockQuantPackageFilter
+
+    packages = InMemoryStockQuantPackageRepository()
+    for i in range(1, 21):
+        packages.create(
+            StockQuantPackage(name=f"PACK{i:03d}", package_type_id=1 + i % 2, shipping_weight=i, picking_id=1 + i % 3)
+        )
+    filters = StockQuantPackageFilter(picking_id=1, min_weight=4, max_weight=18)
+    expected = [i for i in range(20, 0, -1) if i % 3 == 0 and 4 <= i <= 18]
+    assert [p.id for p in packages.list(limit=50, offset=0, filters=filters)] == expected
+    assert [p.id for p in packages.list(limit=2, offset=1, filters=filters)] == expected[1:3]
+    assert [p.id for p in packages.list(limit=2, offset=0, after_id=12, filters=filters)] == [9, 6]
+    assert [p.id for p in packages.list(limit=2, offset=0, before_id=9, filters=filters)] == [15, 12]
+
+    partners = InMemoryResPartnerRepository()
+    for name in ("Ana", "anabel", "Beto", "100%_real"):
+        partners.create(ResPartner(name=name))
+    assert [p.name for p in partners.list(10, 0, filters=ResPartnerFilter(name_prefix="ana"))] == ["anabel", "Ana"]
+    assert [p.name for p in partners.list(10, 0, filters=ResPartnerFilter(name_prefix="100%"))] == ["100%_real"]
+    assert partners.list(10, 0, filters=ResPartnerFilter(name_prefix="100_")) == []
+
+
+def test_in_memory_unit_of_work_serializes_concurrent_creates():
+    uow = InMemoryUnitOfWork()
+
+    def create(i: int) -> int:
+        with uow:
+            return uow.partners.create(ResPartner(name=f"Cliente {i}")).id
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ids = list(pool.map(create, range(200)))
+    assert sorted(ids) == list(range(1, 201))
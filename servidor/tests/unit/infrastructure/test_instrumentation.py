@@ -0,0 +1,68 @@
+from infrastructure.db.instrumentation import InstrumentedConnection, QueryStats, current_query_stats
+
+
+class FakeCursor:
+    def __init__(self) -> None:
+        self.description = None
+        self.rowcount = 0
+        self.closed = False
+        self._rows: list[dict] = []
+
+    def execute(self, query, args=None):
+        if query.startswith("SELECT"):
+            self.description = (("id",),)
+            self._rows = [{"id": 1}, {"id": 2}, {"id": 3}]
+            self.rowcount = len(self._rows)
+        else:
+            self.description = None
+            self.rowcount = 1
+        return self.rowcount
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.cursors: list[FakeCursor] = []
+        self.lastrowid = 7
+
+    def cursor(self, cursor=None):
+        cur = FakeCursor()
+        self.cursors.append(cur)
+        return cur
+
+
+def test_instrumented_cursor_counts_queries_and_rows():
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        conn = InstrumentedConnection(FakeConnection())
+        with conn.cursor() as cur:
+            cur.execute("SELECT id FROM t")
+            assert cur.fetchone() == {"id": 1}
+            assert len(cur.fetchall()) == 2
+            cur.execute("DELETE FROM t WHERE id = 1")
+    finally:
+        current_query_stats.reset(token)
+
+    assert stats.queries == 2
+    assert stats.rows == 4
+    assert stats.db_time >= 0
+    assert conn.lastrowid == 7
+    assert conn.cursors[0].closed is True
+
+
+def test_instrumented_cursor_without_request_context():
+    conn = InstrumentedConnection(FakeConnection())
+    with conn.cursor() as cur:
+        cur.execute("SELECT id FROM t")
+        assert len(cur.fetchall()) == 3
+    assert current_query_stats.get() is None
@@ -0,0 +1,26 @@
+from infrastructure.repositories._lookup import select_by_ids
+
+
+class FakeCursor:
+    def __init__(self) -> None:
+        self.executed: list[tuple[str, list]] = []
+
+    def execute(self, sql, args=None):
+        self.executed.append((sql, list(args)))
+
+    def fetchall(self):
+        return [{"id": i} for i in self.executed[-1][1]]
+
+
+def test_select_by_ids_chunks_and_deduplicates():
+    cur = FakeCursor()
+    rows = select_by_ids(cur, "res_partner", [5, 1, 5, 2, 3, 4], chunk_size=2)
+    assert [r["id"] for r in rows] == [5, 1, 2, 3, 4]
+    assert [args for _, args in cur.executed] == [[5, 1], [2, 3], [4]]
+    assert cur.executed[0][0] == "SELECT * FROM res_partner WHERE id IN (%s, %s)"
+
+
+def test_select_by_ids_without_ids_does_not_query():
+    cur = FakeCursor()
+    assert select_by_ids(cur, "res_partner", []) == []
+    assert cur.executed == []
@@ -0,0 +1,145 @@
+from pymysql.err import ProgrammingError
+from infrastructure.db.migrations import MigrationRunner, load_migrations
+from application.exceptions import DatabaseError
+
+
+class FakeDatabase:
+    def __init__(self) -> None:
+        self.versions: list[int] | None = None
+        self.executed: list[str] = []
+        self.connections = 0
+
+
+class FakeCursor:
+    def __init__(self, db: FakeDatabase) -> None:
+        self.db = db
+        self._row = None
+
+    def execute(self, sql, params=None):
+        sql = sql.strip()
+        self.db.executed.append(sql)
+        if sql.startswith("SELECT GET_LOCK"):
+            self._row = {"locked": 1}
+        elif sql.startswith("SELECT MAX(version)"):
+            if self.db.versions is None:
+                raise ProgrammingError(1146, "Table 'schema_version' doesn't exist")
+            self._row = {"version": max(self.db.versions, default=None)}
+        elif sql.startswith("CREATE TABLE IF NOT EXISTS schema_version"):
+            if self.db.versions is None:
+                self.db.versions = []
+        elif sql.startswith("INSERT INTO schema_version"):
+            self.db.versions.append(params[0])
+
+    def fetchone(self):
+        return self._row
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+class FakeConnection:
+    def __init__(self, db: FakeDatabase) -> None:
+        self.db = db
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def commit(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class FakeFactory:
+    def __init__(self, db: FakeDatabase) -> None:
+        self.db = db
+
+    def connect(self) -> FakeConnection:
+        self.db.connections += 1
+        return FakeConnection(self.db)
+
+
+def _scripts(tmp_path):
+    (tmp_path / "schema.sql").write_text("CREATE TABLE IF NOT EXISTS a (id INT);\nCREATE TABLE IF NOT EXISTS b (id INT);\n")
+    (tmp_path / "migrations").mkdir()
+    (tmp_path / "migrations" / "0002_add_c.sql").write_text("CREATE TABLE IF NOT EXISTS c (id INT);")
+    (tmp_path / "migrations" / "README.md").write_text("no es migracion")
+    return tmp_path
+
+
+def test_migration_statements_ignore_line_comments(tmp_path):
+    (tmp_path / "schema.sql").write_text("-- uno; dos\nCREATE TABLE a (id INT);\n  -- fin;\n")
+    assert load_migrations(tmp_path)[0].statements() == ["CREATE TABLE a (id INT)"]
+
+
+def test_load_migrations_orders_by_version(tmp_path):
+    migrations = load_migrations(_scripts(tmp_path))
+    assert [(m.version, m.name) for m in migrations] == [(1, "schema"), (2, "add_c")]
+    assert len(migrations[0].statements()) == 2
+
+
+def test_migration_runner_applies_pending_then_skips(tmp_path):
+    db = FakeDatabase()
+    runner = MigrationRunner(FakeFactory(db), load_migrations(_scripts(tmp_path)))
+    applied = runner.ensure_current()
+    assert [m.version for m in applied] == [1, 2]
+    assert db.versions == [1, 2]
+    assert "SELECT RELEASE_LOCK(%s)" in db.executed
+
+    db.executed.clear()
+    db.connections = 0
+    assert runner.ensure_current() == []
+    assert db.connections == 1
+    assert db.executed == ["SELECT MAX(version) AS version FROM schema_version"]
+
+
+def test_migration_runner_without_auto_migrate(tmp_path):
+    db = FakeDatabase()
+    db.versions = [1]
+    runner = MigrationRunner(FakeFactory(db), load_migrations(_scripts(tmp_path)))
+    assert [m.version for m in runner.pending()] == [2]
+    try:
+        runner.ensure_current(auto_migrate=False)
+        assert False, "Expected DatabaseError"
+    except DatabaseError as exc:
+        assert "v1" in str(exc)
+
+
+def test_repository_migrations_are_contiguous():
+    from pathlib import Path
+
+    scripts_dir = Path(__file__).resolve().parents[3] / "scripts"
+    versions = [m.version for m in load_migrations(scripts_dir)]
+    assert versions == list(range(1, len(versions) + 1))
+    assert versions[-1] >= 2
+
+
+
+def _repository_migration(name: str):
+    from pathlib import Path
+
+    scripts_dir = Path(__file__).resolve().parents[3] / "scripts"
+    return next(m for m in load_migrations(scripts_dir) if m.name == name)
+
+
+def _assert_index_ddl_guarded(migration) -> None:
+    guarded = 0
+    for stmt in migration.statements():
+        # ADD/DROP INDEX sueltos fallan al reejecutar; van dentro de un SET @ddl = IF(...).
+        if "ADD INDEX" in stmt or "DROP INDEX" in stmt:
+            assert stmt.startswith("SET @ddl = IF("), stmt
+            assert "information_schema.statistics" in stmt
+            guarded += 1
+    assert guarded
+
+
+def test_fk_keyset_indexes_migration_is_rerunnable():
+    _assert_index_ddl_guarded(_repository_migration("fk_keyset_indexes"))
+
+
+def test_name_prefix_indexes_migration_is_rerunnable():
+    _assert_index_ddl_guarded(_repository_migration("name_prefix_indexes"))
@@ -0,0 +1,78 @@
+from infrastructure.cache.ttl_cache import TTLCache
+from infrastructure.repositories.cached_stock_package_type_repository import CachedStockPackageTypeRepository
+from infrastructure.repositories.in_memory_stock_package_type_repository import InMemoryStockPackageTypeRepository
+from domain.entities.stock_package_type import StockPackageType
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingRepository(InMemoryStockPackageTypeRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = 0
+
+    def get_by_id(self, package_type_id: int) -> StockPackageType | None:
+        self.reads += 1
+        return super().get_by_id(package_type_id)
+
+
+def test_ttl_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache(max_size=4, ttl=10.0, clock=clock)
+    cache.set(1, "a")
+    assert cache.get(1) == "a"
+    clock.now = 11.0
+    assert cache.get(1) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl=60.0)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    cache.get(1)
+    cache.set(3, "c")
+    assert cache.get(2) is None
+    assert cache.get(1) == "a"
+    assert cache.get(3) == "c"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cached_package_type_repository_hits_and_invalidates():
+    inner = CountingRepository()
+    cache = TTLCache(max_size=16, ttl=60.0)
+    repo = CachedStockPackageTypeRepository(inner, cache)
+    created = repo.create(StockPackageType(name="Cono", weight=0.5))
+
+    assert repo.get_by_id(created.id).weight == 0.5
+    assert repo.get_by_id(created.id).weight == 0.5
+    assert inner.reads == 1
+    assert cache.stats()["hits"] == 1
+
+    repo.update(StockPackageType(id=created.id, name="Cono", weight=0.75))
+    assert repo.get_by_id(created.id).weight == 0.75
+    assert inner.reads == 2
+
+    repo.delete(created.id)
+    assert repo.get_by_id(created.id) is None
+
+
+def test_cached_package_type_repository_invalidates_again_after_commit():
+    inner = CountingRepository()
+    cache = TTLCache(max_size=16, ttl=60.0)
+    repo = CachedStockPackageTypeRepository(inner, cache)
+    created = repo.create(StockPackageType(name="Cono", weight=0.5))
+    repo.flush_invalidations()
+
+    repo.update_fields(created.id, {"weight": 0.75})
+    # Lectura concurrente antes del commit: vuelve a cachear la version anterior.
+    cache.set(created.id, StockPackageType(id=created.id, name="Cono", weight=0.5))
+    repo.flush_invalidations()
+    assert repo.get_by_id(created.id).weight == 0.75
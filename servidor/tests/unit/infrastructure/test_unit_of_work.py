@@ -2,46 +2,73 @@ from infrastructure.db.unit_of_work import MySQLUnitOfWork
 
 
 class FakeConnection:
-    def __init__(self) -> None:
+    def __init__(self, fail_commit: bool = False) -> None:
         self.committed = False
         self.rolled_back = False
-        self.closed = False
+        self.fail_commit = fail_commit
 
     def commit(self) -> None:
+        if self.fail_commit:
+            raise RuntimeError("commit")
         self.committed = True
 
     def rollback(self) -> None:
         self.rolled_back = True
 
-    def close(self) -> None:
-        self.closed = True
 
-
-class FakeFactory:
+class FakePool:
     def __init__(self, conn: FakeConnection) -> None:
         self._conn = conn
+        self.released: list[tuple[FakeConnection, bool]] = []
 
-    def connect(self):
+    def acquire(self):
         return self._conn
 
+    def release(self, conn, discard: bool = False) -> None:
+        self.released.append((conn, discard))
+
 
 def test_unit_of_work_commit_and_rollback():
     conn = FakeConnection()
-    uow = MySQLUnitOfWork(FakeFactory(conn))
+    pool = FakePool(conn)
+    uow = MySQLUnitOfWork(pool)
     uow.connection = conn
     uow.__exit__(None, None, None)
     assert conn.committed is True
-    assert conn.closed is True
+    assert pool.released == [(conn, False)]
 
     conn2 = FakeConnection()
-    uow2 = MySQLUnitOfWork(FakeFactory(conn2))
+    pool2 = FakePool(conn2)
+    uow2 = MySQLUnitOfWork(pool2)
     uow2.connection = conn2
     uow2.__exit__(Exception, Exception("x"), None)
     assert conn2.rolled_back is True
-    assert conn2.closed is True
+    assert pool2.released == [(conn2, False)]
+
+
+def test_unit_of_work_borrows_from_pool():
+    conn = FakeConnection()
+    pool = FakePool(conn)
+    with MySQLUnitOfWork(pool) as uow:
+        assert uow.connection is conn
+    assert conn.committed is True
+    assert pool.released == [(conn, False)]
+
+
+def test_unit_of_work_discards_connection_on_failed_commit():
+    conn = FakeConnection(fail_commit=True)
+    pool = FakePool(conn)
+    uow = MySQLUnitOfWork(pool)
+    uow.connection = conn
+    try:
+        uow.__exit__(None, None, None)
+        assert False, "Expected RuntimeError"
+    except RuntimeError:
+        assert True
+    assert pool.released == [(conn, True)]
 
 
 def test_unit_of_work_no_connection_exit():
-    uow = MySQLUnitOfWork(FakeFactory(FakeConnection()))
+    uow = MySQLUnitOfWork(FakePool(FakeConnection()))
     uow.connection = None
     uow.__exit__(None, None, None)
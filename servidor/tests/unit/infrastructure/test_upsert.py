@@ -0,0 +1,71 @@
+import unicodedata
+
+from infrastructure.repositories import _upsert
+from infrastructure.repositories._upsert import name_matches, upsert_by_name
+
+
+def _weight(name: str) -> str:
+    # Aproxima utf8mb4_0900_ai_ci: ignora acentos y mayusculas (NO PAD).
+    base = "".join(c for c in unicodedata.normalize("NFD", name) if not unicodedata.combining(c))
+    return base.casefold().encode().hex().upper()
+
+
+class FakeCursor:
+    # Simula la base: compara nombres por su peso en la collation, nunca en Python.
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.statements: list[str] = []
+        self.results: list[dict] = []
+
+    def _find(self, name: str) -> dict | None:
+        return next((row for row in self.rows if _weight(row["name"]) == _weight(name)), None)
+
+    def execute(self, sql, args=None):
+        self.statements.append(sql)
+        if "information_schema" in sql:
+            self.results = [{"collation_name": "utf8mb4_0900_ai_ci"}]
+        elif "LEFT JOIN" in sql:
+            self.results = []
+            for index, name in enumerate(args):
+                row = self._find(name)
+                self.results.append(
+                    {"idx": index, "name_key": _weight(name), "id": row["id"] if row else None}
+                )
+        else:
+            self.results = [{"idx": index, **self._find(name)} for index, name in enumerate(args)]
+
+    def executemany(self, sql, rows):
+        self.statements.append(sql)
+        for name, partner_id in rows:
+            current = self._find(name)
+            if current is None:
+                current = {"id": len(self.rows) + 1, "name": name}
+                self.rows.append(current)
+            current["partner_id"] = partner_id
+
+    def fetchone(self):
+        return self.results[0] if self.results else None
+
+    def fetchall(self):
+        return self.results
+
+
+def test_name_matches_uses_the_column_collation(monkeypatch):
+    monkeypatch.setattr(_upsert, "_NAME_COLLATIONS", {})
+    cur = FakeCursor([{"id": 1, "name": "José", "partner_id": 1}])
+    matches = name_matches(cur, "stock_picking", ["jose", "JOSÉ", "Maria"])
+    assert [existing_id for _, existing_id in matches] == [1, 1, None]
+    # Misma clave para los nombres que el indice unico considera iguales.
+    assert matches[0][0] == matches[1][0] != matches[2][0]
+    assert "COLLATE utf8mb4_0900_ai_ci" in cur.statements[-1]
+
+    name_matches(cur, "stock_picking", ["Otro"])
+    assert sum("information_schema" in sql for sql in cur.statements) == 1
+
+
+def test_upsert_by_name_returns_the_stored_row_of_each_input(monkeypatch):
+    monkeypatch.setattr(_upsert, "_NAME_COLLATIONS", {})
+    cur = FakeCursor([{"id": 1, "name": "José", "partner_id": 1}])
+    stored = upsert_by_name(cur, "stock_picking", ("name", "partner_id"), [("Jose", 2), ("PICK002", 3)])
+    assert stored[0] == {"id": 1, "name": "José", "partner_id": 2}
+    assert stored[1] == {"id": 2, "name": "PICK002", "partner_id": 3}
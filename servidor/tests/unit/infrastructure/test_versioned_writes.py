@@ -0,0 +1,65 @@
+import pytest
+
+from infrastructure.repositories._versioned_writes import delete_versioned, update_returning
+
+
+class FakeCursor:
+    def __init__(self, rowcount: int, row: dict | None) -> None:
+        self.rowcount = rowcount
+        self.row = row
+        self.executed: list[tuple[str, tuple]] = []
+
+    def execute(self, sql, args=None):
+        self.executed.append((sql, args))
+
+    def fetchone(self):
+        return self.row
+
+
+def test_update_returning_reads_row_back_without_multi_statements():
+    cur = FakeCursor(1, {"id": 7, "name": "OUT/7", "partner_id": 2})
+    row = update_returning(cur, "stock_picking", 7, {"name": "OUT/7"}, ("name", "partner_id"))
+    assert row == {"id": 7, "name": "OUT/7", "partner_id": 2}
+    assert cur.executed == [
+        ("UPDATE stock_picking SET name=%s WHERE id=%s", ("OUT/7", 7)),
+        ("SELECT * FROM stock_picking WHERE id=%s", (7,)),
+    ]
+
+
+def test_update_returning_uses_rowcount_for_missing_rows():
+    cur = FakeCursor(0, None)
+    assert update_returning(cur, "stock_picking", 7, {"partner_id": 3}, ("name", "partner_id")) is None
+
+
+def test_update_returning_rejects_unknown_columns():
+    with pytest.raises(ValueError):
+        update_returning(FakeCursor(1, None), "stock_picking", 7, {"id = 1; --": 1}, ("name", "partner_id"))
+
+
+def test_update_returning_detects_stale_version():
+    from datetime import datetime
+    from application.exceptions import PreconditionFailedError
+
+    version = datetime(2026, 1, 2, 3, 4, 5, 6)
+    cur = FakeCursor(0, {"id": 7, "name": "OUT/7", "partner_id": 2})
+    with pytest.raises(PreconditionFailedError):
+        update_returning(cur, "stock_picking", 7, {"name": "X"}, ("name", "partner_id"), version)
+    sql, args = cur.executed[0]
+    assert sql.endswith("WHERE id=%s AND updated_at=%s")
+    assert args == ("X", 7, version)
+
+
+def test_delete_versioned_only_reads_back_when_nothing_was_deleted():
+    from datetime import datetime
+    from application.exceptions import PreconditionFailedError
+
+    version = datetime(2026, 1, 2, 3, 4, 5, 6)
+    cur = FakeCursor(1, None)
+    assert delete_versioned(cur, "stock_picking", 7, version) is True
+    assert cur.executed == [("DELETE FROM stock_picking WHERE id=%s AND updated_at=%s", (7, version))]
+
+    cur = FakeCursor(0, {"id": 7})
+    with pytest.raises(PreconditionFailedError):
+        delete_versioned(cur, "stock_picking", 7, version)
+    assert cur.executed[1] == ("SELECT id FROM stock_picking WHERE id=%s", (7,))
+    assert delete_versioned(FakeCursor(0, None), "stock_picking", 7, version) is False